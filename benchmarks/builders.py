@@ -0,0 +1,60 @@
+"""Compares the generated builders with the ObjectWrapper based ones they replaced, over every builder of the schema.
+
+Run from the repository root with: PYTHONPATH=. python benchmarks/builders.py
+"""
+from timeit import timeit
+import json
+import slack_components as sc
+from slack_components.schema import BLOCKS , ELEMENTS , REQUIRED
+
+
+def wrapped(component : sc.schema.Component):
+    """Rebuilds a builder the way they were written by hand: a dict of every argument, filtered by ObjectWrapper."""
+    names = [field.name for field in component.fields]
+    parameters = ", ".join(name if field.default is REQUIRED else f"{name}={field.default!r}" for name , field in zip(names, component.fields))
+    items = ", ".join(f"{name!r} : {name}" for name in (component.order or names))
+    check = f"    if {component.check[0]}: raise RuntimeError({component.check[1]!r})\n" if component.check else ""
+    namespace = {}
+    exec(f"def {component.name}({parameters}):\n{check}    return {{'type' : {component.type!r}, {items}}}", namespace)
+    return sc.ObjectWrapper(namespace[component.name])
+
+
+def arguments(component : sc.schema.Component, models : bool) -> dict:
+    """Every required argument and half of the optional ones, like a typical call.
+    Composition objects are given as models, or as dicts to measure the builders alone."""
+    values = {}
+    for i , field in enumerate(component.fields):
+        if field.default is not REQUIRED and i % 2:
+            continue
+        if field.annotation in (bool, int):
+            values[field.name] = 1 if field.annotation is int else True
+        elif "Object" in str(field.annotation) or field.annotation is object:
+            text = sc.TextObject(type="plain_text", text=field.name)
+            values[field.name] = text if models else text.dict()
+        else:
+            values[field.name] = field.name
+    return values
+
+
+def run(number : int, models : bool):
+    print(f"composition objects given as {'models' if models else 'dicts'}:")
+    total_old , total_new = 0.0 , 0.0
+    for module , components in ((sc.blocks, BLOCKS), (sc.elements, ELEMENTS)):
+        for component in components:
+            new , old , kwargs = getattr(module, component.name) , wrapped(component) , arguments(component, models)
+            assert json.dumps(new(**kwargs)) == json.dumps(old(**kwargs)), component.name
+            t_old = timeit(lambda : old(**kwargs), number=number)
+            t_new = timeit(lambda : new(**kwargs), number=number)
+            total_old += t_old
+            total_new += t_new
+            print(f"{component.name:26} {t_old / number * 1e6:7.2f} us -> {t_new / number * 1e6:7.2f} us")
+    print(f"{'all builders':26} {total_old / number * 1e6:7.2f} us -> {total_new / number * 1e6:7.2f} us ({total_old / total_new:.2f}x)\n")
+
+
+def main(number : int = 20000):
+    run(number, models=False)
+    run(number, models=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Compares the memory held by rendered messages in the dict form and in the packed form.
+
+Run from the repository root with: PYTHONPATH=. python benchmarks/compact_memory.py
+"""
+import sys
+import slack_components as sc
+
+
+def deep_size(value, seen : set) -> int:
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(deep_size(k, seen) + deep_size(v, seen) for k , v in value.items())
+    elif isinstance(value, (list, tuple)):
+        size += sum(deep_size(v, seen) for v in value)
+    return size
+
+
+def message(i : int) -> list:
+    text = lambda t : sc.TextObject(type="plain_text", text=t)
+    return [
+        sc.HeaderBlock(text=text(f"Digest #{i}")),
+        *(
+            sc.SectionBlock(
+                text=sc.TextObject(type="plain_text", text=f"Item {i}-{j} has been updated"),
+                block_id=f"item-{i}-{j}",
+                accessory=sc.Button(text=text("Open"), action_id="open_item", value=f"{i}:{j}"),
+            )
+            for j in range(8)
+        ),
+        sc.Divider(),
+        sc.Actions(elements=[
+            sc.Button(text=text("Approve"), action_id="approve", style="primary", value=str(i)),
+            sc.Button(text=text("Reject"), action_id="reject", style="danger", value=str(i)),
+        ]),
+    ]
+
+
+def main(count : int = 2000):
+    dicts = [message(i) for i in range(count)]
+    packed = [sc.CompactMessage(m) for m in dicts]
+    assert all(p.to_dicts() == d for p , d in zip(packed, dicts))
+    seen = set()
+    dict_bytes = deep_size(dicts, seen) - sys.getsizeof(dicts)
+    seen = set()
+    packed_bytes = sum(deep_size(p, seen) + deep_size(p.blocks, seen) for p in packed)
+    print(f"dict form    : {dict_bytes / count:8.0f} bytes/message")
+    print(f"compact form : {packed_bytes / count:8.0f} bytes/message")
+
+
+if __name__ == "__main__":
+    main()
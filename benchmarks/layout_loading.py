@@ -0,0 +1,56 @@
+"""Compares loading a few hundred layout specs without and with the compiled cache.
+
+Run from the repository root with: PYTHONPATH=. python benchmarks/layout_loading.py
+"""
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+import json
+import slack_components as sc
+
+
+def text(value) -> dict:
+    return {"$component" : "TextObject", "type" : "plain_text", "text" : value}
+
+
+def spec(i : int) -> list:
+    return [
+        {"$component" : "HeaderBlock", "text" : text(f"Announcement #{i}")},
+        *(
+            {
+                "$component" : "SectionBlock",
+                "block_id" : f"row-{j}",
+                "text" : text({"$format" : "{user} - item " + str(j)}),
+                "accessory" : {"$component" : "Button", "text" : text("Open"), "action_id" : f"open_{j}", "value" : {"$slot" : "item_id"}},
+            }
+            for j in range(10)
+        ),
+        {"$component" : "Divider"},
+        {"$component" : "ContextBlock", "elements" : [text("Sent by the announcements bot")]},
+    ]
+
+
+def timed(loader : sc.LayoutLoader, directory : Path) -> float:
+    started = perf_counter()
+    layouts = loader.load_directory(directory)
+    elapsed = perf_counter() - started
+    assert layouts["layout_0"](user="U1", item_id="42")[1]["accessory"]["value"] == "42"
+    return elapsed
+
+
+def main(count : int = 300):
+    with TemporaryDirectory() as tmp:
+        specs = Path(tmp, "specs")
+        specs.mkdir()
+        for i in range(count):
+            (specs / f"layout_{i}.json").write_text(json.dumps(spec(i)))
+        uncached = timed(sc.LayoutLoader(), specs)
+        cold = timed(sc.LayoutLoader(Path(tmp, "cache")), specs)
+        warm = timed(sc.LayoutLoader(Path(tmp, "cache")), specs)
+    print(f"{count} layouts, no cache  : {uncached * 1000:8.1f} ms")
+    print(f"{count} layouts, cold cache: {cold * 1000:8.1f} ms")
+    print(f"{count} layouts, warm cache: {warm * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,4 +3,16 @@
 
 from .blocks import *
 from .commons import *
-from .elements import *
\ No newline at end of file
+from .elements import *
+from .metrics import *
+from .compact import *
+from .persistent import *
+from .lazy import *
+from .parser import *
+from .layouts import *
+from .shared_cache import *
+from .home import *
+from .executor import *
+from .markdown import *
+from .i18n import *
+from .pagination import *
\ No newline at end of file
@@ -1,8 +1,22 @@
-from typing import List , Union , Literal
-from .commons import TextObject , ObjectWrapper
+"""Builders of Slack's layout blocks.
 
-@ObjectWrapper
-def Actions(elements: List, block_id: str = None):
+Generated from the schema in schema.py by schema.write_modules(): edit the schema, not this file.
+"""
+from typing import List
+from pydantic import BaseModel as _BaseModel
+from .commons import TextObject
+from .metrics import instrumentation as _instrumentation
+
+__all__ = [
+    "Actions", "ContextBlock", "Divider", "FileBlock", "HeaderBlock", "ImageBlock", "InputBlock", "SectionBlock",
+    "VideoBlock"
+]
+
+
+def Actions(
+    elements : List,
+    block_id : str = None,
+):
     """A block that is used to hold interactive elements.
 
     Args:
@@ -11,42 +25,62 @@ def Actions(elements: List, block_id: str = None):
                          in each action block.
         block_id (str, optional): A string acting as a unique identifier for a block. Defaults to None.
     """
-    return {
-            "type": "actions",
-            "elements": elements,
-            "block_id" : block_id
-        }
-
-@ObjectWrapper
-def ContextBlock(elements: List, block_id: str = None):
+    _token = _instrumentation.start('Actions') if _instrumentation.enabled else None
+    _res = {'type': 'actions'}
+    if elements is not None:
+        _res['elements'] = elements.dict() if isinstance(elements, _BaseModel) else elements
+    if block_id is not None:
+        _res['block_id'] = block_id.dict() if isinstance(block_id, _BaseModel) else block_id
+    if _token is not None:
+        _instrumentation.record('Actions', _token, _res)
+    return _res
+
+
+def ContextBlock(
+    elements : List,
+    block_id : str = None,
+):
     """Displays message context, which can include both images and text.
 
     Args:
-        elements (List): An array of interactive element objects - buttons, select menus, 
+        elements (List): An array of interactive element objects - buttons, select menus,
                         overflow menus, or date pickers. There is a maximum of 25 elements
                         in each action block.
         block_id (str, optional): A string acting as a unique identifier for a block.
                                   Defaults to None.
     """
-    return {
-            "type": "context",
-            "elements": elements,
-            "block_id" :block_id
-        }
-
-@ObjectWrapper
-def Divider(block_id: str = None):
+    _token = _instrumentation.start('ContextBlock') if _instrumentation.enabled else None
+    _res = {'type': 'context'}
+    if elements is not None:
+        _res['elements'] = elements.dict() if isinstance(elements, _BaseModel) else elements
+    if block_id is not None:
+        _res['block_id'] = block_id.dict() if isinstance(block_id, _BaseModel) else block_id
+    if _token is not None:
+        _instrumentation.record('ContextBlock', _token, _res)
+    return _res
+
+
+def Divider(
+    block_id : str = None,
+):
     """A content divider, like an <hr>, to split up different blocks inside of a message.
     Args:
         block_id (str, optional): A string acting as a unique identifier for a block. Defaults to None.
     """
-    return {
-            "type": "divider",
-            "block_id" : block_id
-        }
+    _token = _instrumentation.start('Divider') if _instrumentation.enabled else None
+    _res = {'type': 'divider'}
+    if block_id is not None:
+        _res['block_id'] = block_id.dict() if isinstance(block_id, _BaseModel) else block_id
+    if _token is not None:
+        _instrumentation.record('Divider', _token, _res)
+    return _res
+
 
-@ObjectWrapper
-def FileBlock(external_id: str, source: str = "remote", block_id: str = None):
+def FileBlock(
+    external_id : str,
+    source : str = 'remote',
+    block_id : str = None,
+):
     """Displays a remote file. You can't add this block to app surfaces directly, but it will show up when retrieving messages that contain remote files.
 
     Args:
@@ -54,29 +88,46 @@ def FileBlock(external_id: str, source: str = "remote", block_id: str = None):
         source (str, optional): At the moment, source will always be remote for a remote file.
         block_id (str, optional): A string acting as a unique identifier for a block. Defaults to None.
     """
-    return {
-            "type": "file",
-            "external_id": external_id,
-            "source": source,
-            "block_id" : block_id
-        }
+    _token = _instrumentation.start('FileBlock') if _instrumentation.enabled else None
+    _res = {'type': 'file'}
+    if external_id is not None:
+        _res['external_id'] = external_id.dict() if isinstance(external_id, _BaseModel) else external_id
+    if source is not None:
+        _res['source'] = source.dict() if isinstance(source, _BaseModel) else source
+    if block_id is not None:
+        _res['block_id'] = block_id.dict() if isinstance(block_id, _BaseModel) else block_id
+    if _token is not None:
+        _instrumentation.record('FileBlock', _token, _res)
+    return _res
 
-@ObjectWrapper
-def HeaderBlock(text : TextObject , block_id: str = None):
-    """A header is a plain-text block that displays in a larger, bold font. Use it to delineate between different groups of content in your app's surfaces.  
+
+def HeaderBlock(
+    text : TextObject,
+    block_id : str = None,
+):
+    """A header is a plain-text block that displays in a larger, bold font. Use it to delineate between different groups of content in your app's surfaces.
 
     Args:
         text (TextObject) : text object to display
         block_id (str, optional): A string acting as a unique identifier for a block. Defaults to None.
     """
-    return {
-            "type": "header",
-            "text" : text.dict(),
-            "block_id" : block_id
-        }
-
-@ObjectWrapper
-def ImageBlock(image_url : str , alt_text : str , title : TextObject = None , block_id : str = None):
+    _token = _instrumentation.start('HeaderBlock') if _instrumentation.enabled else None
+    _res = {'type': 'header'}
+    if text is not None:
+        _res['text'] = text.dict() if isinstance(text, _BaseModel) else text
+    if block_id is not None:
+        _res['block_id'] = block_id.dict() if isinstance(block_id, _BaseModel) else block_id
+    if _token is not None:
+        _instrumentation.record('HeaderBlock', _token, _res)
+    return _res
+
+
+def ImageBlock(
+    image_url : str,
+    alt_text : str,
+    title : TextObject = None,
+    block_id : str = None,
+):
     """A simple image block, designed to make those cat photos really pop.
 
     Args:
@@ -85,16 +136,29 @@ def ImageBlock(image_url : str , alt_text : str , title : TextObject = None , bl
         title (TextObject, optional): title for the image. Defaults to None.
         block_id (str, optional): A string acting as a unique identifier for a block. Defaults to None.
     """
-    return {
-        "type": "image",
-        "image_url": image_url,
-        "alt_text": alt_text,
-        "block_id" : block_id,
-        "title" : title
-        }
-
-@ObjectWrapper
-def InputBlock(label : str , element : object , dispatch_action : bool = False , block_id : str = None , hint : TextObject = None , optional : bool = False):
+    _token = _instrumentation.start('ImageBlock') if _instrumentation.enabled else None
+    _res = {'type': 'image'}
+    if image_url is not None:
+        _res['image_url'] = image_url.dict() if isinstance(image_url, _BaseModel) else image_url
+    if alt_text is not None:
+        _res['alt_text'] = alt_text.dict() if isinstance(alt_text, _BaseModel) else alt_text
+    if block_id is not None:
+        _res['block_id'] = block_id.dict() if isinstance(block_id, _BaseModel) else block_id
+    if title is not None:
+        _res['title'] = title.dict() if isinstance(title, _BaseModel) else title
+    if _token is not None:
+        _instrumentation.record('ImageBlock', _token, _res)
+    return _res
+
+
+def InputBlock(
+    label : str,
+    element : object,
+    dispatch_action : bool = False,
+    block_id : str = None,
+    hint : TextObject = None,
+    optional : bool = False,
+):
     """A block that collects information from users - it can hold a plain-text input element, a checkbox element, a radio button element, a select menu element, a multi-select menu element, or a datepicker.
 
     Args:
@@ -105,45 +169,71 @@ def InputBlock(label : str , element : object , dispatch_action : bool = False ,
         hint (TextObject, optional): An optional hint that appears below an input element in a lighter grey. It must be a text object with a type of plain_text. Maximum length for the text in this field is 2000 characters. Defaults to None.
         optional (bool, optional): A boolean that indicates whether the input element may be empty when a user submits the modal. Defaults to false. Defaults to False.
     """
-    return {
-        "type" : "input",
-        "element": element,
-        "label":label,
-        "dispatch_action" : dispatch_action,
-        "block_id" : block_id,
-        "hint" : hint,
-        "optional" : optional
-    }
-
-@ObjectWrapper
-def SectionBlock(text : TextObject = None , block_id : str = None , fields : List[TextObject] = None, accessory : object = False ) :
-    """A section is one of the most flexible blocks available - it can be used as a simple text block, in combination with text fields, 
+    _token = _instrumentation.start('InputBlock') if _instrumentation.enabled else None
+    _res = {'type': 'input'}
+    if element is not None:
+        _res['element'] = element.dict() if isinstance(element, _BaseModel) else element
+    if label is not None:
+        _res['label'] = label.dict() if isinstance(label, _BaseModel) else label
+    if dispatch_action is not None:
+        _res['dispatch_action'] = dispatch_action
+    if block_id is not None:
+        _res['block_id'] = block_id.dict() if isinstance(block_id, _BaseModel) else block_id
+    if hint is not None:
+        _res['hint'] = hint.dict() if isinstance(hint, _BaseModel) else hint
+    if optional is not None:
+        _res['optional'] = optional
+    if _token is not None:
+        _instrumentation.record('InputBlock', _token, _res)
+    return _res
+
+
+def SectionBlock(
+    text : TextObject = None,
+    block_id : str = None,
+    fields : List[TextObject] = None,
+    accessory : object = None,
+):
+    """A section is one of the most flexible blocks available - it can be used as a simple text block, in combination with text fields,
     or side-by-side with any of the available block elements.
 
     Args:
-        text (TextObject, optional): The text for the block, in the form of a text object. Minimum length for the text in this field is 1 and maximum length is 3000 characters. 
+        text (TextObject, optional): The text for the block, in the form of a text object. Minimum length for the text in this field is 1 and maximum length is 3000 characters.
         This field is not required if a valid array of fields objects is provided instead. Defaults to None.
         block_id (str, optional): _description_. Defaults to None.
         fields (List[TextObject], optional): _description_. Defaults to None.
-        accessory (object, optional): _description_. Defaults to False.
+        accessory (object, optional): _description_. Defaults to None.
     """
     if text is None and fields is None:
         raise RuntimeError('Section Blocks needs a text object or a fields Object , got neither of these')
-    return {
-        "type" : "section",
-        "text" : text,
-        "block_id" : block_id,
-        "fields" : fields,
-        "accessory" : accessory
-    }
-
-@ObjectWrapper
-def VideoBlock( title : TextObject , thumbnail_url : str ,  video_url : str ,
-        alt_text : str , author_name : str = None , block_id : str = None ,
-        description : TextObject = None , provider_icon_url : str = None , 
-        provider_name : str = None ,  title_url : str = None ,
-    ):
-    """A video block is designed to embed videos in all app surfaces (e.g. link unfurls, messages, modals, App Home) — anywhere you can put blocks! 
+    _token = _instrumentation.start('SectionBlock') if _instrumentation.enabled else None
+    _res = {'type': 'section'}
+    if text is not None:
+        _res['text'] = text.dict() if isinstance(text, _BaseModel) else text
+    if block_id is not None:
+        _res['block_id'] = block_id.dict() if isinstance(block_id, _BaseModel) else block_id
+    if fields is not None:
+        _res['fields'] = fields.dict() if isinstance(fields, _BaseModel) else fields
+    if accessory is not None:
+        _res['accessory'] = accessory.dict() if isinstance(accessory, _BaseModel) else accessory
+    if _token is not None:
+        _instrumentation.record('SectionBlock', _token, _res)
+    return _res
+
+
+def VideoBlock(
+    title : TextObject,
+    thumbnail_url : str,
+    video_url : str,
+    alt_text : str,
+    author_name : str = None,
+    block_id : str = None,
+    description : TextObject = None,
+    provider_icon_url : str = None,
+    provider_name : str = None,
+    title_url : str = None,
+):
+    """A video block is designed to embed videos in all app surfaces (e.g. link unfurls, messages, modals, App Home) — anywhere you can put blocks!
     To use the video block within your app, you must have the links.embed:write scope.
 
     Args:
@@ -152,24 +242,36 @@ def VideoBlock( title : TextObject , thumbnail_url : str ,  video_url : str ,
         video_url (str): The URL to be embedded. Must match any existing unfurl domains within the app and point to a HTTPS URL.
         alt_text (str): A tooltip for the video. Required for accessibility
         author_name (str, optional): Author name to be displayed. Must be less than 50 characters. Defaults to None.
-        block_id (str, optional): A string acting as a unique identifier for a block. If not specified, one will be generated. 
-            Maximum length for this field is 255 characters. block_id should be unique for each message and each iteration of a message. 
+        block_id (str, optional): A string acting as a unique identifier for a block. If not specified, one will be generated.
+            Maximum length for this field is 255 characters. block_id should be unique for each message and each iteration of a message.
             If a message is updated, use a new block_id. Defaults to None.
         description (TextObject, optional): Description for video in plain text format. Defaults to None.
         provider_icon_url (str, optional): Icon for the video provider - ex. Youtube icon. Defaults to None.
         provider_name (str, optional): The originating application or domain of the video ex. Youtube. Defaults to None.
         title_url (str, optional): Video title in plain text format. Must be less than 200 characters. Defaults to None.
     """
-    return {
-        "type":"video",
-        "title" : title.dict(),
-        "thumbnail_url" : thumbnail_url,
-        "video_url" : video_url,
-        "alt_text" : alt_text,
-        "author_name" : author_name,
-        "block_id" : block_id,
-        "description" : description,
-        "provider_icon_url" : provider_icon_url,
-        "provider_name" : provider_name,
-        "title_url" : title_url
-    }
\ No newline at end of file
+    _token = _instrumentation.start('VideoBlock') if _instrumentation.enabled else None
+    _res = {'type': 'video'}
+    if title is not None:
+        _res['title'] = title.dict() if isinstance(title, _BaseModel) else title
+    if thumbnail_url is not None:
+        _res['thumbnail_url'] = thumbnail_url.dict() if isinstance(thumbnail_url, _BaseModel) else thumbnail_url
+    if video_url is not None:
+        _res['video_url'] = video_url.dict() if isinstance(video_url, _BaseModel) else video_url
+    if alt_text is not None:
+        _res['alt_text'] = alt_text.dict() if isinstance(alt_text, _BaseModel) else alt_text
+    if author_name is not None:
+        _res['author_name'] = author_name.dict() if isinstance(author_name, _BaseModel) else author_name
+    if block_id is not None:
+        _res['block_id'] = block_id.dict() if isinstance(block_id, _BaseModel) else block_id
+    if description is not None:
+        _res['description'] = description.dict() if isinstance(description, _BaseModel) else description
+    if provider_icon_url is not None:
+        _res['provider_icon_url'] = provider_icon_url.dict() if isinstance(provider_icon_url, _BaseModel) else provider_icon_url
+    if provider_name is not None:
+        _res['provider_name'] = provider_name.dict() if isinstance(provider_name, _BaseModel) else provider_name
+    if title_url is not None:
+        _res['title_url'] = title_url.dict() if isinstance(title_url, _BaseModel) else title_url
+    if _token is not None:
+        _instrumentation.record('VideoBlock', _token, _res)
+    return _res
@@ -1,13 +1,28 @@
-from pydantic import BaseModel
+from pydantic import BaseModel , root_validator
 from typing import Literal , Union , List
 from functools import wraps
+from .metrics import instrumentation
 
 
-class TextObject(BaseModel):
+class _SlackModel(BaseModel):
+    """Base of the composition objects. Their fields are validated when built, so they can not hold thunks."""
+
+    @root_validator(pre=True)
+    def _reject_thunks(cls, values):
+        for name , value in values.items():
+            if callable(value) and not isinstance(value, (type, BaseModel)):
+                raise TypeError(
+                    f"{cls.__name__}.{name} got a callable, models can not be rendered lazily: "
+                    f"pass a thunk returning the whole {cls.__name__} to the builder instead"
+                )
+        return values
+
+
+class TextObject(_SlackModel):
     """An object containing some text, formatted either as plain_text or using mrkdwn, our proprietary 
     contribution to the much beloved Markdown standard."""
 
-    type : Literal["plain_text","mrkdown"]
+    type : Literal["plain_text","mrkdwn"]
     """The formatting to use for this text object. Can be one of plain_textor mrkdwn."""
 
     text : str
@@ -18,25 +33,25 @@ class TextObject(BaseModel):
     """Indicates whether emojis in a text field should be escaped into the colon emoji format. 
     This field is only usable when type is plain_text."""
 
-class OptionObject(BaseModel):
+class OptionObject(_SlackModel):
     """An object that represents a single selectable item in a select menu, multi-select menu, checkbox group, radio button group, or overflow menu."""
     text : TextObject
     """A text object that defines the text shown in the option on the menu."""
     value : str
     """A unique string value that will be passed to your app when this option is chosen"""
-    description : Union[TextObject,None]
+    description : Union[TextObject,None] = None
     """A plain_text only text object that defines a line of descriptive text shown below the text field beside the radio button. """
-    url : str
+    url : Union[str,None] = None
     """A URL to load in the user's browser when the option is clicked."""
 
-class OptionGroupObject(BaseModel):
+class OptionGroupObject(_SlackModel):
     """Provides a way to group options in a select menu or multi-select menu."""
     label : TextObject
     """A plain_text only text object that defines the label shown above this group of options."""
     options : List[OptionObject]
     """An array of option objects that belong to this specific group."""
 
-class ConfirmDialogObject(BaseModel):
+class ConfirmDialogObject(_SlackModel):
     """An object that defines a dialog that provides a confirmation step to any interactive element.
     This dialog will ask the user to confirm their action by offering a confirm and deny buttons."""
     title : TextObject
@@ -50,7 +65,7 @@ class ConfirmDialogObject(BaseModel):
     style : Literal['primary','danger']
     """Defines the color scheme applied to the confirm button."""
 
-class DispatchActionObject(BaseModel):
+class DispatchActionObject(_SlackModel):
     """Determines when a plain-text input element will return a block_actions interaction payload."""
     trigger_action_on : List[Literal['on_enter_pressed','on_character_entered']]
     """An array of interaction types that you would like to receive a block_actions payload for. Should be one or both of:
@@ -60,20 +75,20 @@ class DispatchActionObject(BaseModel):
         
         on_character_entered — payload is dispatched when a character is entered (or removed) in the input."""
 
-class FilterObject(BaseModel):
+class FilterObject(_SlackModel):
     """Provides a way to filter the list of options in a conversations select menu or conversations multi-select menu."""
     include : List[Literal['im','mpim','private','public']]
     """Indicates which type of conversations should be included in the list. 
     When this field is provided, any conversations that do not match will be excluded"""
 
-class InputParameterObject(BaseModel):
+class InputParameterObject(_SlackModel):
     """Contains information about an input parameter."""
     name : str
     """The name of the input parameter."""
     value : str
     """The value of the input parameter."""
 
-class TriggerObject(BaseModel):
+class TriggerObject(_SlackModel):
     """Contains information about a trigger."""
     url : str
     """A link trigger URL. Must be associated with a valid trigger."""
@@ -83,15 +98,18 @@ class TriggerObject(BaseModel):
     the trigger must be set as customizable: true. Each specified value must match the type defined
     by the workflow input parameter of the matching name."""
 
-class WorkFlowObject(BaseModel):
+class WorkFlowObject(_SlackModel):
     """Contains information about a workflow."""
     trigger : TriggerObject
     """A trigger object that contains information about a workflow's trigger."""
 
 def ObjectWrapper(func):
-    """Wrapper function to format data into a valid Slack API Object"""
+    """Wrapper function to format data into a valid Slack API Object.
+    Calls are measured by the shared instrumentation when it is enabled."""
+    name = func.__name__
     @wraps(func)
     def wrap(*args,**kwargs):
+        token = instrumentation.start(name) if instrumentation.enabled else None
         res = func(*args,**kwargs)
         res = {k:v for k,v in res.items() if v is not None}
         for k ,v in res.items():
@@ -99,5 +117,7 @@ def ObjectWrapper(func):
                 res[k] = v.dict()
             except:
                 pass
+        if token is not None:
+            instrumentation.record(name, token, res)
         return res
     return wrap
\ No newline at end of file
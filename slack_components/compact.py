@@ -0,0 +1,145 @@
+from typing import List , Union
+from pydantic import BaseModel
+
+__all__ = ["CompactNode", "CompactMessage", "pack", "unpack"]
+
+_shapes = {}
+"""Interned key tuples, shared by every node with the same keys in the same order."""
+
+_strings = {}
+"""Interned short string values such as types, styles or action ids."""
+
+_INTERN_MAX_LENGTH = 32
+_INTERN_MAX_ENTRIES = 1 << 16
+
+
+class CompactNode(tuple):
+    """A packed Slack object. The first item is the interned tuple of keys, the remaining items are the values.
+    Values can be read with get or as attributes, index and count included: they are the tuple methods only
+    when the node has no such key."""
+
+    __slots__ = ()
+
+    def _tuple_method(name : str):
+        method = getattr(tuple, name)
+        def lookup(self):
+            try:
+                return self[self[0].index(name) + 1]
+            except ValueError:
+                return method.__get__(self)
+        return property(lookup)
+
+    index = _tuple_method("index")
+    count = _tuple_method("count")
+    del _tuple_method
+
+    def keys(self) -> tuple:
+        return self[0]
+
+    def get(self, key : str, default = None):
+        try:
+            return self[self[0].index(key) + 1]
+        except ValueError:
+            return default
+
+    def __getattr__(self, key : str):
+        try:
+            return self[self[0].index(key) + 1]
+        except ValueError:
+            raise AttributeError(key) from None
+
+    def to_dict(self) -> dict:
+        return unpack(self)
+
+
+class CompactMessage:
+    """The blocks of a message, stored as packed nodes.
+
+    Args:
+        blocks (List): blocks in the dict form, as returned by the builders.
+    """
+
+    __slots__ = ("blocks", "_by_id")
+
+    def __init__(self, blocks : List):
+        self.blocks = pack(blocks)
+        self._by_id = None
+
+    def __len__(self):
+        return len(self.blocks)
+
+    def __iter__(self):
+        return iter(self.blocks)
+
+    def find(self, block_id : str) -> Union[CompactNode, None]:
+        """Returns the packed block with the given block_id, or None if there is none."""
+        by_id = self._by_id
+        if by_id is None or by_id[0] is not self.blocks:
+            # built on the first lookup, the first block wins when block_ids repeat
+            index = {}
+            for block in self.blocks:
+                index.setdefault(block.get("block_id"), block)
+            by_id = self._by_id = (self.blocks, index)
+        return by_id[1].get(block_id)
+
+    def get(self, block_id : str, *path, default = None):
+        """Looks a field up in the block with the given block_id.
+
+        Args:
+            block_id (str): block_id of the block to look into.
+            path (str | int): keys and list indices leading to the field, e.g. "accessory", "value".
+            default (optional): value returned when the block or the field does not exist. Defaults to None.
+        """
+        value = self.find(block_id)
+        for step in path:
+            if value is None:
+                return default
+            if isinstance(value, CompactNode):
+                value = value.get(step)
+            else:
+                try:
+                    value = value[step]
+                except (IndexError, TypeError):
+                    return default
+        return default if value is None else value
+
+    def to_dicts(self) -> List[dict]:
+        """Returns the blocks in the dict form."""
+        return unpack(self.blocks)
+
+
+def _intern(value : str) -> str:
+    if len(value) > _INTERN_MAX_LENGTH:
+        return value
+    interned = _strings.get(value)
+    if interned is None:
+        if len(_strings) >= _INTERN_MAX_ENTRIES:
+            return value
+        interned = _strings[value] = value
+    return interned
+
+
+def pack(value):
+    """Converts a Slack object in the dict form (dicts, lists and pydantic models) into its packed form."""
+    if isinstance(value, BaseModel):
+        value = value.dict()
+    if isinstance(value, dict):
+        keys = tuple(value)
+        shape = _shapes.get(keys)
+        if shape is None:
+            shape = _shapes[keys] = tuple(_intern(key) for key in keys)
+        return CompactNode((shape, *(pack(v) for v in value.values())))
+    if isinstance(value, (list, tuple)):
+        return tuple(pack(v) for v in value)
+    if isinstance(value, str):
+        return _intern(value)
+    return value
+
+
+def unpack(value):
+    """Converts a packed Slack object back into the dict form."""
+    if isinstance(value, CompactNode):
+        return {key : unpack(v) for key , v in zip(value[0], value[1:])}
+    if isinstance(value, tuple):
+        return [unpack(v) for v in value]
+    return value
@@ -1,16 +1,32 @@
-from typing import Literal , List
-from .commons import TextObject , ObjectWrapper , OptionObject , ConfirmDialogObject , DispatchActionObject , OptionGroupObject , WorkFlowObject
+"""Builders of Slack's block elements.
+
+Generated from the schema in schema.py by schema.write_modules(): edit the schema, not this file.
+"""
+from typing import List , Literal
+from warnings import warn as _warn
+from pydantic import BaseModel as _BaseModel
+from .commons import ConfirmDialogObject , DispatchActionObject , OptionGroupObject , OptionObject , TextObject , WorkFlowObject
+from .metrics import instrumentation as _instrumentation
+
+__all__ = [
+    "Button", "CheckBoxGroup", "DatePicker", "DateTimePicker", "EmailInput", "Image", "MultiSelectStatic",
+    "MultiSelectExternal", "MultiSelectUsers", "MultiSelectConversations", "MultiSelectChannels", "NumberInput",
+    "OverflowMenu", "PlainTextInput", "RadioButtonGroup", "SelectStatic", "SelectExternal", "SelectUsers",
+    "SelectConversations", "SelectChannels", "TimePicker", "URLInput", "WorkflowButton"
+]
+
 
-@ObjectWrapper
 def Button(
-    text : TextObject, 
-    action_id : str ,
-    url : str = None , 
-    value : str = None , 
-    style : Literal['primary','danger'] = None,
-    confirm : object = None , 
-    acessibility_label : TextObject = None
-) :
+    text : TextObject,
+    action_id : str,
+    url : str = None,
+    value : str = None,
+    style : Literal['primary', 'danger'] = None,
+    confirm : object = None,
+    accessibility_label : TextObject = None,
+    *,
+    acessibility_label : TextObject = None,
+):
     """An interactive component that inserts a button. The button can be a trigger for anything from opening a simple link to starting a complex workflow.
 
     Args:
@@ -18,62 +34,82 @@ def Button(
             text may truncate with ~30 characters. Maximum length for the text in this field is 75 characters.
         action_id (str): An identifier for this action. You can use this when you receive an interaction payload to identify the source of the action.
             Should be unique among all other action_ids in the containing block. Maximum length for this field is 255 characters.
-        url (str, optional): A URL to load in the user's browser when the button is clicked. Maximum length for this field is 3000 characters. 
+        url (str, optional): A URL to load in the user's browser when the button is clicked. Maximum length for this field is 3000 characters.
             If you're using url, you'll still receive an interaction payload and will need to send an acknowledgement response. Defaults to None.
         value (str, optional): The value to send along with the interaction payload. Maximum length for this field is 2000 characters. Defaults to None.
         style (Literal[&#39;primary&#39;,&#39;danger&#39;], optional): Decorates buttons with alternative visual color schemes.
             Use this option with restraint. Defaults to 'default'.
         confirm (object, optional): A confirm object that defines an optional confirmation dialog after the button is clicked. Defaults to None.
-        acessibility_label (TextObject, optional): A label for longer descriptive text about a button element. 
+        accessibility_label (TextObject, optional): A label for longer descriptive text about a button element.
             This label will be read out by screen readers instead of the button text object. Maximum length for this field is 75 characters. Defaults to None.
     """
-    return {
-        "type" : "button",
-        "text": text,
-        "action_id" : action_id,
-        "url" : url,
-        "value" : value,
-        "style" : style,
-        "confirm" : confirm,
-        "acessibility_label" : acessibility_label
-    }
-
-@ObjectWrapper
+    if acessibility_label is not None:
+        _warn('Button(acessibility_label=...) is deprecated, use accessibility_label', DeprecationWarning, stacklevel=2)
+        if accessibility_label is None:
+            accessibility_label = acessibility_label
+    _token = _instrumentation.start('Button') if _instrumentation.enabled else None
+    _res = {'type': 'button'}
+    if text is not None:
+        _res['text'] = text.dict() if isinstance(text, _BaseModel) else text
+    if action_id is not None:
+        _res['action_id'] = action_id.dict() if isinstance(action_id, _BaseModel) else action_id
+    if url is not None:
+        _res['url'] = url.dict() if isinstance(url, _BaseModel) else url
+    if value is not None:
+        _res['value'] = value.dict() if isinstance(value, _BaseModel) else value
+    if style is not None:
+        _res['style'] = style.dict() if isinstance(style, _BaseModel) else style
+    if confirm is not None:
+        _res['confirm'] = confirm.dict() if isinstance(confirm, _BaseModel) else confirm
+    if accessibility_label is not None:
+        _res['accessibility_label'] = accessibility_label.dict() if isinstance(accessibility_label, _BaseModel) else accessibility_label
+    if _token is not None:
+        _instrumentation.record('Button', _token, _res)
+    return _res
+
+
 def CheckBoxGroup(
-    action_id : str , 
-    options : OptionObject , 
+    action_id : str,
+    options : List[OptionObject],
     initial_options : List[OptionObject] = None,
-    confirm : ConfirmDialogObject = None, 
-    focus_on_load : bool = False
+    confirm : ConfirmDialogObject = None,
+    focus_on_load : bool = False,
 ):
     """A checkbox group that allows a user to choose multiple items from a list of possible options.
 
     Args:
         action_id (str): An identifier for the action triggered when the checkbox group is changed.
-        options (OptionObject): An array of option objects. A maximum of 10 options are allowed.
+        options (List[OptionObject]): An array of option objects. A maximum of 10 options are allowed.
         initial_options (List[OptionObject], optional): An array of option objects that exactly matches one or more of
             the options within options. These options will be selected when the checkbox group initially loads.. Defaults to None.
-        confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that appears after 
+        confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that appears after
             clicking one of the checkboxes in this element. Defaults to None.
-        focus_on_load (bool, optional): Indicates whether the element will be set to auto focus within the view object. 
+        focus_on_load (bool, optional): Indicates whether the element will be set to auto focus within the view object.
             Only one element can be set to true. Defaults to False.
     """
-    return {
-        "type":"checkboxes",
-        "action_id" : action_id,
-        "options" : options,
-        "initial_options" : initial_options,
-        "confirm" : confirm,
-        "focus_on_load" : focus_on_load
-    }
-
-@ObjectWrapper
+    _token = _instrumentation.start('CheckBoxGroup') if _instrumentation.enabled else None
+    _res = {'type': 'checkboxes'}
+    if action_id is not None:
+        _res['action_id'] = action_id.dict() if isinstance(action_id, _BaseModel) else action_id
+    if options is not None:
+        _res['options'] = options.dict() if isinstance(options, _BaseModel) else options
+    if initial_options is not None:
+        _res['initial_options'] = initial_options.dict() if isinstance(initial_options, _BaseModel) else initial_options
+    if confirm is not None:
+        _res['confirm'] = confirm.dict() if isinstance(confirm, _BaseModel) else confirm
+    if focus_on_load is not None:
+        _res['focus_on_load'] = focus_on_load
+    if _token is not None:
+        _instrumentation.record('CheckBoxGroup', _token, _res)
+    return _res
+
+
 def DatePicker(
-    action_id : str , 
-    initial_date : str = None ,
-    confirm : ConfirmDialogObject = None , 
-    focus_on_load : bool = False ,
-    placeholder : TextObject = None
+    action_id : str,
+    initial_date : str = None,
+    confirm : ConfirmDialogObject = None,
+    focus_on_load : bool = False,
+    placeholder : TextObject = None,
 ):
     """An element which lets users easily select a date from a calendar style UI.
 
@@ -84,21 +120,28 @@ def DatePicker(
         focus_on_load (bool, optional): Indicates whether the element will be set to auto focus within the view object. Only one element can be set to true. Defaults to False.
         placeholder (TextObject, optional): A plain_text only text object that defines the placeholder text shown on the datepicker. Defaults to None.
     """
-    return {
-        "type" : "datepicker",
-        "action_id" : action_id,
-        "initial_date" : initial_date,
-        "confirm" : confirm,
-        "focus_on_load" : focus_on_load,
-        "placeholder" : placeholder
-    }
-
-@ObjectWrapper
+    _token = _instrumentation.start('DatePicker') if _instrumentation.enabled else None
+    _res = {'type': 'datepicker'}
+    if action_id is not None:
+        _res['action_id'] = action_id.dict() if isinstance(action_id, _BaseModel) else action_id
+    if initial_date is not None:
+        _res['initial_date'] = initial_date.dict() if isinstance(initial_date, _BaseModel) else initial_date
+    if confirm is not None:
+        _res['confirm'] = confirm.dict() if isinstance(confirm, _BaseModel) else confirm
+    if focus_on_load is not None:
+        _res['focus_on_load'] = focus_on_load
+    if placeholder is not None:
+        _res['placeholder'] = placeholder.dict() if isinstance(placeholder, _BaseModel) else placeholder
+    if _token is not None:
+        _instrumentation.record('DatePicker', _token, _res)
+    return _res
+
+
 def DateTimePicker(
-    action_id : str , 
-    initial_date_time : str = None ,
-    confirm : ConfirmDialogObject = None , 
-    focus_on_load : bool = False 
+    action_id : str,
+    initial_date_time : str = None,
+    confirm : ConfirmDialogObject = None,
+    focus_on_load : bool = False,
 ):
     """An element that allows the selection of both a date and a time of day formatted as a Unix timestamp.
 
@@ -109,20 +152,27 @@ def DateTimePicker(
         confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that appears after a date is selected. Defaults to None.
         focus_on_load (bool, optional): Indicates whether the element will be set to auto focus within the view object. Only one element can be set to true. Defaults to False.
     """
-    return {
-        "action_id" : action_id,
-        "initial_date_time" : initial_date_time,
-        "confirm" : confirm,
-        "focus_on_load" : focus_on_load
-    }
-
-@ObjectWrapper
+    _token = _instrumentation.start('DateTimePicker') if _instrumentation.enabled else None
+    _res = {'type': 'datetimepicker'}
+    if action_id is not None:
+        _res['action_id'] = action_id.dict() if isinstance(action_id, _BaseModel) else action_id
+    if initial_date_time is not None:
+        _res['initial_date_time'] = initial_date_time.dict() if isinstance(initial_date_time, _BaseModel) else initial_date_time
+    if confirm is not None:
+        _res['confirm'] = confirm.dict() if isinstance(confirm, _BaseModel) else confirm
+    if focus_on_load is not None:
+        _res['focus_on_load'] = focus_on_load
+    if _token is not None:
+        _instrumentation.record('DateTimePicker', _token, _res)
+    return _res
+
+
 def EmailInput(
-    action_id :  str ,
-    initial_value : str  = None , 
-    dispatch_action_config : DispatchActionObject = None , 
-    focus_on_load : bool = False , 
-    placeholder : TextObject = None
+    action_id : str,
+    initial_value : str = None,
+    dispatch_action_config : DispatchActionObject = None,
+    focus_on_load : bool = False,
+    placeholder : TextObject = None,
 ):
     """Text input dedicated to email
 
@@ -135,31 +185,45 @@ def EmailInput(
             can be set to true. Defaults to False.
         placeholder (TextObject, optional): A plain_text only text object that defines the placeholder text shown in the email input. Defaults to None.
     """
-    return {
-        "type" : "email_text_input",
-        "action_id" : action_id,
-        "initial_value" : initial_value,
-        "dispatch_action_config" : dispatch_action_config,
-        "focus_on_load" : focus_on_load,
-        "placeholder" : placeholder
-    }
-
-@ObjectWrapper
-def Image(image_url : str , alt_text : str):
-    """An element to insert an image as part of a larger block of content. 
+    _token = _instrumentation.start('EmailInput') if _instrumentation.enabled else None
+    _res = {'type': 'email_text_input'}
+    if action_id is not None:
+        _res['action_id'] = action_id.dict() if isinstance(action_id, _BaseModel) else action_id
+    if initial_value is not None:
+        _res['initial_value'] = initial_value.dict() if isinstance(initial_value, _BaseModel) else initial_value
+    if dispatch_action_config is not None:
+        _res['dispatch_action_config'] = dispatch_action_config.dict() if isinstance(dispatch_action_config, _BaseModel) else dispatch_action_config
+    if focus_on_load is not None:
+        _res['focus_on_load'] = focus_on_load
+    if placeholder is not None:
+        _res['placeholder'] = placeholder.dict() if isinstance(placeholder, _BaseModel) else placeholder
+    if _token is not None:
+        _instrumentation.record('EmailInput', _token, _res)
+    return _res
+
+
+def Image(
+    image_url : str,
+    alt_text : str,
+):
+    """An element to insert an image as part of a larger block of content.
     If you want a block with only an image in it, you're looking for the image block.
 
     Args:
         image_url (str): The URL of the image to be displayed.
         alt_text (str): A plain-text summary of the image. This should not contain any markup.
     """
-    return {
-        "type" : "image",
-        "image_url" : image_url,
-        "alt_text" : alt_text
-    }
+    _token = _instrumentation.start('Image') if _instrumentation.enabled else None
+    _res = {'type': 'image'}
+    if image_url is not None:
+        _res['image_url'] = image_url.dict() if isinstance(image_url, _BaseModel) else image_url
+    if alt_text is not None:
+        _res['alt_text'] = alt_text.dict() if isinstance(alt_text, _BaseModel) else alt_text
+    if _token is not None:
+        _instrumentation.record('Image', _token, _res)
+    return _res
+
 
-@ObjectWrapper
 def MultiSelectStatic(
     action_id : str,
     options : List[OptionObject],
@@ -168,101 +232,128 @@ def MultiSelectStatic(
     confirm : ConfirmDialogObject = None,
     max_selected_items : int = None,
     focus_on_load : bool = False,
-    placeholder : TextObject = None
+    placeholder : TextObject = None,
 ):
     """This is the simplest form of select menu, with a static list of options passed in when defining the element.
 
     Args:
-        action_id (str): An identifier for the action triggered when a menu option is selected. 
-        options (List[OptionObject]): An array of option objects. 
+        action_id (str): An identifier for the action triggered when a menu option is selected.
+        options (List[OptionObject]): An array of option objects.
         option_groups (List[OptionGroupObject], optional): An array of option group objects. Defaults to None.
-        initial_options (List[OptionObject], optional): An array of option objects that exactly match one or more of 
+        initial_options (List[OptionObject], optional): An array of option objects that exactly match one or more of
             the options within options or option_groups. Defaults to None.
         confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that appears before the multi-select choices are submitted. Defaults to None.
         max_selected_items (int, optional): Specifies the maximum number of items that can be selected in the menu. Minimum number is 1. Defaults to None.
         focus_on_load (bool, optional): Indicates whether the element will be set to auto focus within the view object. Only one element can be set to true. Defaults to false. Defaults to False.
         placeholder (TextObject, optional): A plain_text only text object that defines the placeholder text shown on the menu. Defaults to None.
     """
-    return {
-        "type": "multi_static_select",
-        "action_id" : action_id,
-        "options" : options , 
-        "option_groups" : option_groups , 
-        "initial_options" : initial_options,
-        "confirm" : confirm,
-        "max_selected_items" : max_selected_items,
-        "focus_on_load" : focus_on_load,
-        "placeholder" : placeholder
-    }
-
-@ObjectWrapper
+    _token = _instrumentation.start('MultiSelectStatic') if _instrumentation.enabled else None
+    _res = {'type': 'multi_static_select'}
+    if action_id is not None:
+        _res['action_id'] = action_id.dict() if isinstance(action_id, _BaseModel) else action_id
+    if options is not None:
+        _res['options'] = options.dict() if isinstance(options, _BaseModel) else options
+    if option_groups is not None:
+        _res['option_groups'] = option_groups.dict() if isinstance(option_groups, _BaseModel) else option_groups
+    if initial_options is not None:
+        _res['initial_options'] = initial_options.dict() if isinstance(initial_options, _BaseModel) else initial_options
+    if confirm is not None:
+        _res['confirm'] = confirm.dict() if isinstance(confirm, _BaseModel) else confirm
+    if max_selected_items is not None:
+        _res['max_selected_items'] = max_selected_items
+    if focus_on_load is not None:
+        _res['focus_on_load'] = focus_on_load
+    if placeholder is not None:
+        _res['placeholder'] = placeholder.dict() if isinstance(placeholder, _BaseModel) else placeholder
+    if _token is not None:
+        _instrumentation.record('MultiSelectStatic', _token, _res)
+    return _res
+
+
 def MultiSelectExternal(
     action_id : str,
-    min_query_length :int,
+    min_query_length : int,
     initial_options : List[OptionObject] = None,
     confirm : ConfirmDialogObject = None,
     max_selected_items : int = None,
     focus_on_load : bool = False,
-    placeholder : TextObject = None
+    placeholder : TextObject = None,
 ):
     """This menu will load its options from an external data source, allowing for a dynamic list of options.
 
     Args:
-        action_id (str): An identifier for the action triggered when a menu option is selected. 
+        action_id (str): An identifier for the action triggered when a menu option is selected.
         min_query_length (int): When the typeahead field is used, a request will be sent on every character change.
             If you prefer fewer requests or more fully ideated queries, use the min_query_length attribute to tell Slack
             the fewest number of typed characters required before dispatch. The default value is 3.
-        initial_options (List[OptionObject], optional): An array of option objects that exactly match one or more of 
+        initial_options (List[OptionObject], optional): An array of option objects that exactly match one or more of
             the options within options or option_groups. Defaults to None.
-        confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that appears before the 
+        confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that appears before the
             multi-select choices are submitted. Defaults to None.
-        max_selected_items (int, optional): Specifies the maximum number of items that can be selected in the menu. 
+        max_selected_items (int, optional): Specifies the maximum number of items that can be selected in the menu.
             Minimum number is 1. Defaults to None.
-        focus_on_load (bool, optional): Indicates whether the element will be set to auto focus within the view object. 
+        focus_on_load (bool, optional): Indicates whether the element will be set to auto focus within the view object.
             Only one element can be set to true. Defaults to false. Defaults to False.
         placeholder (TextObject, optional): A plain_text only text object that defines the placeholder text shown on the menu. Defaults to None.
     """
-    return {
-        "type": "multi_external_select",
-        "action_id" : action_id,
-        "min_query_length" : min_query_length ,
-        "initial_options" : initial_options,
-        "confirm" : confirm,
-        "max_selected_items" : max_selected_items,
-        "focus_on_load" : focus_on_load,
-        "placeholder" : placeholder
-    }
-
-@ObjectWrapper
+    _token = _instrumentation.start('MultiSelectExternal') if _instrumentation.enabled else None
+    _res = {'type': 'multi_external_select'}
+    if action_id is not None:
+        _res['action_id'] = action_id.dict() if isinstance(action_id, _BaseModel) else action_id
+    if min_query_length is not None:
+        _res['min_query_length'] = min_query_length
+    if initial_options is not None:
+        _res['initial_options'] = initial_options.dict() if isinstance(initial_options, _BaseModel) else initial_options
+    if confirm is not None:
+        _res['confirm'] = confirm.dict() if isinstance(confirm, _BaseModel) else confirm
+    if max_selected_items is not None:
+        _res['max_selected_items'] = max_selected_items
+    if focus_on_load is not None:
+        _res['focus_on_load'] = focus_on_load
+    if placeholder is not None:
+        _res['placeholder'] = placeholder.dict() if isinstance(placeholder, _BaseModel) else placeholder
+    if _token is not None:
+        _instrumentation.record('MultiSelectExternal', _token, _res)
+    return _res
+
+
 def MultiSelectUsers(
     action_id : str,
     initial_users : List[str] = None,
     confirm : ConfirmDialogObject = None,
     max_selected_items : int = None,
     focus_on_load : bool = False,
-    placeholder : TextObject = None
+    placeholder : TextObject = None,
 ):
     """This multi-select menu will populate its options with a list of Slack users visible to the current user in the active workspace.
 
     Args:
-        action_id (str): An identifier for the action triggered when a menu option is selected. 
+        action_id (str): An identifier for the action triggered when a menu option is selected.
         initial_users (List[str], optional): An array of user IDs of any valid users to be pre-selected when the menu loads. Defaults to None.
         confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that appears before the multi-select choices are submitted. Defaults to None.
         max_selected_items (int, optional): Specifies the maximum number of items that can be selected in the menu. Minimum number is 1. Defaults to None.
         focus_on_load (bool, optional): Indicates whether the element will be set to auto focus within the view object. Only one element can be set to true. Defaults to false. Defaults to False.
         placeholder (TextObject, optional): A plain_text only text object that defines the placeholder text shown on the menu. Defaults to None.
     """
-    return {
-        "type": "multi_users_select",
-        "action_id" : action_id,
-        "initial_users" : initial_users,
-        "confirm" : confirm,
-        "max_selected_items" : max_selected_items,
-        "focus_on_load" : focus_on_load,
-        "placeholder" : placeholder
-    }
-
-@ObjectWrapper
+    _token = _instrumentation.start('MultiSelectUsers') if _instrumentation.enabled else None
+    _res = {'type': 'multi_users_select'}
+    if action_id is not None:
+        _res['action_id'] = action_id.dict() if isinstance(action_id, _BaseModel) else action_id
+    if initial_users is not None:
+        _res['initial_users'] = initial_users.dict() if isinstance(initial_users, _BaseModel) else initial_users
+    if confirm is not None:
+        _res['confirm'] = confirm.dict() if isinstance(confirm, _BaseModel) else confirm
+    if max_selected_items is not None:
+        _res['max_selected_items'] = max_selected_items
+    if focus_on_load is not None:
+        _res['focus_on_load'] = focus_on_load
+    if placeholder is not None:
+        _res['placeholder'] = placeholder.dict() if isinstance(placeholder, _BaseModel) else placeholder
+    if _token is not None:
+        _instrumentation.record('MultiSelectUsers', _token, _res)
+    return _res
+
+
 def MultiSelectConversations(
     action_id : str,
     initial_conversations : List[str] = None,
@@ -270,73 +361,88 @@ def MultiSelectConversations(
     confirm : ConfirmDialogObject = None,
     max_selected_items : int = None,
     focus_on_load : bool = False,
-    placeholder : TextObject = None
+    placeholder : TextObject = None,
 ):
     """This multi-select menu will populate its options with a list of public and private channels, DMs, and MPIMs visible to the current user in the active workspace.
 
     Args:
-        action_id (str): An identifier for the action triggered when a menu option is selected. 
-        initial_conversations (List[str]): An array of one or more IDs of any valid conversations to be pre-selected when the menu loads. 
-            If default_to_current_conversation is also supplied, initial_conversations will be ignored. 
-        default_to_current_conversation (bool, optional): Pre-populates the select menu with the conversation that the user was viewing when they opened the modal, 
+        action_id (str): An identifier for the action triggered when a menu option is selected.
+        initial_conversations (List[str], optional): An array of one or more IDs of any valid conversations to be pre-selected when the menu loads.
+            If default_to_current_conversation is also supplied, initial_conversations will be ignored. Defaults to None.
+        default_to_current_conversation (bool, optional): Pre-populates the select menu with the conversation that the user was viewing when they opened the modal,
             if available. Defaults to False.
-        initial_options (List[OptionObject], optional): An array of option objects that exactly match one or more of 
-            the options within options or option_groups. Defaults to None.
         confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that appears before the multi-select choices are submitted. Defaults to None.
         max_selected_items (int, optional): Specifies the maximum number of items that can be selected in the menu. Minimum number is 1. Defaults to None.
         focus_on_load (bool, optional): Indicates whether the element will be set to auto focus within the view object. Only one element can be set to true. Defaults to false. Defaults to False.
         placeholder (TextObject, optional): A plain_text only text object that defines the placeholder text shown on the menu. Defaults to None.
     """
-    return {
-        "type": "multi_conversations_select",
-        "action_id" : action_id,
-        "initial_conversations" : initial_conversations,
-        "default_to_current_conversation" : default_to_current_conversation,
-        "confirm" : confirm,
-        "max_selected_items" : max_selected_items,
-        "focus_on_load" : focus_on_load,
-        "placeholder" : placeholder
-    }
-
-@ObjectWrapper
+    _token = _instrumentation.start('MultiSelectConversations') if _instrumentation.enabled else None
+    _res = {'type': 'multi_conversations_select'}
+    if action_id is not None:
+        _res['action_id'] = action_id.dict() if isinstance(action_id, _BaseModel) else action_id
+    if initial_conversations is not None:
+        _res['initial_conversations'] = initial_conversations.dict() if isinstance(initial_conversations, _BaseModel) else initial_conversations
+    if default_to_current_conversation is not None:
+        _res['default_to_current_conversation'] = default_to_current_conversation
+    if confirm is not None:
+        _res['confirm'] = confirm.dict() if isinstance(confirm, _BaseModel) else confirm
+    if max_selected_items is not None:
+        _res['max_selected_items'] = max_selected_items
+    if focus_on_load is not None:
+        _res['focus_on_load'] = focus_on_load
+    if placeholder is not None:
+        _res['placeholder'] = placeholder.dict() if isinstance(placeholder, _BaseModel) else placeholder
+    if _token is not None:
+        _instrumentation.record('MultiSelectConversations', _token, _res)
+    return _res
+
+
 def MultiSelectChannels(
     action_id : str,
     initial_channels : List[str] = None,
     confirm : ConfirmDialogObject = None,
     max_selected_items : int = None,
     focus_on_load : bool = False,
-    placeholder : TextObject = None
+    placeholder : TextObject = None,
 ):
     """This multi-select menu will populate its options with a list of public channels visible to the current user in the active workspace.
 
     Args:
-        action_id (str): An identifier for the action triggered when a menu option is selected. 
+        action_id (str): An identifier for the action triggered when a menu option is selected.
         initial_channels (List[str], optional): An array of one or more IDs of any valid public channel to be pre-selected when the menu loads. Defaults to None.
         confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that appears before the multi-select choices are submitted. Defaults to None.
         max_selected_items (int, optional): Specifies the maximum number of items that can be selected in the menu. Minimum number is 1. Defaults to None.
         focus_on_load (bool, optional): Indicates whether the element will be set to auto focus within the view object. Only one element can be set to true. Defaults to false. Defaults to False.
         placeholder (TextObject, optional): A plain_text only text object that defines the placeholder text shown on the menu. Defaults to None.
     """
-    return {
-        "type": "multi_static_select",
-        "action_id" : action_id,
-        "initial_channels" : initial_channels,
-        "confirm" : confirm,
-        "max_selected_items" : max_selected_items,
-        "focus_on_load" : focus_on_load,
-        "placeholder" : placeholder
-    }
-
-@ObjectWrapper
+    _token = _instrumentation.start('MultiSelectChannels') if _instrumentation.enabled else None
+    _res = {'type': 'multi_channels_select'}
+    if action_id is not None:
+        _res['action_id'] = action_id.dict() if isinstance(action_id, _BaseModel) else action_id
+    if initial_channels is not None:
+        _res['initial_channels'] = initial_channels.dict() if isinstance(initial_channels, _BaseModel) else initial_channels
+    if confirm is not None:
+        _res['confirm'] = confirm.dict() if isinstance(confirm, _BaseModel) else confirm
+    if max_selected_items is not None:
+        _res['max_selected_items'] = max_selected_items
+    if focus_on_load is not None:
+        _res['focus_on_load'] = focus_on_load
+    if placeholder is not None:
+        _res['placeholder'] = placeholder.dict() if isinstance(placeholder, _BaseModel) else placeholder
+    if _token is not None:
+        _instrumentation.record('MultiSelectChannels', _token, _res)
+    return _res
+
+
 def NumberInput(
-    action_id : str ,
+    action_id : str,
     is_decimal_allowed : bool = True,
     initial_value : str = None,
     min_value : str = None,
     max_value : str = None,
-    dispatch_action_config : DispatchActionObject = None, 
+    dispatch_action_config : DispatchActionObject = None,
     focus_on_load : bool = False,
-    placeholder : TextObject = None
+    placeholder : TextObject = None,
 ):
     """This input elements accepts both whole and decimal numbers.
 
@@ -346,54 +452,69 @@ def NumberInput(
         initial_value (str, optional): The initial value in the plain-text input when it is loaded. Defaults to None.
         min_value (str, optional): minimum value. Defaults to None.
         max_value (str, optional): maximum value. Defaults to None.
-        dispatch_action_config (DispatchActionObject, optional): A dispatch configuration object that determines when during 
+        dispatch_action_config (DispatchActionObject, optional): A dispatch configuration object that determines when during
             text input the element returns a block_actions payload. Defaults to None.
         focus_on_load (bool, optional): Indicates whether the element will be set to auto focus within the view object. Defaults to False.
         placeholder (TextObject, optional):A plain_text only text object that defines the placeholder text shown in the number input. Defaults to None.
     """
-    return {
-        "type" : "number_input",
-        "action_id" : action_id,
-        "is_decimal_allowed" : is_decimal_allowed,
-        "initial_value" : initial_value,
-        "min_value" : min_value,
-        "max_value" :max_value,
-        "dispatch_action_config" : dispatch_action_config,
-        "focus_on_load" : focus_on_load,
-        "placeholder" : placeholder
-    }
-
-@ObjectWrapper
+    _token = _instrumentation.start('NumberInput') if _instrumentation.enabled else None
+    _res = {'type': 'number_input'}
+    if action_id is not None:
+        _res['action_id'] = action_id.dict() if isinstance(action_id, _BaseModel) else action_id
+    if is_decimal_allowed is not None:
+        _res['is_decimal_allowed'] = is_decimal_allowed
+    if initial_value is not None:
+        _res['initial_value'] = initial_value.dict() if isinstance(initial_value, _BaseModel) else initial_value
+    if min_value is not None:
+        _res['min_value'] = min_value.dict() if isinstance(min_value, _BaseModel) else min_value
+    if max_value is not None:
+        _res['max_value'] = max_value.dict() if isinstance(max_value, _BaseModel) else max_value
+    if dispatch_action_config is not None:
+        _res['dispatch_action_config'] = dispatch_action_config.dict() if isinstance(dispatch_action_config, _BaseModel) else dispatch_action_config
+    if focus_on_load is not None:
+        _res['focus_on_load'] = focus_on_load
+    if placeholder is not None:
+        _res['placeholder'] = placeholder.dict() if isinstance(placeholder, _BaseModel) else placeholder
+    if _token is not None:
+        _instrumentation.record('NumberInput', _token, _res)
+    return _res
+
+
 def OverflowMenu(
-    action_id : str, 
+    action_id : str,
     options : List[OptionObject],
-    confirm : ConfirmDialogObject = None
+    confirm : ConfirmDialogObject = None,
 ):
     """when a user clicks on this overflow button, they will be presented with a list of options to choose from
 
     Args:
         action_id (str): An identifier for the action triggered when a menu option is selected
         options (List[OptionObject]): An array of up to five option objects to display in the menu.
-        confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that 
+        confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that
             appears after a menu item is selected. Defaults to None.
     """
-    return {
-        "type" : "overflow",
-        "action_id" : action_id,
-        "options" : options,
-        "confirm" : confirm
-    }
-
-@ObjectWrapper
+    _token = _instrumentation.start('OverflowMenu') if _instrumentation.enabled else None
+    _res = {'type': 'overflow'}
+    if action_id is not None:
+        _res['action_id'] = action_id.dict() if isinstance(action_id, _BaseModel) else action_id
+    if options is not None:
+        _res['options'] = options.dict() if isinstance(options, _BaseModel) else options
+    if confirm is not None:
+        _res['confirm'] = confirm.dict() if isinstance(confirm, _BaseModel) else confirm
+    if _token is not None:
+        _instrumentation.record('OverflowMenu', _token, _res)
+    return _res
+
+
 def PlainTextInput(
-    action_id : str ,
+    action_id : str,
     initial_value : str = None,
     multiline : bool = False,
     min_length : int = None,
-    max_length : int = None ,
+    max_length : int = None,
     dispatch_action_config : DispatchActionObject = None,
-    focus_on_load : bool = False, 
-    placeholder : TextObject = None
+    focus_on_load : bool = False,
+    placeholder : TextObject = None,
 ):
     """A plain-text input, similar to the HTML input tag, creates a field where a user can enter freeform data.
 
@@ -403,43 +524,66 @@ def PlainTextInput(
         multiline (bool, optional): whether user can write multiple lines. Defaults to False.
         min_length (int, optional): minimum length for valid text. Defaults to None.
         max_length (int, optional): maximum length for valid text. Defaults to None.
-        dispatch_action_config (DispatchActionObject, optional): A dispatch configuration object that determines 
+        dispatch_action_config (DispatchActionObject, optional): A dispatch configuration object that determines
             when during text input the element returns a block_actions payload.. Defaults to None.
         focus_on_load (bool, optional): whether input should be focused on entering. Defaults to False.
-        placeholder (TextObject, optional): A plain_text only text object that defines the placeholder 
+        placeholder (TextObject, optional): A plain_text only text object that defines the placeholder
             text shown in the plain-text input. Defaults to None.
     """
-    return {
-        "type":"plain_text_input",
-        "action_id" : action_id,
-        "initial_value" :initial_value,
-        "multiline" : multiline,
-        "min_length" : min_length,
-        "max_length" : max_length,
-        "dispatch_action_config" : dispatch_action_config,
-        "focus_on_load" : focus_on_load,
-        "placeholder" : placeholder
-    }
-
-@ObjectWrapper
+    _token = _instrumentation.start('PlainTextInput') if _instrumentation.enabled else None
+    _res = {'type': 'plain_text_input'}
+    if action_id is not None:
+        _res['action_id'] = action_id.dict() if isinstance(action_id, _BaseModel) else action_id
+    if initial_value is not None:
+        _res['initial_value'] = initial_value.dict() if isinstance(initial_value, _BaseModel) else initial_value
+    if multiline is not None:
+        _res['multiline'] = multiline
+    if min_length is not None:
+        _res['min_length'] = min_length
+    if max_length is not None:
+        _res['max_length'] = max_length
+    if dispatch_action_config is not None:
+        _res['dispatch_action_config'] = dispatch_action_config.dict() if isinstance(dispatch_action_config, _BaseModel) else dispatch_action_config
+    if focus_on_load is not None:
+        _res['focus_on_load'] = focus_on_load
+    if placeholder is not None:
+        _res['placeholder'] = placeholder.dict() if isinstance(placeholder, _BaseModel) else placeholder
+    if _token is not None:
+        _instrumentation.record('PlainTextInput', _token, _res)
+    return _res
+
+
 def RadioButtonGroup(
-    action_id : str ,
+    action_id : str,
     options : List[OptionObject],
-    initial_options : OptionObject,
-    confirm : ConfirmDialogObject,
-    focus_on_load : bool
+    initial_option : OptionObject = None,
+    confirm : ConfirmDialogObject = None,
+    focus_on_load : bool = False,
+    *,
+    initial_options : OptionObject = None,
 ):
-    """ Visit https://api.slack.com/reference/block-kit/block-elements#radio for more details"""
-    return {
-        "type":"radio_buttons",
-        "action_id" : action_id,
-        "options" : options,
-        "initial_options" : initial_options,
-        "confirm" : confirm,
-        "focus_on_load" : focus_on_load
-    }
-
-@ObjectWrapper
+    """Visit https://api.slack.com/reference/block-kit/block-elements#radio for more details"""
+    if initial_options is not None:
+        _warn('RadioButtonGroup(initial_options=...) is deprecated, use initial_option', DeprecationWarning, stacklevel=2)
+        if initial_option is None:
+            initial_option = initial_options
+    _token = _instrumentation.start('RadioButtonGroup') if _instrumentation.enabled else None
+    _res = {'type': 'radio_buttons'}
+    if action_id is not None:
+        _res['action_id'] = action_id.dict() if isinstance(action_id, _BaseModel) else action_id
+    if options is not None:
+        _res['options'] = options.dict() if isinstance(options, _BaseModel) else options
+    if initial_option is not None:
+        _res['initial_option'] = initial_option.dict() if isinstance(initial_option, _BaseModel) else initial_option
+    if confirm is not None:
+        _res['confirm'] = confirm.dict() if isinstance(confirm, _BaseModel) else confirm
+    if focus_on_load is not None:
+        _res['focus_on_load'] = focus_on_load
+    if _token is not None:
+        _instrumentation.record('RadioButtonGroup', _token, _res)
+    return _res
+
+
 def SelectStatic(
     action_id : str,
     options : List[OptionObject],
@@ -447,199 +591,257 @@ def SelectStatic(
     initial_option : OptionObject = None,
     confirm : ConfirmDialogObject = None,
     focus_on_load : bool = False,
-    placeholder : TextObject = None
+    placeholder : TextObject = None,
 ):
     """This is the simplest form of select menu, with a static list of options passed in when defining the element.
 
     Args:
-        action_id (str): An identifier for the action triggered when a menu option is selected. 
-        options (List[OptionObject]): An array of option objects. 
+        action_id (str): An identifier for the action triggered when a menu option is selected.
+        options (List[OptionObject]): An array of option objects.
         option_groups (List[OptionGroupObject], optional): An array of option group objects. Defaults to None.
-        initial_option (OptionObject, optional): option object that exactly match one or more of 
-            the options within options or option_groups. Defaults to None.
-        confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that appears before the multi-select choices are submitted. Defaults to None.
+        initial_option (OptionObject, optional): An option object that exactly matches one of the options within options or option_groups.
+            It will be selected when the menu initially loads. Defaults to None.
+        confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that appears after a menu item is selected. Defaults to None.
         focus_on_load (bool, optional): Indicates whether the element will be set to auto focus within the view object. Only one element can be set to true. Defaults to false. Defaults to False.
         placeholder (TextObject, optional): A plain_text only text object that defines the placeholder text shown on the menu. Defaults to None.
     """
-    return {
-        "type": "multi_static_select",
-        "action_id" : action_id,
-        "options" : options , 
-        "option_groups" : option_groups , 
-        "initial_option" : initial_option,
-        "confirm" : confirm,
-        "focus_on_load" : focus_on_load,
-        "placeholder" : placeholder
-    }
-
-@ObjectWrapper
+    _token = _instrumentation.start('SelectStatic') if _instrumentation.enabled else None
+    _res = {'type': 'static_select'}
+    if action_id is not None:
+        _res['action_id'] = action_id.dict() if isinstance(action_id, _BaseModel) else action_id
+    if options is not None:
+        _res['options'] = options.dict() if isinstance(options, _BaseModel) else options
+    if option_groups is not None:
+        _res['option_groups'] = option_groups.dict() if isinstance(option_groups, _BaseModel) else option_groups
+    if initial_option is not None:
+        _res['initial_option'] = initial_option.dict() if isinstance(initial_option, _BaseModel) else initial_option
+    if confirm is not None:
+        _res['confirm'] = confirm.dict() if isinstance(confirm, _BaseModel) else confirm
+    if focus_on_load is not None:
+        _res['focus_on_load'] = focus_on_load
+    if placeholder is not None:
+        _res['placeholder'] = placeholder.dict() if isinstance(placeholder, _BaseModel) else placeholder
+    if _token is not None:
+        _instrumentation.record('SelectStatic', _token, _res)
+    return _res
+
+
 def SelectExternal(
     action_id : str,
-    min_query_length :int,
+    min_query_length : int,
     initial_option : OptionObject = None,
     confirm : ConfirmDialogObject = None,
     focus_on_load : bool = False,
-    placeholder : TextObject = None
+    placeholder : TextObject = None,
 ):
     """This menu will load its options from an external data source, allowing for a dynamic list of options.
 
     Args:
-        action_id (str): An identifier for the action triggered when a menu option is selected. 
+        action_id (str): An identifier for the action triggered when a menu option is selected.
         min_query_length (int): When the typeahead field is used, a request will be sent on every character change.
             If you prefer fewer requests or more fully ideated queries, use the min_query_length attribute to tell Slack
             the fewest number of typed characters required before dispatch. The default value is 3.
-        initial_option (OptionObject, optional): option object that exactly match one or more of 
-            the options within options or option_groups. Defaults to None.
-        confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that appears before the 
-            multi-select choices are submitted. Defaults to None.
-        focus_on_load (bool, optional): Indicates whether the element will be set to auto focus within the view object. 
+        initial_option (OptionObject, optional): An option object that exactly matches one of the options within options or option_groups.
+            It will be selected when the menu initially loads. Defaults to None.
+        confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that appears after a menu item is selected. Defaults to None.
+        focus_on_load (bool, optional): Indicates whether the element will be set to auto focus within the view object.
             Only one element can be set to true. Defaults to false. Defaults to False.
         placeholder (TextObject, optional): A plain_text only text object that defines the placeholder text shown on the menu. Defaults to None.
     """
-    return {
-        "type": "multi_external_select",
-        "action_id" : action_id,
-        "min_query_length" : min_query_length ,
-        "initial_option" : initial_option,
-        "confirm" : confirm,
-        "focus_on_load" : focus_on_load,
-        "placeholder" : placeholder
-    }
-
-@ObjectWrapper
+    _token = _instrumentation.start('SelectExternal') if _instrumentation.enabled else None
+    _res = {'type': 'external_select'}
+    if action_id is not None:
+        _res['action_id'] = action_id.dict() if isinstance(action_id, _BaseModel) else action_id
+    if min_query_length is not None:
+        _res['min_query_length'] = min_query_length
+    if initial_option is not None:
+        _res['initial_option'] = initial_option.dict() if isinstance(initial_option, _BaseModel) else initial_option
+    if confirm is not None:
+        _res['confirm'] = confirm.dict() if isinstance(confirm, _BaseModel) else confirm
+    if focus_on_load is not None:
+        _res['focus_on_load'] = focus_on_load
+    if placeholder is not None:
+        _res['placeholder'] = placeholder.dict() if isinstance(placeholder, _BaseModel) else placeholder
+    if _token is not None:
+        _instrumentation.record('SelectExternal', _token, _res)
+    return _res
+
+
 def SelectUsers(
     action_id : str,
     initial_user : str = None,
     confirm : ConfirmDialogObject = None,
     focus_on_load : bool = False,
-    placeholder : TextObject = None
+    placeholder : TextObject = None,
 ):
-    """This multi-select menu will populate its options with a list of Slack users visible to the current user in the active workspace.
+    """This select menu will populate its options with a list of Slack users visible to the current user in the active workspace.
 
     Args:
-        action_id (str): An identifier for the action triggered when a menu option is selected. 
+        action_id (str): An identifier for the action triggered when a menu option is selected.
         initial_user (str, optional): user ID of any valid users to be pre-selected when the menu loads. Defaults to None.
-        confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that appears before the multi-select choices are submitted. Defaults to None.
-        max_selected_items (int, optional): Specifies the maximum number of items that can be selected in the menu. Minimum number is 1. Defaults to None.
+        confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that appears after a menu item is selected. Defaults to None.
         focus_on_load (bool, optional): Indicates whether the element will be set to auto focus within the view object. Only one element can be set to true. Defaults to false. Defaults to False.
         placeholder (TextObject, optional): A plain_text only text object that defines the placeholder text shown on the menu. Defaults to None.
     """
-    return {
-        "type": "multi_users_select",
-        "action_id" : action_id,
-        "initial_users" : initial_user,
-        "confirm" : confirm,
-        "focus_on_load" : focus_on_load,
-        "placeholder" : placeholder
-    }
-
-@ObjectWrapper
+    _token = _instrumentation.start('SelectUsers') if _instrumentation.enabled else None
+    _res = {'type': 'users_select'}
+    if action_id is not None:
+        _res['action_id'] = action_id.dict() if isinstance(action_id, _BaseModel) else action_id
+    if initial_user is not None:
+        _res['initial_user'] = initial_user.dict() if isinstance(initial_user, _BaseModel) else initial_user
+    if confirm is not None:
+        _res['confirm'] = confirm.dict() if isinstance(confirm, _BaseModel) else confirm
+    if focus_on_load is not None:
+        _res['focus_on_load'] = focus_on_load
+    if placeholder is not None:
+        _res['placeholder'] = placeholder.dict() if isinstance(placeholder, _BaseModel) else placeholder
+    if _token is not None:
+        _instrumentation.record('SelectUsers', _token, _res)
+    return _res
+
+
 def SelectConversations(
     action_id : str,
     initial_conversation : str = None,
     default_to_current_conversation : bool = False,
     confirm : ConfirmDialogObject = None,
     focus_on_load : bool = False,
-    placeholder : TextObject = None
+    placeholder : TextObject = None,
 ):
-    """This multi-select menu will populate its options with a list of public and private channels, DMs, and MPIMs visible to the current user in the active workspace.
+    """This select menu will populate its options with a list of public and private channels, DMs, and MPIMs visible to the current user in the active workspace.
 
     Args:
-        action_id (str): An identifier for the action triggered when a menu option is selected. 
-        initial_conversation (List[str]): ID of any valid conversations to be pre-selected when the menu loads. 
-            If default_to_current_conversation is also supplied, initial_conversations will be ignored. 
-        default_to_current_conversation (bool, optional): Pre-populates the select menu with the conversation that the user was viewing when they opened the modal, 
+        action_id (str): An identifier for the action triggered when a menu option is selected.
+        initial_conversation (str, optional): ID of any valid conversation to be pre-selected when the menu loads.
+            If default_to_current_conversation is also supplied, initial_conversation will be ignored. Defaults to None.
+        default_to_current_conversation (bool, optional): Pre-populates the select menu with the conversation that the user was viewing when they opened the modal,
             if available. Defaults to False.
-        confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that appears before the multi-select choices are submitted. Defaults to None.
+        confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that appears after a menu item is selected. Defaults to None.
         focus_on_load (bool, optional): Indicates whether the element will be set to auto focus within the view object. Only one element can be set to true. Defaults to false. Defaults to False.
         placeholder (TextObject, optional): A plain_text only text object that defines the placeholder text shown on the menu. Defaults to None.
     """
-    return {
-        "type": "multi_conversations_select",
-        "action_id" : action_id,
-        "initial_conversation" : initial_conversation,
-        "default_to_current_conversation" : default_to_current_conversation,
-        "confirm" : confirm,
-        "focus_on_load" : focus_on_load,
-        "placeholder" : placeholder
-    }
-
-@ObjectWrapper
+    _token = _instrumentation.start('SelectConversations') if _instrumentation.enabled else None
+    _res = {'type': 'conversations_select'}
+    if action_id is not None:
+        _res['action_id'] = action_id.dict() if isinstance(action_id, _BaseModel) else action_id
+    if initial_conversation is not None:
+        _res['initial_conversation'] = initial_conversation.dict() if isinstance(initial_conversation, _BaseModel) else initial_conversation
+    if default_to_current_conversation is not None:
+        _res['default_to_current_conversation'] = default_to_current_conversation
+    if confirm is not None:
+        _res['confirm'] = confirm.dict() if isinstance(confirm, _BaseModel) else confirm
+    if focus_on_load is not None:
+        _res['focus_on_load'] = focus_on_load
+    if placeholder is not None:
+        _res['placeholder'] = placeholder.dict() if isinstance(placeholder, _BaseModel) else placeholder
+    if _token is not None:
+        _instrumentation.record('SelectConversations', _token, _res)
+    return _res
+
+
 def SelectChannels(
     action_id : str,
     initial_channel : str = None,
     confirm : ConfirmDialogObject = None,
     focus_on_load : bool = False,
-    placeholder : TextObject = None
+    placeholder : TextObject = None,
 ):
-    """This multi-select menu will populate its options with a list of public channels visible to the current user in the active workspace.
+    """This select menu will populate its options with a list of public channels visible to the current user in the active workspace.
 
     Args:
-        action_id (str): An identifier for the action triggered when a menu option is selected. 
-        initial_channel (str, optional): An array of one or more IDs of any valid public channel to be pre-selected when the menu loads. Defaults to None.
-        confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that appears before the multi-select choices are submitted. Defaults to None.
+        action_id (str): An identifier for the action triggered when a menu option is selected.
+        initial_channel (str, optional): ID of any valid public channel to be pre-selected when the menu loads. Defaults to None.
+        confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that appears after a menu item is selected. Defaults to None.
         focus_on_load (bool, optional): Indicates whether the element will be set to auto focus within the view object. Only one element can be set to true. Defaults to false. Defaults to False.
         placeholder (TextObject, optional): A plain_text only text object that defines the placeholder text shown on the menu. Defaults to None.
     """
-    return {
-        "type": "multi_static_select",
-        "action_id" : action_id,
-        "initial_channel" : initial_channel,
-        "confirm" : confirm,
-        "focus_on_load" : focus_on_load,
-        "placeholder" : placeholder
-    }
-
-@ObjectWrapper
+    _token = _instrumentation.start('SelectChannels') if _instrumentation.enabled else None
+    _res = {'type': 'channels_select'}
+    if action_id is not None:
+        _res['action_id'] = action_id.dict() if isinstance(action_id, _BaseModel) else action_id
+    if initial_channel is not None:
+        _res['initial_channel'] = initial_channel.dict() if isinstance(initial_channel, _BaseModel) else initial_channel
+    if confirm is not None:
+        _res['confirm'] = confirm.dict() if isinstance(confirm, _BaseModel) else confirm
+    if focus_on_load is not None:
+        _res['focus_on_load'] = focus_on_load
+    if placeholder is not None:
+        _res['placeholder'] = placeholder.dict() if isinstance(placeholder, _BaseModel) else placeholder
+    if _token is not None:
+        _instrumentation.record('SelectChannels', _token, _res)
+    return _res
+
+
 def TimePicker(
     action_id : str,
     initial_time : str = None,
     confirm : ConfirmDialogObject = None,
-    focus_on_load : bool = False , 
+    focus_on_load : bool = False,
     placeholder : TextObject = None,
-    timezone : str = None
+    timezone : str = None,
 ):
     """Visit https://api.slack.com/reference/block-kit/block-elements#timepicker for more informations"""
-    return {
-        "type" : "timepicker",
-        "action_id" : action_id,
-        "initial_time" : initial_time,
-        "confirm" : confirm,
-        "focus_on_load" : focus_on_load,
-        "placeholder" : placeholder ,
-        "timezone" : timezone
-    }
-
-@ObjectWrapper
+    _token = _instrumentation.start('TimePicker') if _instrumentation.enabled else None
+    _res = {'type': 'timepicker'}
+    if action_id is not None:
+        _res['action_id'] = action_id.dict() if isinstance(action_id, _BaseModel) else action_id
+    if initial_time is not None:
+        _res['initial_time'] = initial_time.dict() if isinstance(initial_time, _BaseModel) else initial_time
+    if confirm is not None:
+        _res['confirm'] = confirm.dict() if isinstance(confirm, _BaseModel) else confirm
+    if focus_on_load is not None:
+        _res['focus_on_load'] = focus_on_load
+    if placeholder is not None:
+        _res['placeholder'] = placeholder.dict() if isinstance(placeholder, _BaseModel) else placeholder
+    if timezone is not None:
+        _res['timezone'] = timezone.dict() if isinstance(timezone, _BaseModel) else timezone
+    if _token is not None:
+        _instrumentation.record('TimePicker', _token, _res)
+    return _res
+
+
 def URLInput(
-    action_id : str ,
+    action_id : str,
     initial_value : str = None,
     dispatch_action_config : DispatchActionObject = None,
     focus_on_load : bool = False,
-    placeholder : TextObject = None
+    placeholder : TextObject = None,
 ):
     """Visit https://api.slack.com/reference/block-kit/block-elements#url for more informations"""
-    return {
-        "type": "url_text_input",
-        "action_id" : action_id,
-        "initial_value" : initial_value ,
-        "dispatch_action_config" : dispatch_action_config,
-        "focus_on_load" : focus_on_load,
-        "placeholder" : placeholder
-    }
-
-@ObjectWrapper
+    _token = _instrumentation.start('URLInput') if _instrumentation.enabled else None
+    _res = {'type': 'url_text_input'}
+    if action_id is not None:
+        _res['action_id'] = action_id.dict() if isinstance(action_id, _BaseModel) else action_id
+    if initial_value is not None:
+        _res['initial_value'] = initial_value.dict() if isinstance(initial_value, _BaseModel) else initial_value
+    if dispatch_action_config is not None:
+        _res['dispatch_action_config'] = dispatch_action_config.dict() if isinstance(dispatch_action_config, _BaseModel) else dispatch_action_config
+    if focus_on_load is not None:
+        _res['focus_on_load'] = focus_on_load
+    if placeholder is not None:
+        _res['placeholder'] = placeholder.dict() if isinstance(placeholder, _BaseModel) else placeholder
+    if _token is not None:
+        _instrumentation.record('URLInput', _token, _res)
+    return _res
+
+
 def WorkflowButton(
-    text: TextObject,
+    text : TextObject,
     workflow : WorkFlowObject,
-    accessibility_label : str,
-    style : Literal["primary","danger"] = None
+    accessibility_label : str = None,
+    style : Literal['primary', 'danger'] = None,
 ):
     """Visit https://api.slack.com/reference/block-kit/block-elements#workflow_button for more informations"""
-    return {
-        "type" : "workflow_button",
-        "text" : text,
-        "workflow" : workflow,
-        "style" : style,
-        "accessibility_label" :accessibility_label
-    }
\ No newline at end of file
+    _token = _instrumentation.start('WorkflowButton') if _instrumentation.enabled else None
+    _res = {'type': 'workflow_button'}
+    if text is not None:
+        _res['text'] = text.dict() if isinstance(text, _BaseModel) else text
+    if workflow is not None:
+        _res['workflow'] = workflow.dict() if isinstance(workflow, _BaseModel) else workflow
+    if style is not None:
+        _res['style'] = style.dict() if isinstance(style, _BaseModel) else style
+    if accessibility_label is not None:
+        _res['accessibility_label'] = accessibility_label.dict() if isinstance(accessibility_label, _BaseModel) else accessibility_label
+    if _token is not None:
+        _instrumentation.record('WorkflowButton', _token, _res)
+    return _res
@@ -0,0 +1,197 @@
+from concurrent.futures import Future , ProcessPoolExecutor , ThreadPoolExecutor
+from threading import BoundedSemaphore , Lock
+from time import monotonic
+from typing import Callable
+from .blocks import SectionBlock
+from .commons import TextObject
+from .lazy import render as render_tree
+from .metrics import BuilderStats
+
+__all__ = ["RenderQueueFull", "loading_view", "busy_view", "RenderExecutor"]
+
+
+class RenderQueueFull(RuntimeError):
+    """Raised when a render job is submitted to a saturated RenderExecutor."""
+
+
+def _timed_render(render : Callable, args : tuple, kwargs : dict, submitted : float):
+    # monotonic is system wide, so queue times are also right when running in another process
+    started = monotonic()
+    result = render_tree(render(*args, **kwargs))
+    return result , started - submitted , monotonic() - started
+
+
+def loading_view(title : str = "Loading") -> dict:
+    """A minimal modal shown while the real view renders."""
+    return {
+        "type" : "modal",
+        "title" : TextObject(type="plain_text", text=title).dict(),
+        "blocks" : [SectionBlock(text=TextObject(type="plain_text", text="Loading..."))],
+    }
+
+
+def busy_view(title : str = "Busy") -> dict:
+    """A minimal modal shown instead of the requested view when the executor is saturated."""
+    return {
+        "type" : "modal",
+        "title" : TextObject(type="plain_text", text=title).dict(),
+        "blocks" : [SectionBlock(text=TextObject(type="plain_text", text="Too many requests are being processed, please try again in a moment."))],
+    }
+
+
+def _failed(exc : BaseException) -> Future:
+    future = Future()
+    future.set_exception(exc)
+    return future
+
+
+class RenderExecutor:
+    """Runs render jobs on a bounded pool so interaction handlers can acknowledge within Slack's 3 seconds.
+
+    Args:
+        max_workers (int, optional): number of threads (or processes) rendering. Defaults to 4.
+        max_pending (int, optional): maximum number of jobs queued or running, further submissions are rejected. Defaults to 64.
+        use_processes (bool, optional): render in a process pool, render functions and their arguments must then be picklable. Defaults to False.
+        block_timeout (float, optional): seconds submit waits for room when saturated before raising RenderQueueFull.
+            The *_after_ack helpers wait before acknowledging, keep it well under Slack's 3 seconds. Defaults to 0.
+    """
+
+    def __init__(self, max_workers : int = 4, max_pending : int = 64, use_processes : bool = False, block_timeout : float = 0):
+        pool = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        self._pool = pool(max_workers=max_workers)
+        self._slots = BoundedSemaphore(max_pending)
+        self.max_pending = max_pending
+        self.block_timeout = block_timeout
+        self.queue_times = BuilderStats("queue")
+        self.render_times = BuilderStats("render")
+        self.pending = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self._lock = Lock()
+
+    def submit(self, render : Callable, *args, **kwargs) -> Future:
+        """Schedules render(*args, **kwargs) and returns a future of the rendered tree right away.
+
+        Raises:
+            RenderQueueFull: max_pending jobs are already queued or running.
+        """
+        acquired = self._slots.acquire(timeout=self.block_timeout) if self.block_timeout else self._slots.acquire(blocking=False)
+        if not acquired:
+            with self._lock:
+                self.rejected += 1
+            raise RenderQueueFull(f"{self.max_pending} render jobs are already pending")
+        with self._lock:
+            self.pending += 1
+        future = Future()
+        try:
+            job = self._pool.submit(_timed_render, render, args, kwargs, monotonic())
+        except Exception:
+            self._release()
+            raise
+        job.add_done_callback(lambda job : self._finish(job, future))
+        return future
+
+    def _release(self):
+        with self._lock:
+            self.pending -= 1
+        self._slots.release()
+
+    def _finish(self, job : Future, future : Future):
+        self._release()
+        try:
+            result , queued , rendered = job.result()
+        except BaseException as exc:
+            with self._lock:
+                self.failed += 1
+            future.set_exception(exc)
+            return
+        with self._lock:
+            self.completed += 1
+            self.queue_times.add(queued)
+            self.render_times.add(rendered)
+        future.set_result(result)
+
+    def _then(self, future : Future, publish : Callable) -> Future:
+        published = Future()
+        def done(future):
+            try:
+                published.set_result(publish(future.result()))
+            except BaseException as exc:
+                published.set_exception(exc)
+        future.add_done_callback(done)
+        return published
+
+    def open_after_ack(self, ack : Callable, client, trigger_id : str, render : Callable, *args, placeholder : dict = None, busy : dict = None, **kwargs) -> Future:
+        """Schedules the render, acknowledges the interaction, opens a loading modal while the trigger_id is valid,
+        then replaces it with the rendered view. When the executor is saturated, the busy view is opened instead.
+
+        Args:
+            ack (Callable): Bolt's ack function.
+            client: a slack_sdk WebClient.
+            trigger_id (str): trigger_id of the interaction payload.
+            render (Callable): called with args and kwargs, returns the view or only its blocks.
+            placeholder (dict, optional): view shown while rendering, its type and title are reused when render returns blocks.
+                Defaults to loading_view().
+            busy (dict, optional): view opened when the executor is saturated. Defaults to busy_view().
+
+        Returns:
+            Future: resolves to the views.update response, or fails with RenderQueueFull once the busy view is opened.
+        """
+        try:
+            future = self.submit(render, *args, **kwargs)
+        except RenderQueueFull as exc:
+            ack()
+            client.views_open(trigger_id=trigger_id, view=busy or busy_view())
+            return _failed(exc)
+        ack()
+        placeholder = placeholder or loading_view()
+        opened = client.views_open(trigger_id=trigger_id, view=placeholder)["view"]
+        def publish(view):
+            if not isinstance(view, dict):
+                view = {**placeholder, "blocks" : view}
+            return client.views_update(view_id=opened["id"], hash=opened.get("hash"), view=view)
+        return self._then(future, publish)
+
+    def update_after_ack(self, ack : Callable, client, view_id : str, render : Callable, *args, busy : dict = None, **kwargs) -> Future:
+        """Schedules the render, acknowledges the interaction, then replaces the view view_id with the rendered view once ready.
+        When the executor is saturated, the view is replaced by the busy view instead.
+
+        Args:
+            ack (Callable): Bolt's ack function.
+            client: a slack_sdk WebClient.
+            view_id (str): id of the view to update.
+            render (Callable): called with args and kwargs, returns the whole view.
+            busy (dict, optional): view shown when the executor is saturated. Defaults to busy_view().
+
+        Returns:
+            Future: resolves to the views.update response, or fails with RenderQueueFull once the busy view is shown.
+        """
+        try:
+            future = self.submit(render, *args, **kwargs)
+        except RenderQueueFull as exc:
+            ack()
+            client.views_update(view_id=view_id, view=busy or busy_view())
+            return _failed(exc)
+        ack()
+        return self._then(future, lambda view : client.views_update(view_id=view_id, view=view))
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "pending" : self.pending,
+                "completed" : self.completed,
+                "failed" : self.failed,
+                "rejected" : self.rejected,
+                "queue_time" : self.queue_times.summary(),
+                "render_time" : self.render_times.summary(),
+            }
+
+    def shutdown(self, wait : bool = True):
+        self._pool.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
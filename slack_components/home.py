@@ -0,0 +1,218 @@
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha256
+from threading import Lock
+from time import sleep
+from typing import Callable , Dict , Iterable , Mapping , Union
+import json
+from .lazy import render as render_tree
+
+__all__ = ["DependencyTracker", "FakeWebClient", "HomePublisher"]
+
+
+class DependencyTracker(Mapping):
+    """Read-only view of the publisher's data recording which keys a render looked up."""
+
+    def __init__(self, data : Mapping):
+        self._data = data
+        self.keys_read = set()
+
+    def __getitem__(self, key):
+        self.keys_read.add(key)
+        return self._data[key]
+
+    def __contains__(self, key):
+        self.keys_read.add(key)
+        return key in self._data
+
+    def __iter__(self):
+        # iterating makes the render depend on every key, including the ones added later
+        self.keys_read.add(HomePublisher.ALL_KEYS)
+        return iter(self._data)
+
+    def __len__(self):
+        self.keys_read.add(HomePublisher.ALL_KEYS)
+        return len(self._data)
+
+
+class FakeWebClient:
+    """A local stand-in for slack_sdk's WebClient recording the views published, to test publishers without Slack.
+
+    Args:
+        latency (float, optional): seconds each call sleeps, to simulate the network. Defaults to 0.
+        fail_for (Iterable[str], optional): user ids for which views_publish raises a RuntimeError. Defaults to None.
+    """
+
+    def __init__(self, latency : float = 0, fail_for : Iterable[str] = None):
+        self.latency = latency
+        self.fail_for = set(fail_for or ())
+        self.published = {}
+        self.calls = 0
+        self._lock = Lock()
+
+    def views_publish(self, user_id : str, view : dict, **kwargs):
+        if self.latency:
+            sleep(self.latency)
+        if user_id in self.fail_for:
+            raise RuntimeError(f"views.publish failed for {user_id}")
+        with self._lock:
+            self.calls += 1
+            self.published[user_id] = view
+        return {"ok" : True, "view" : view}
+
+
+class HomePublisher:
+    """Publishes personalized App Home tabs, re-rendering only the users whose tab depends on changed data.
+
+    Each render reads the shared data through a tracker: the keys it looked up become the user's dependencies.
+    Views whose content did not change since the last publish are not sent again.
+
+    The data is copied on write: update swaps in a new dict, so renders read a consistent snapshot while it changes.
+    A render whose dependencies changed while it ran is not published, the user is marked dirty again instead.
+
+    Args:
+        client: a slack_sdk WebClient, or anything with a views_publish(user_id=..., view=...) method such as FakeWebClient.
+        render (Callable): called as render(user_id, data) and returning the blocks (or the whole view) of the user's tab.
+            Thunks are evaluated before publishing, see render.
+        data (Mapping, optional): initial data the tabs are rendered from, read-only afterwards: change it with update. Defaults to None.
+        max_workers (int, optional): maximum number of renders and views.publish calls in flight. Defaults to 8.
+        batch_size (int, optional): number of users handed to the workers at a time. Defaults to 200.
+    """
+
+    ALL_KEYS = object()
+    """Dependency of renders that iterated over the data."""
+
+    def __init__(self, client, render : Callable, data : Mapping = None, max_workers : int = 8, batch_size : int = 200):
+        self.client = client
+        self.render = render
+        self.data = dict(data or {})
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self._dependencies : Dict[str, frozenset] = {}
+        self._dependents : Dict[object, set] = {}
+        self._digests : Dict[str, str] = {}
+        self._dirty = set()
+        self._version = 0
+        self._changed_at : Dict[object, int] = {}
+        self._lock = Lock()
+
+    def add_users(self, user_ids : Iterable[str]):
+        """Registers users, their tab is published on the next flush."""
+        with self._lock:
+            for user_id in user_ids:
+                self._dependencies.setdefault(user_id, frozenset())
+                self._dirty.add(user_id)
+
+    def remove_users(self, user_ids : Iterable[str]):
+        with self._lock:
+            for user_id in user_ids:
+                for key in self._dependencies.pop(user_id, ()):
+                    self._dependents.get(key, set()).discard(user_id)
+                self._digests.pop(user_id, None)
+                self._dirty.discard(user_id)
+
+    def _invalidate(self, keys : list) -> set:
+        # called with the lock held
+        if not keys:
+            return set()
+        self._version += 1
+        affected = set(self._dependents.get(self.ALL_KEYS, ()))
+        for key in keys:
+            self._changed_at[key] = self._version
+            affected.update(self._dependents.get(key, ()))
+        self._dirty.update(affected)
+        return affected
+
+    def invalidate(self, keys : Iterable) -> set:
+        """Marks the users depending on keys as dirty and returns them."""
+        with self._lock:
+            return self._invalidate(list(keys))
+
+    def update(self, changes : Mapping) -> set:
+        """Updates the data and marks the users depending on the changed keys as dirty. Returns those users."""
+        with self._lock:
+            changed = [key for key , value in changes.items() if key not in self.data or self.data[key] != value]
+            if changed:
+                data = dict(self.data)
+                data.update(changes)
+                self.data = data
+            return self._invalidate(changed)
+
+    def _changed_since(self, version : int, dependencies : frozenset) -> bool:
+        if version == self._version:
+            return False
+        if self.ALL_KEYS in dependencies:
+            return True
+        return any(self._changed_at.get(key, 0) > version for key in dependencies)
+
+    @staticmethod
+    def digest(view : dict) -> str:
+        return sha256(json.dumps(view, sort_keys=True, separators=(",", ":"), default=str).encode()).hexdigest()
+
+    def _publish_one(self, user_id : str) -> str:
+        with self._lock:
+            data , version = self.data , self._version
+        tracker = DependencyTracker(data)
+        view = render_tree(self.render(user_id, tracker))
+        if not isinstance(view, dict):
+            view = {"type" : "home", "blocks" : view}
+        digest = self.digest(view)
+        dependencies = frozenset(tracker.keys_read)
+        with self._lock:
+            if user_id not in self._dependencies:
+                return "removed"
+            for key in self._dependencies[user_id] - dependencies:
+                self._dependents[key].discard(user_id)
+            for key in dependencies:
+                self._dependents.setdefault(key, set()).add(user_id)
+            self._dependencies[user_id] = dependencies
+            if self._changed_since(version, dependencies):
+                # the data changed during the render, before the dependencies were known to invalidate
+                self._dirty.add(user_id)
+                return "stale"
+            if self._digests.get(user_id) == digest:
+                return "unchanged"
+        self.client.views_publish(user_id=user_id, view=view)
+        with self._lock:
+            self._digests[user_id] = digest
+        return "published"
+
+    def publish(self, user_ids : Iterable[str]) -> dict:
+        """Renders and publishes the tabs of user_ids in parallel batches.
+
+        Returns:
+            dict: the number of users "published", "unchanged" and "stale" (rendered from data that changed meanwhile),
+                and the exception raised for each user that "failed". Stale and failed users stay dirty and are retried on the next flush.
+        """
+        report = {"published" : 0, "unchanged" : 0, "stale" : 0, "failed" : {}}
+        user_ids = list(user_ids)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            for start in range(0, len(user_ids), self.batch_size):
+                batch = user_ids[start:start + self.batch_size]
+                for user_id , future in zip(batch, [pool.submit(self._publish_one, user_id) for user_id in batch]):
+                    try:
+                        outcome = future.result()
+                    except Exception as exc:
+                        report["failed"][user_id] = exc
+                        with self._lock:
+                            self._dirty.add(user_id)
+                        continue
+                    if outcome in report:
+                        report[outcome] += 1
+        return report
+
+    def flush(self) -> dict:
+        """Publishes the tabs of every dirty user. See publish."""
+        with self._lock:
+            dirty , self._dirty = self._dirty , set()
+        return self.publish(sorted(dirty))
+
+    def publish_all(self) -> dict:
+        """Re-renders every registered user. Tabs that did not change are still skipped. See publish."""
+        with self._lock:
+            users = sorted(self._dependencies)
+            self._dirty.clear()
+        return self.publish(users)
+
+    def dependencies(self, user_id : str) -> Union[frozenset, None]:
+        """Data keys the last render of user_id looked up."""
+        return self._dependencies.get(user_id)
@@ -0,0 +1,161 @@
+from collections import OrderedDict
+from string import Formatter
+from threading import Lock
+from typing import Dict , Mapping , Union
+import re
+from .persistent import PersistentDict , PersistentList , freeze , set_in
+
+__all__ = ["MessageKey", "Slot", "Catalog", "LocalizedLayout"]
+
+_formatter = Formatter()
+_FIELD_ROOT = re.compile(r"[^.\[]*")
+
+
+class MessageKey(str):
+    """A translatable text. It is a str so it can be used wherever builders and models expect text.
+    Translations may hold {placeholders}, filled with the render values.
+
+    Args:
+        key (str): key of the message in the catalogs.
+        default (str, optional): text used when no catalog has the key. Defaults to the key itself.
+    """
+
+    def __new__(cls, key : str, default : str = None):
+        message = super().__new__(cls, key)
+        message.default = key if default is None else default
+        return message
+
+    def __reduce__(self):
+        return (type(self), (str(self), self.default))
+
+
+class Slot(str):
+    """A text filled with a render value, without translation.
+
+    Args:
+        name (str): name of the render value.
+    """
+
+    def __reduce__(self):
+        return (type(self), (str(self),))
+
+
+class Catalog:
+    """Translations of the message keys, per locale.
+
+    Args:
+        translations (Mapping): for every locale, a mapping from message key to translation,
+            or a gettext translations object (anything with a gettext method).
+        fallback (str, optional): locale used for keys a locale does not translate. Defaults to None.
+    """
+
+    def __init__(self, translations : Mapping, fallback : str = None):
+        self.translations = dict(translations)
+        self.fallback = fallback
+
+    def _lookup(self, locale : str, key : str) -> Union[str, None]:
+        translations = self.translations.get(locale)
+        if translations is None:
+            return None
+        if hasattr(translations, "gettext"):
+            text = translations.gettext(key)
+            return None if text == key else text
+        return translations.get(key)
+
+    def translate(self, locale : str, message : MessageKey) -> str:
+        text = self._lookup(locale, message)
+        if text is None and self.fallback is not None:
+            text = self._lookup(self.fallback, message)
+        return message.default if text is None else text
+
+
+def _as_list(tree):
+    return list(tree) if isinstance(tree, tuple) else tree
+
+
+class LocalizedLayout:
+    """A layout whose texts are message keys and slots, rendered in any locale of a catalog.
+
+    The first render in a locale resolves every static text once into a frozen variant of the layout.
+    Later renders only fill the dynamic texts, copying the objects along their paths and sharing the rest,
+    and recent results are kept in a bounded cache per locale.
+
+    Args:
+        blocks: the layout, built with this library's builders, using MessageKey and Slot as texts.
+        catalog (Catalog): translations of the message keys.
+        cache_size (int, optional): number of rendered layouts kept per locale. Defaults to 256.
+    """
+
+    def __init__(self, blocks, catalog : Catalog, cache_size : int = 256):
+        self.blocks = freeze(blocks)
+        self.catalog = catalog
+        self.cache_size = cache_size
+        self._variants : Dict[str, tuple] = {}
+        self._rendered : Dict[str, OrderedDict] = {}
+        self._lock = Lock()
+
+    def _compile(self, locale : str) -> tuple:
+        dynamic = []
+        def resolve(value, path):
+            if isinstance(value, Slot):
+                dynamic.append((path, str(value), None))
+                return value
+            if isinstance(value, MessageKey):
+                text = self.catalog.translate(locale, value)
+                # {user.name} and {items[0]} are filled from the values user and items
+                names = tuple(_FIELD_ROOT.match(name).group() for _ , name , _ , _ in _formatter.parse(text) if name)
+                if names:
+                    dynamic.append((path, names, text))
+                return text
+            if isinstance(value, dict):
+                items = {k : resolve(v, path + (k,)) for k , v in value.items()}
+                return value if all(items[k] is v for k , v in value.items()) else PersistentDict(items)
+            if isinstance(value, tuple):
+                items = [resolve(v, path + (i,)) for i , v in enumerate(value)]
+                return value if all(a is b for a , b in zip(items, value)) else PersistentList(items)
+            return value
+        variant = resolve(self.blocks, ())
+        names = sorted({name for _ , slot , _ in dynamic for name in ((slot,) if isinstance(slot, str) else slot)})
+        return variant , tuple(dynamic) , tuple(names)
+
+    def variant(self, locale : str) -> tuple:
+        """The compiled variant of a locale: the frozen tree, its dynamic texts and the render values they use."""
+        compiled = self._variants.get(locale)
+        if compiled is None:
+            compiled = self._compile(locale)
+            with self._lock:
+                compiled = self._variants.setdefault(locale, compiled)
+        return compiled
+
+    def render(self, locale : str, **values):
+        """Renders the layout in locale, filling the dynamic texts with values.
+        Like Layout.render, a list of blocks is returned as a list, the blocks themselves are frozen and shared."""
+        tree , dynamic , names = self.variant(locale)
+        if not dynamic:
+            return _as_list(tree)
+        missing = [name for name in names if name not in values]
+        if missing:
+            raise RuntimeError(f"Missing values for slots {missing}")
+        # typed, so values that hash alike but render differently (1, 1.0, True) do not share an entry
+        key = tuple((type(values[name]), values[name]) for name in names)
+        try:
+            hash(key)
+        except TypeError:
+            key = None # unhashable values are rendered without caching
+        if key is not None:
+            with self._lock:
+                hit = self._rendered.get(locale, {}).get(key)
+                if hit is not None:
+                    self._rendered[locale].move_to_end(key)
+                    return _as_list(hit)
+        for path , slot , template in dynamic:
+            tree = set_in(tree, path, values[slot] if template is None else template.format_map(values))
+        if key is not None:
+            with self._lock:
+                cache = self._rendered.setdefault(locale, OrderedDict())
+                cache[key] = tree
+                if len(cache) > self.cache_size:
+                    cache.popitem(last=False)
+        return _as_list(tree)
+
+    __call__ = render
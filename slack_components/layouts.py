@@ -0,0 +1,264 @@
+from hashlib import sha256
+from importlib.metadata import PackageNotFoundError , version
+from inspect import Parameter , signature , unwrap
+from pathlib import Path
+from typing import Callable , Dict , Union
+import json
+import marshal
+import os
+import pickle
+from pydantic import BaseModel
+from . import blocks , commons , elements
+from .persistent import freeze
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+__all__ = ["COMPONENT_KEY", "SLOT_KEY", "FORMAT_KEY", "COMPONENTS", "register_component", "compile_spec", "Layout", "LayoutLoader"]
+
+_CACHE_VERSION = 1
+"""Bumped whenever the compiled form changes, so stale caches are recompiled."""
+
+try:
+    _PACKAGE_VERSION = version("slack_components")
+except PackageNotFoundError:
+    # running from a source tree, the builders' code still keys the cache
+    _PACKAGE_VERSION = None
+
+COMPONENT_KEY = "$component"
+SLOT_KEY = "$slot"
+FORMAT_KEY = "$format"
+
+
+def _defined_in(module) -> dict:
+    return {
+        name : value for name , value in vars(module).items()
+        if name[:1].isupper() and getattr(value, "__module__", None) == module.__name__ and value is not commons.ObjectWrapper
+    }
+
+
+COMPONENTS : Dict[str, Callable] = {**_defined_in(commons), **_defined_in(blocks), **_defined_in(elements)}
+"""Builders and models that layout specs can reference by name."""
+
+
+def register_component(name : str, builder : Callable):
+    """Makes a custom builder available to layout specs under name."""
+    global _components_digest
+    COMPONENTS[name] = builder
+    _components_digest = None
+
+
+_components_digest = None
+
+
+def _fingerprint(builder : Callable) -> bytes:
+    if isinstance(builder, type) and issubclass(builder, BaseModel):
+        return builder.schema_json().encode()
+    source = getattr(builder, "__source__", None)
+    if source is not None:
+        return source.encode()
+    code = getattr(unwrap(builder), "__code__", None)
+    # builders without code (classes, builtins, callables) are only known by name
+    return marshal.dumps(code) if code is not None else repr(builder).encode()
+
+
+def _cache_key() -> tuple:
+    """What compiled plans depend on besides their spec: the compiled form, the library version and the builders' code.
+    Plans hold builder output frozen at compile time, so any change to these must recompile them."""
+    global _components_digest
+    if _components_digest is None:
+        digest = sha256()
+        for name in sorted(COMPONENTS):
+            builder = COMPONENTS[name]
+            digest.update(f"{name}={getattr(builder, '__module__', '')}.{getattr(builder, '__qualname__', '')}".encode())
+            digest.update(_fingerprint(builder))
+        _components_digest = digest.hexdigest()
+    return _CACHE_VERSION , _PACKAGE_VERSION , _components_digest
+
+
+def _check_arguments(name : str, builder : Callable, keys : set):
+    if isinstance(builder, type) and issubclass(builder, BaseModel):
+        known = set(builder.__fields__)
+        required = {key for key , field in builder.__fields__.items() if field.required}
+    else:
+        parameters = signature(builder).parameters
+        known = set(parameters)
+        required = {key for key , p in parameters.items() if p.default is Parameter.empty}
+    if keys - known:
+        raise RuntimeError(f"{name} got unexpected arguments {sorted(keys - known)}")
+    if required - keys:
+        raise RuntimeError(f"{name} is missing required arguments {sorted(required - keys)}")
+
+
+def compile_spec(spec):
+    """Validates a layout spec and compiles it into a plan of nested tuples, ready to be cached.
+    Subtrees that do not depend on any slot are built once here and frozen, so they are shared by every render.
+
+    Args:
+        spec: the decoded layout. Objects with a "$component" key call the builder or model of that name with the other keys as arguments,
+            {"$slot": name} (optionally with a "default") is replaced by a render argument and {"$format": template} is formatted with the render arguments.
+    """
+    if isinstance(spec, dict):
+        if SLOT_KEY in spec:
+            return ("slot", spec[SLOT_KEY], "default" in spec, spec.get("default"))
+        if FORMAT_KEY in spec:
+            return ("format", spec[FORMAT_KEY])
+        items = tuple((key, compile_spec(value)) for key , value in spec.items() if key != COMPONENT_KEY)
+        if COMPONENT_KEY in spec:
+            name = spec[COMPONENT_KEY]
+            builder = COMPONENTS.get(name)
+            if builder is None:
+                raise RuntimeError(f"Unknown component {name!r}")
+            _check_arguments(name, builder, {key for key , _ in items})
+            plan = ("call", name, items)
+        else:
+            plan = ("dict", items)
+    elif isinstance(spec, list):
+        plan = ("list", tuple(compile_spec(value) for value in spec))
+    else:
+        return ("const", spec)
+    if _is_static(plan):
+        return ("const", freeze(_build(plan)({})))
+    return plan
+
+
+def _is_static(plan) -> bool:
+    if plan[0] in ("call", "dict"):
+        return all(item[0] == "const" for _ , item in plan[-1])
+    if plan[0] == "list":
+        return all(item[0] == "const" for item in plan[1])
+    return plan[0] == "const"
+
+
+def _missing(name : str):
+    raise RuntimeError(f"Missing value for slot {name!r}")
+
+
+def _plain(value):
+    # models are converted like the builders convert their arguments, as the static subtrees are when frozen
+    return value.dict() if isinstance(value, BaseModel) else value
+
+
+def _build(plan) -> Callable:
+    """Turns a compiled plan into a function of the render arguments."""
+    kind = plan[0]
+    if kind == "const":
+        value = plan[1]
+        return lambda values : value
+    if kind == "slot":
+        _ , name , has_default , default = plan
+        def slot(values):
+            if name in values:
+                return values[name]
+            if not has_default:
+                _missing(name)
+            return default
+        return slot
+    if kind == "format":
+        template = plan[1]
+        def format(values):
+            try:
+                return template.format_map(values)
+            except KeyError as exc:
+                _missing(exc.args[0])
+        return format
+    if kind == "list":
+        items = tuple(_build(item) for item in plan[1])
+        return lambda values : [_plain(item(values)) for item in items]
+    items = tuple((key, _build(item)) for key , item in plan[-1])
+    if kind == "dict":
+        return lambda values : {key : _plain(item(values)) for key , item in items}
+    builder = COMPONENTS[plan[1]]
+    return lambda values : _plain(builder(**{key : item(values) for key , item in items}))
+
+
+class Layout:
+    """A compiled layout. Calling it with the slot values returns the rendered blocks.
+
+    Args:
+        name (str): name of the layout, the stem of its file.
+        plan (tuple): compiled form of the spec, see compile_spec.
+    """
+
+    def __init__(self, name : str, plan : tuple):
+        self.name = name
+        self.plan = plan
+        self._render = _build(plan)
+
+    def render(self, **values):
+        res = self._render(values)
+        return list(res) if isinstance(res, tuple) else res
+
+    __call__ = render
+
+    def __repr__(self):
+        return f"Layout({self.name!r})"
+
+
+def _decode(path : Path, content : bytes):
+    if path.suffix in (".yaml", ".yml"):
+        if yaml is None:
+            raise RuntimeError(f"PyYAML is required to load {path}")
+        return yaml.safe_load(content)
+    return json.loads(content)
+
+
+class LayoutLoader:
+    """Loads layout specs (JSON, or YAML when PyYAML is installed) and caches their compiled form on disk.
+
+    A cached layout is reused without reading its spec when the file's mtime and size did not change,
+    or without parsing it when its content hash did not change. Caches written by another version of the library
+    or with other component builders are ignored. The cache files are pickles, keep them in a trusted directory.
+
+    Args:
+        cache_dir (str, optional): directory holding the compiled layouts. Defaults to None, which disables the disk cache.
+    """
+
+    def __init__(self, cache_dir : Union[str, Path] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _cache_path(self, path : Path) -> Path:
+        return self.cache_dir / (sha256(str(path).encode()).hexdigest()[:32] + ".pickle")
+
+    def _read_cache(self, cache_path : Path) -> Union[dict, None]:
+        try:
+            with open(cache_path, "rb") as fp:
+                entry = pickle.load(fp)
+        except Exception:
+            # unreadable, truncated, corrupt or written by another version of the library: it is compiled again
+            return None
+        return entry if isinstance(entry, dict) and entry.get("key") == _cache_key() else None
+
+    def _write_cache(self, cache_path : Path, entry : dict):
+        tmp = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as fp:
+            pickle.dump(entry, fp, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_path)
+
+    def load(self, path : Union[str, Path]) -> Layout:
+        """Returns the compiled layout of the spec at path."""
+        path = Path(path).resolve()
+        if self.cache_dir is None:
+            content = path.read_bytes()
+            return Layout(path.stem, compile_spec(_decode(path, content)))
+        stat = path.stat()
+        cache_path = self._cache_path(path)
+        entry = self._read_cache(cache_path)
+        if entry is not None and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            return Layout(path.stem, entry["plan"])
+        content = path.read_bytes()
+        digest = sha256(content).hexdigest()
+        if entry is None or entry["digest"] != digest:
+            entry = {"key" : _cache_key(), "digest" : digest, "plan" : compile_spec(_decode(path, content))}
+        entry.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+        self._write_cache(cache_path, entry)
+        return Layout(path.stem, entry["plan"])
+
+    def load_directory(self, directory : Union[str, Path]) -> Dict[str, Layout]:
+        """Loads every spec (*.json, *.yaml, *.yml) of a directory, keyed by layout name."""
+        paths = sorted(p for p in Path(directory).iterdir() if p.suffix in (".json", ".yaml", ".yml"))
+        return {path.stem : self.load(path) for path in paths}
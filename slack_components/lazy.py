@@ -0,0 +1,95 @@
+from contextvars import ContextVar
+from pydantic import BaseModel
+from .schema import validate
+
+__all__ = ["is_thunk", "RenderContext", "render"]
+
+_current_context = ContextVar("slack_components_render_context", default=None)
+
+
+def is_thunk(value) -> bool:
+    """Whether value is a zero-argument callable standing for a value that is computed at render time."""
+    return callable(value) and not isinstance(value, (type, BaseModel))
+
+
+class RenderContext:
+    """Memoizes the thunks evaluated while rendering, so a thunk shared by several blocks runs once.
+
+    Every render call made inside a `with RenderContext():` block shares the same memo.
+    """
+
+    def __init__(self):
+        self._memo = {}
+        self._token = None
+
+    def __enter__(self):
+        self._token = _current_context.set(self)
+        return self
+
+    def __exit__(self, *exc):
+        _current_context.reset(self._token)
+        self._token = None
+
+    def evaluate(self, thunk):
+        """Calls thunk once per context and renders its result."""
+        key = id(thunk)
+        hit = self._memo.get(key)
+        if hit is None:
+            # the thunk is kept alongside its result so its id cannot be reused while memoized
+            hit = self._memo[key] = (thunk, self.render(thunk()))
+        return hit[1]
+
+    def render(self, value):
+        """Evaluates every thunk found in value and returns the serializable tree.
+        Thunks returning None are dropped from their parent, like unset builder arguments, and the checks of the
+        builder are run again on objects whose thunks were rendered."""
+        if is_thunk(value):
+            return self.evaluate(value)
+        if isinstance(value, BaseModel):
+            return self.render(value.dict())
+        if isinstance(value, dict):
+            rendered = {}
+            changed = False
+            for k , v in value.items():
+                r = self.render(v)
+                changed = changed or r is not v
+                # only thunks returning None are dropped, None values given as is are kept
+                if r is not None or not is_thunk(v):
+                    rendered[k] = r
+            if not changed:
+                return value
+            if "type" in rendered:
+                validate(rendered)
+            return rendered
+        if isinstance(value, (list, tuple)):
+            rendered = []
+            changed = False
+            for v in value:
+                r = self.render(v)
+                changed = changed or r is not v
+                if r is not None or not is_thunk(v):
+                    rendered.append(r)
+            return rendered if changed else value
+        return value
+
+
+def render(tree):
+    """Evaluates the thunks of a block tree, right before it is sent to Slack.
+    Builders accept zero-argument callables in place of any argument or list item, they are left untouched until rendered.
+    Models (TextObject, OptionObject...) do not: use a thunk returning the whole model, e.g. text=lambda: TextObject(...).
+
+    Args:
+        tree: a block, a list of blocks or any builder output.
+
+    Returns:
+        The tree with every thunk replaced by its rendered result. Subtrees without thunks are returned as is.
+
+    Raises:
+        RuntimeError: a block or element misses a required field once its thunks are rendered,
+            e.g. SectionBlock(text=lambda: None).
+    """
+    context = _current_context.get()
+    if context is None:
+        with RenderContext() as context:
+            return context.render(tree)
+    return context.render(tree)
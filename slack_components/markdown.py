@@ -0,0 +1,242 @@
+from typing import Iterable , Iterator , List , Union
+import re
+from .blocks import ContextBlock , Divider , HeaderBlock , ImageBlock , SectionBlock
+from .commons import TextObject
+
+__all__ = ["SECTION_TEXT_LIMIT", "HEADER_TEXT_LIMIT", "MESSAGE_BLOCK_LIMIT", "iter_markdown_blocks", "iter_markdown_messages"]
+
+SECTION_TEXT_LIMIT = 3000
+HEADER_TEXT_LIMIT = 150
+MESSAGE_BLOCK_LIMIT = 50
+
+_HEADING = re.compile(r"^ {0,3}(#{1,6})\s+(.*?)\s*#*\s*$")
+_RULE = re.compile(r"^ {0,3}([-*_])(\s*\1){2,}\s*$")
+_SETEXT = re.compile(r"^ {0,3}(=+|-+)\s*$")
+_FENCE = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+_LIST_ITEM = re.compile(r"^(\s*)([-*+]|\d{1,9}[.)])\s+(.*)$")
+_QUOTE = re.compile(r"^ {0,3}>\s?(.*)$")
+_IMAGE = re.compile(r"^\s*!\[([^\]]*)\]\((\S+?)(?:\s+\"[^\"]*\")?\)\s*$")
+
+_CODE_SPAN = re.compile(r"(`+)(.+?)\1")
+_BOLD = re.compile(r"(\*\*|__)(?=\S)(.+?)(?<=\S)\1")
+_ITALIC = re.compile(r"(?<![\w*])([*_])(?=\S)(.+?)(?<=\S)\1(?![\w*])")
+_STRIKE = re.compile(r"~~(?=\S)(.+?)(?<=\S)~~")
+_LINK = re.compile(r"\[([^\]]+)\]\(([^)\s]+)(?:\s+\"[^\"]*\")?\)")
+_AUTOLINK = re.compile(r"&lt;((?:https?|mailto):[^\s&]+)&gt;")
+_BOLD_MARK = "\x00"
+_SPECIAL = re.compile(r"[`*_~\[&<>]")
+
+
+def _escape(text : str) -> str:
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _inline(text : str) -> str:
+    """Converts inline Markdown (emphasis, strikethrough, links) to Slack's mrkdwn, leaving code spans untouched."""
+    if _SPECIAL.search(text) is None:
+        return text
+    parts = []
+    last = 0
+    for match in _CODE_SPAN.finditer(text):
+        parts.append(_inline_text(text[last:match.start()]))
+        parts.append("`" + _escape(match.group(2)) + "`")
+        last = match.end()
+    parts.append(_inline_text(text[last:]))
+    return "".join(parts)
+
+
+def _inline_text(text : str) -> str:
+    text = _escape(text)
+    text = _LINK.sub(lambda m : f"<{m.group(2)}|{m.group(1)}>", text)
+    text = _AUTOLINK.sub(r"<\1>", text)
+    text = _BOLD.sub(lambda m : _BOLD_MARK + m.group(2) + _BOLD_MARK, text)
+    text = _ITALIC.sub(r"_\2_", text)
+    text = _STRIKE.sub(r"~\1~", text)
+    return text.replace(_BOLD_MARK, "*")
+
+
+def _plain(text : str) -> str:
+    """Strips inline Markdown, for the plain_text of headers."""
+    text = _LINK.sub(r"\1", text)
+    text = _CODE_SPAN.sub(r"\2", text)
+    text = _BOLD.sub(r"\2", text)
+    text = _ITALIC.sub(r"\2", text)
+    return _STRIKE.sub(r"\1", text)
+
+
+def _split(text : str, limit : int, strip : str = "\n ") -> Iterator[str]:
+    """Splits text in pieces of at most limit characters, preferably on line breaks then on spaces.
+    The characters in strip are removed from the start of every continuation."""
+    while len(text) > limit:
+        cut = text.rfind("\n", 0, limit)
+        if cut < limit // 2:
+            cut = text.rfind(" ", 0, limit)
+        if cut < limit // 2:
+            cut = limit
+            entity = text.rfind("&", cut - 4, cut)
+            if entity > 0 and ";" not in text[entity:cut]:
+                cut = entity # do not cut &amp; &lt; or &gt; in half
+        yield text[:cut]
+        text = text[cut:].lstrip(strip)
+    if text:
+        yield text
+
+
+class _Buffer:
+    """Accumulates the lines of a paragraph-like construct, emitting full sections as soon as they reach the text limit.
+    The Markdown source of the lines is kept until the next flush, for paragraphs that turn out to be setext headings."""
+
+    def __init__(self, limit : int, separator : str, strip : str = "\n "):
+        self.limit = limit
+        self.separator = separator
+        self.strip = strip
+        self.lines = []
+        self.source = []
+        self.size = 0
+
+    def __bool__(self):
+        return bool(self.lines)
+
+    def add(self, line : str, source : str = None) -> Iterator[str]:
+        self.lines.append(line)
+        self.source.append(line if source is None else source)
+        self.size += len(line) + len(self.separator)
+        if self.size > self.limit:
+            pieces = list(_split(self.separator.join(self.lines), self.limit, self.strip))
+            yield from pieces[:-1]
+            self.lines = [pieces[-1]] if pieces else []
+            self.size = len(pieces[-1]) if pieces else 0
+
+    def flush(self) -> Iterator[str]:
+        if self.lines:
+            yield from _split(self.separator.join(self.lines), self.limit, self.strip)
+        self.lines = []
+        self.source = []
+        self.size = 0
+
+
+def _lines(source : Union[str, Iterable[str]]) -> Iterator[str]:
+    if isinstance(source, str):
+        source = source.splitlines()
+    for line in source:
+        yield line.rstrip("\r\n")
+
+
+def _section(text : str) -> dict:
+    return SectionBlock(text=TextObject(type="mrkdwn", text=text))
+
+
+def _header(text : str) -> dict:
+    return HeaderBlock(text=TextObject(type="plain_text", text=_plain(text)[:HEADER_TEXT_LIMIT] or " "))
+
+
+def iter_markdown_blocks(source : Union[str, Iterable[str]]) -> Iterator[dict]:
+    """Converts Markdown to blocks as it is read, in a single pass over the lines.
+
+    Headings become header blocks, paragraphs and lists become mrkdwn sections, fenced code becomes code sections,
+    thematic breaks become dividers, block quotes become context blocks and lines holding a single image become image blocks.
+    Texts are split to fit Slack's limits, so memory stays bounded by the longest line.
+
+    Args:
+        source (str | Iterable[str]): the Markdown text, an open file or any iterable of lines.
+    """
+    paragraph = _Buffer(SECTION_TEXT_LIMIT, " ")
+    items = _Buffer(SECTION_TEXT_LIMIT, "\n")
+    quote = _Buffer(SECTION_TEXT_LIMIT, "\n")
+    code = None
+    fence = None
+
+    def flush():
+        for buffer , build in ((paragraph, _section), (items, _section), (quote, _context)):
+            for text in buffer.flush():
+                yield build(text)
+
+    for line in _lines(source):
+        if code is not None:
+            if line.strip().startswith(fence):
+                for text in code.flush():
+                    yield _section(f"```\n{text}\n```")
+                code = fence = None
+            else:
+                for text in code.add(_escape(line)):
+                    yield _section(f"```\n{text}\n```")
+            continue
+        match = _FENCE.match(line)
+        if match:
+            yield from flush()
+            fence = match.group(1)
+            # room for the fences around each piece, and only line breaks are stripped to keep the indentation
+            code = _Buffer(SECTION_TEXT_LIMIT - 8, "\n", strip="\n")
+            continue
+        if not line.strip():
+            yield from flush()
+            continue
+        if paragraph and _SETEXT.match(line) and not items and not quote:
+            # "Title" followed by "===" or "---" is a heading, not a rule
+            # from the Markdown source, the lines were converted to mrkdwn
+            title = paragraph.separator.join(paragraph.source)
+            paragraph.lines , paragraph.source , paragraph.size = [] , [] , 0
+            yield _header(title)
+            continue
+        if _RULE.match(line):
+            yield from flush()
+            yield Divider()
+            continue
+        match = _HEADING.match(line)
+        if match:
+            yield from flush()
+            yield _header(match.group(2))
+            continue
+        match = _IMAGE.match(line)
+        if match:
+            yield from flush()
+            yield ImageBlock(image_url=match.group(2), alt_text=match.group(1) or "image")
+            continue
+        match = _QUOTE.match(line)
+        if match:
+            if paragraph or items:
+                for buffer in (paragraph, items):
+                    for text in buffer.flush():
+                        yield _section(text)
+            yield from (_context(text) for text in quote.add(_inline(match.group(1))))
+            continue
+        match = _LIST_ITEM.match(line)
+        if match:
+            if paragraph or quote:
+                for buffer , build in ((paragraph, _section), (quote, _context)):
+                    for text in buffer.flush():
+                        yield build(text)
+            indent , marker , text = match.groups()
+            bullet = marker if marker[0].isdigit() else "•"
+            yield from (_section(text) for text in items.add(" " * len(indent.expandtabs(4)) + f"{bullet} {_inline(text)}"))
+            continue
+        if items and line[:1].isspace():
+            # continuation of the last list item
+            items.lines[-1] += " " + _inline(line.strip())
+            items.size += len(line)
+            continue
+        if items or quote:
+            for buffer , build in ((items, _section), (quote, _context)):
+                for text in buffer.flush():
+                    yield build(text)
+        yield from (_section(text) for text in paragraph.add(_inline(line.strip()), line.strip()))
+    if code is not None:
+        for text in code.flush():
+            yield _section(f"```\n{text}\n```")
+    yield from flush()
+
+
+def _context(text : str) -> dict:
+    return ContextBlock(elements=[TextObject(type="mrkdwn", text=text).dict()])
+
+
+def iter_markdown_messages(source : Union[str, Iterable[str]], max_blocks : int = MESSAGE_BLOCK_LIMIT) -> Iterator[List[dict]]:
+    """Converts Markdown to lists of at most max_blocks blocks, each one fitting in a message. See iter_markdown_blocks."""
+    batch = []
+    for block in iter_markdown_blocks(source):
+        batch.append(block)
+        if len(batch) == max_blocks:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
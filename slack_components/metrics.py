@@ -0,0 +1,165 @@
+from collections import deque
+from threading import Lock
+from time import perf_counter
+from typing import Callable , Dict , List
+import json
+
+__all__ = [
+    "BuilderStats", "SpanExporter", "Instrumentation", "instrumentation", "enable_instrumentation", "disable_instrumentation",
+    "prometheus_text",
+]
+
+
+class BuilderStats:
+    """Call count, latency and payload size figures collected for a single builder."""
+
+    __slots__ = ("name", "calls", "total_time", "total_bytes", "samples")
+
+    def __init__(self, name : str, sample_size : int = 1024):
+        self.name = name
+        self.calls = 0
+        self.total_time = 0.0
+        self.total_bytes = 0
+        self.samples = deque(maxlen=sample_size)
+
+    def add(self, duration : float, size : int = 0):
+        self.calls += 1
+        self.total_time += duration
+        self.total_bytes += size
+        self.samples.append(duration)
+
+    def percentile(self, q : float) -> float:
+        """Latency percentile (in seconds) over the most recent samples.
+
+        Args:
+            q (float): percentile to compute, between 0 and 100.
+        """
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, max(0, round(q / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def summary(self) -> dict:
+        return {
+            "calls" : self.calls,
+            "total_time" : self.total_time,
+            "total_bytes" : self.total_bytes,
+            "p50" : self.percentile(50),
+            "p95" : self.percentile(95),
+            "p99" : self.percentile(99),
+        }
+
+
+class SpanExporter:
+    """Forwards every builder call to OpenTelemetry-like span callbacks.
+
+    Args:
+        on_start (Callable): called with the builder name when a call starts. Its return value is handed back to on_end.
+        on_end (Callable): called as on_end(span, name, duration, payload_size) once the builder returned.
+    """
+
+    def __init__(self, on_start : Callable = None, on_end : Callable = None):
+        self.on_start = on_start
+        self.on_end = on_end
+
+    def start(self, name : str):
+        if self.on_start is not None:
+            return self.on_start(name)
+
+    def end(self, span, name : str, duration : float, size : int):
+        if self.on_end is not None:
+            self.on_end(span, name, duration, size)
+
+
+class Instrumentation:
+    """Registry of per-builder metrics. It does nothing until enabled, builders only check the enabled flag.
+
+    Args:
+        sample_size (int, optional): number of recent latencies kept per builder to compute percentiles. Defaults to 1024.
+        measure_payload (bool, optional): whether to measure the JSON size of each builder output. Defaults to True.
+    """
+
+    def __init__(self, sample_size : int = 1024, measure_payload : bool = True):
+        self.enabled = False
+        self.sample_size = sample_size
+        self.measure_payload = measure_payload
+        self.exporters : List[SpanExporter] = []
+        self.stats : Dict[str, BuilderStats] = {}
+        self._lock = Lock()
+
+    def start(self, name : str):
+        """Opens a measurement, returns the token to pass to record.
+        The token holds the exporters the spans were opened on, so they are ended even if the exporters change meanwhile."""
+        exporters = self.exporters
+        spans = [exporter.start(name) for exporter in exporters]
+        return perf_counter(), exporters, spans
+
+    def record(self, name : str, token, payload):
+        started , exporters , spans = token
+        duration = perf_counter() - started
+        size = len(json.dumps(payload, default=str)) if self.measure_payload else 0
+        with self._lock:
+            stats = self.stats.get(name)
+            if stats is None:
+                stats = self.stats[name] = BuilderStats(name, self.sample_size)
+            stats.add(duration, size)
+        for exporter , span in zip(exporters, spans):
+            exporter.end(span, name, duration, size)
+
+    def reset(self):
+        with self._lock:
+            self.stats = {}
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Returns a summary of the collected metrics, keyed by builder name."""
+        with self._lock:
+            return {name : stats.summary() for name , stats in self.stats.items()}
+
+
+instrumentation = Instrumentation()
+"""Instrumentation shared by every builder of this library."""
+
+
+def enable_instrumentation(*exporters : SpanExporter, sample_size : int = 1024, measure_payload : bool = True):
+    """Starts recording call counts, latencies and payload sizes for every builder.
+
+    Args:
+        exporters (SpanExporter): span exporters notified of every builder call.
+        sample_size (int, optional): number of recent latencies kept per builder. Defaults to 1024.
+        measure_payload (bool, optional): whether to measure the JSON size of each builder output. Defaults to True.
+    """
+    instrumentation.sample_size = sample_size
+    instrumentation.measure_payload = measure_payload
+    instrumentation.exporters = list(exporters)
+    instrumentation.enabled = True
+
+
+def disable_instrumentation():
+    """Stops recording builder metrics. Collected metrics are kept until reset."""
+    instrumentation.enabled = False
+    instrumentation.exporters = []
+
+
+def prometheus_text(source : Instrumentation = None, prefix : str = "slack_components_builder") -> str:
+    """Dumps the collected metrics in the Prometheus text exposition format.
+
+    Args:
+        source (Instrumentation, optional): registry to export. Defaults to the shared instrumentation.
+        prefix (str, optional): metric name prefix. Defaults to "slack_components_builder".
+    """
+    source = source or instrumentation
+    snapshot = source.snapshot()
+    lines = [
+        f"# TYPE {prefix}_calls_total counter",
+        *(f'{prefix}_calls_total{{builder="{name}"}} {s["calls"]}' for name , s in snapshot.items()),
+        f"# TYPE {prefix}_seconds summary",
+    ]
+    for name , s in snapshot.items():
+        for quantile in ("p50", "p95", "p99"):
+            lines.append(f'{prefix}_seconds{{builder="{name}",quantile="0.{quantile[1:]}"}} {s[quantile]:.9f}')
+        lines.append(f'{prefix}_seconds_sum{{builder="{name}"}} {s["total_time"]:.9f}')
+        lines.append(f'{prefix}_seconds_count{{builder="{name}"}} {s["calls"]}')
+    lines.append(f"# TYPE {prefix}_payload_bytes_total counter")
+    lines.extend(f'{prefix}_payload_bytes_total{{builder="{name}"}} {s["total_bytes"]}' for name , s in snapshot.items())
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,258 @@
+from base64 import urlsafe_b64decode , urlsafe_b64encode
+from binascii import Error as Base64Error
+from collections import OrderedDict
+from concurrent.futures import Future
+from threading import Lock
+from typing import Callable , List , Union
+import json
+from .blocks import Actions
+from .commons import TextObject
+from .elements import Button
+from .executor import RenderExecutor , RenderQueueFull
+from .lazy import render as render_tree
+
+__all__ = ["VIEW_BLOCK_LIMIT", "BUTTON_VALUE_LIMIT", "encode_cursor", "InvalidCursor", "decode_cursor", "Page", "Paginator"]
+
+VIEW_BLOCK_LIMIT = 100
+BUTTON_VALUE_LIMIT = 2000
+
+
+def encode_cursor(position : list, index : int) -> str:
+    """Encodes a page's start (the data source cursor and the number of rows to skip) and number into a button value."""
+    return urlsafe_b64encode(json.dumps([position, index], separators=(",", ":")).encode()).decode()
+
+
+class InvalidCursor(RuntimeError):
+    """Raised when a button value is not a cursor made by encode_cursor, e.g. a forged interaction payload."""
+
+
+def decode_cursor(cursor : str) -> tuple:
+    """Decodes a cursor made by encode_cursor into the page's start and number.
+
+    Raises:
+        InvalidCursor: cursor is not a valid cursor.
+    """
+    try:
+        position , index = json.loads(urlsafe_b64decode(cursor.encode()))
+        source_cursor , skip = position
+    except (AttributeError, Base64Error, UnicodeError, ValueError, TypeError):
+        raise InvalidCursor(f"Invalid page cursor {str(cursor)[:64]!r}") from None
+    if type(index) is not int or type(skip) is not int or index < 0 or skip < 0:
+        raise InvalidCursor(f"Invalid page cursor {str(cursor)[:64]!r}")
+    return [source_cursor, skip] , index
+
+
+class Page:
+    """A rendered page: its blocks, navigation included, and the cursors of the pages around it."""
+
+    __slots__ = ("blocks", "index", "cursor", "next_cursor", "previous_cursor")
+
+    def __init__(self, blocks : List[dict], index : int, cursor : str, next_cursor : str = None, previous_cursor : str = None):
+        self.blocks = blocks
+        self.index = index
+        self.cursor = cursor
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+
+class Paginator:
+    """Splits the rows of a cursor-paginated data source into pages fitting in a view, with Previous/Next buttons.
+    The pages around the last one served are rendered in the background and cached, so turning a page is served from memory.
+
+    Args:
+        fetch (Callable): called as fetch(cursor, limit), returns (rows, next_cursor). The first cursor is None and
+            next_cursor is None on the last batch. Cursors must be JSON serializable.
+        row_to_blocks (Callable): returns the blocks of a row.
+        max_blocks (int, optional): maximum number of blocks of a page, navigation included. Defaults to 100, the limit of a view.
+        reserved_blocks (int, optional): blocks of the view that are not rows, e.g. a header you add. Defaults to 0.
+        batch_size (int, optional): number of rows fetched at a time. Defaults to 50.
+        action_id (str, optional): prefix of the navigation buttons' action ids, "<action_id>_previous" and "<action_id>_next". Defaults to "page".
+        cache_size (int, optional): number of pages kept in memory. Defaults to 64.
+        prefetch (bool, optional): render the neighbouring pages in the background. Defaults to True.
+        executor (RenderExecutor, optional): executor rendering prefetched pages. Defaults to a dedicated one with 2 workers,
+            shut down by close.
+    """
+
+    def __init__(
+        self,
+        fetch : Callable,
+        row_to_blocks : Callable,
+        max_blocks : int = VIEW_BLOCK_LIMIT,
+        reserved_blocks : int = 0,
+        batch_size : int = 50,
+        action_id : str = "page",
+        cache_size : int = 64,
+        prefetch : bool = True,
+        executor : RenderExecutor = None
+    ):
+        self.fetch = fetch
+        self.row_to_blocks = row_to_blocks
+        self.reserved_blocks = reserved_blocks
+        self.row_budget = max_blocks - reserved_blocks - 1
+        if self.row_budget < 1:
+            raise RuntimeError("max_blocks leaves no room for rows once the navigation is added")
+        self.batch_size = batch_size
+        self.action_id = action_id
+        self.cache_size = cache_size
+        self.prefetch = prefetch
+        self._owns_executor = executor is None and prefetch
+        self.executor = executor or (RenderExecutor(max_workers=2, max_pending=8) if prefetch else None)
+        self.hits = 0
+        self.misses = 0
+        self._starts = {0 : [None, 0]}
+        self._pages = OrderedDict()
+        self._pending = {}
+        self._lock = Lock()
+
+    def _rows(self, position : list):
+        cursor , skip = position
+        while True:
+            rows , next_cursor = self.fetch(cursor, self.batch_size)
+            for i in range(skip, len(rows)):
+                yield rows[i] , [cursor, i]
+            if next_cursor is None:
+                return
+            cursor , skip = next_cursor , 0
+
+    def _navigation(self, previous_cursor : str, next_cursor : str) -> Union[dict, None]:
+        buttons = []
+        if previous_cursor is not None:
+            buttons.append(Button(text=TextObject(type="plain_text", text="Previous"), action_id=f"{self.action_id}_previous", value=previous_cursor))
+        if next_cursor is not None:
+            buttons.append(Button(text=TextObject(type="plain_text", text="Next"), action_id=f"{self.action_id}_next", value=next_cursor, style="primary"))
+        return Actions(elements=buttons, block_id=f"{self.action_id}_navigation") if buttons else None
+
+    def _render(self, position : list, index : int) -> Page:
+        blocks = []
+        next_position = None
+        for row , row_position in self._rows(position):
+            row_blocks = render_tree(self.row_to_blocks(row))
+            if len(blocks) + len(row_blocks) > self.row_budget:
+                if not blocks:
+                    raise RuntimeError(f"A row renders {len(row_blocks)} blocks, more than the {self.row_budget} a page can hold")
+                next_position = row_position
+                break
+            blocks.extend(row_blocks)
+        with self._lock:
+            if next_position is not None:
+                self._starts[index + 1] = next_position
+            previous_position = self._starts.get(index - 1) if index > 0 else None
+        next_cursor = encode_cursor(next_position, index + 1) if next_position is not None else None
+        if previous_position is None and index > 0:
+            # the previous page's start is unknown here (e.g. rendered by another worker), go back to the first page
+            previous_position , previous_index = [None, 0] , 0
+        else:
+            previous_index = index - 1
+        previous_cursor = encode_cursor(previous_position, previous_index) if index > 0 else None
+        for cursor in (next_cursor, previous_cursor):
+            if cursor is not None and len(cursor) > BUTTON_VALUE_LIMIT:
+                raise RuntimeError(f"Encoded cursors are limited to {BUTTON_VALUE_LIMIT} characters, got {len(cursor)}")
+        navigation = self._navigation(previous_cursor, next_cursor)
+        if navigation is not None:
+            blocks.append(navigation)
+        return Page(blocks, index, encode_cursor(position, index), next_cursor, previous_cursor)
+
+    def _load(self, cursor : str) -> Future:
+        """Returns a future of the page at cursor: cached, being rendered, or rendered now in the calling thread."""
+        with self._lock:
+            page = self._pages.get(cursor)
+            if page is not None:
+                self._pages.move_to_end(cursor)
+                self.hits += 1
+                future = Future()
+                future.set_result(page)
+                return future
+            pending = self._pending.get(cursor)
+            if pending is not None:
+                self.hits += 1
+                return pending
+            self.misses += 1
+        future = Future()
+        try:
+            future.set_result(self._store(cursor))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+    def _store(self, cursor : str) -> Page:
+        position , index = decode_cursor(cursor)
+        page = self._render(position, index)
+        with self._lock:
+            self._starts.setdefault(index, position)
+            self._pages[cursor] = page
+            self._pages.move_to_end(cursor)
+            while len(self._pages) > self.cache_size:
+                self._pages.popitem(last=False)
+        return page
+
+    def _prefetch(self, cursor : str):
+        with self._lock:
+            if cursor in self._pages or cursor in self._pending:
+                return
+        try:
+            future = self.executor.submit(self._store, cursor)
+        except RenderQueueFull:
+            return # prefetching is best effort
+        with self._lock:
+            self._pending[cursor] = future
+        future.add_done_callback(lambda _ : self._forget(cursor, future))
+
+    def _forget(self, cursor : str, future : Future):
+        with self._lock:
+            if self._pending.get(cursor) is future:
+                del self._pending[cursor]
+
+    def page(self, cursor : str = None) -> Page:
+        """Returns the page at cursor, the first one if None, and prefetches its neighbours.
+
+        Args:
+            cursor (str, optional): value of a navigation button. Defaults to None.
+
+        Raises:
+            InvalidCursor: cursor was not made by this module.
+        """
+        cursor = cursor or encode_cursor([None, 0], 0)
+        page = self._load(cursor).result()
+        if self.prefetch:
+            for neighbour in (page.next_cursor, page.previous_cursor):
+                if neighbour is not None:
+                    self._prefetch(neighbour)
+        return page
+
+    def view(self, cursor : str = None, **view) -> dict:
+        """Returns a view showing the page at cursor. Other view fields (type, title, callback_id...) are given as keyword arguments,
+        blocks given in view["blocks"] are put before the rows and count as reserved blocks."""
+        header = view.pop("blocks", [])
+        if len(header) > self.reserved_blocks:
+            raise RuntimeError(f"{len(header)} blocks given for {self.reserved_blocks} reserved blocks")
+        page = self.page(cursor)
+        return {"type" : "modal", **view, "blocks" : [*header, *page.blocks]}
+
+    def cursor_from_action(self, body : dict) -> Union[str, None]:
+        """Returns the cursor carried by a navigation button click, or None if the interaction is not one."""
+        for action in body.get("actions", ()):
+            if action.get("action_id") in (f"{self.action_id}_previous", f"{self.action_id}_next"):
+                return action.get("value")
+        return None
+
+    def clear(self):
+        """Drops the cached pages, e.g. after the data changed."""
+        with self._lock:
+            self._pages.clear()
+            self._starts = {0 : [None, 0]}
+
+    def close(self):
+        """Stops prefetching and shuts the dedicated executor down. Pages are still rendered on demand afterwards."""
+        self.prefetch = False
+        if self._owns_executor:
+            self.executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits" : self.hits, "misses" : self.misses, "cached" : len(self._pages), "prefetching" : len(self._pending)}
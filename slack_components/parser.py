@@ -0,0 +1,297 @@
+from codecs import getincrementaldecoder
+from inspect import Parameter , signature
+from json import JSONDecoder , JSONDecodeError
+from typing import Iterator , Union
+from . import blocks , elements
+from .commons import TextObject , OptionObject , OptionGroupObject , ConfirmDialogObject , DispatchActionObject , FilterObject , WorkFlowObject
+
+__all__ = ["BLOCK_TYPES", "ELEMENT_TYPES", "parse_block", "parse_element", "parse_blocks", "parse_message", "iter_messages"]
+
+BLOCK_TYPES = {
+    "actions" : blocks.Actions,
+    "context" : blocks.ContextBlock,
+    "divider" : blocks.Divider,
+    "file" : blocks.FileBlock,
+    "header" : blocks.HeaderBlock,
+    "image" : blocks.ImageBlock,
+    "input" : blocks.InputBlock,
+    "section" : blocks.SectionBlock,
+    "video" : blocks.VideoBlock,
+}
+"""Block builders, keyed by the block type they produce."""
+
+ELEMENT_TYPES = {
+    "button" : elements.Button,
+    "checkboxes" : elements.CheckBoxGroup,
+    "datepicker" : elements.DatePicker,
+    "datetimepicker" : elements.DateTimePicker,
+    "email_text_input" : elements.EmailInput,
+    "image" : elements.Image,
+    "multi_static_select" : elements.MultiSelectStatic,
+    "multi_external_select" : elements.MultiSelectExternal,
+    "multi_users_select" : elements.MultiSelectUsers,
+    "multi_conversations_select" : elements.MultiSelectConversations,
+    "multi_channels_select" : elements.MultiSelectChannels,
+    "number_input" : elements.NumberInput,
+    "overflow" : elements.OverflowMenu,
+    "plain_text_input" : elements.PlainTextInput,
+    "radio_buttons" : elements.RadioButtonGroup,
+    "static_select" : elements.SelectStatic,
+    "external_select" : elements.SelectExternal,
+    "users_select" : elements.SelectUsers,
+    "conversations_select" : elements.SelectConversations,
+    "channels_select" : elements.SelectChannels,
+    "timepicker" : elements.TimePicker,
+    "url_text_input" : elements.URLInput,
+    "workflow_button" : elements.WorkflowButton,
+}
+"""Element builders, keyed by the element type they produce."""
+
+_TEXT_FIELDS = {"text", "label", "hint", "placeholder", "title", "description", "accessibility_label"}
+_MODEL_FIELDS = {
+    "confirm" : ConfirmDialogObject,
+    "initial_option" : OptionObject,
+    "dispatch_action_config" : DispatchActionObject,
+    "filter" : FilterObject,
+    "workflow" : WorkFlowObject,
+}
+_MODEL_LIST_FIELDS = {
+    "options" : OptionObject,
+    "initial_options" : OptionObject,
+    "option_groups" : OptionGroupObject,
+}
+_parameters = {}
+
+
+def _validated(model, value):
+    """Validates value against model, keeping the fields the model does not know about."""
+    if not isinstance(value, dict):
+        return value
+    return {**value, **model.parse_obj(value).dict(exclude_unset=True)}
+
+
+def _convert(key : str, value, strict : bool):
+    if key in ("accessory", "element"):
+        return parse_element(value, strict)
+    if key == "elements" and isinstance(value, list):
+        return [parse_element(element, strict) for element in value]
+    if key == "fields" and isinstance(value, list):
+        return [_validated(TextObject, field) for field in value]
+    if key in _TEXT_FIELDS and isinstance(value, dict) and "type" in value:
+        return _validated(TextObject, value)
+    if key in _MODEL_FIELDS:
+        return _validated(_MODEL_FIELDS[key], value)
+    if key in _MODEL_LIST_FIELDS and isinstance(value, list):
+        return [_validated(_MODEL_LIST_FIELDS[key], item) for item in value]
+    return value
+
+
+def _not_rebuilt(data : dict, builder, exc : Exception, strict : bool):
+    """Returns data as is, or raises in strict mode, when a valid Slack object can not be expressed by its builder
+    (e.g. an image block with a slack_file instead of an image_url) or an object is invalid."""
+    if not strict:
+        return data
+    name = data.get("block_id") or data.get("action_id")
+    described = f"{data.get('type')!r} object" + (f" {name!r}" if name else "")
+    raise RuntimeError(f"Can not rebuild the {described} with {builder.__name__}: {exc}") from exc
+
+
+def _parse(data : dict, table : dict, strict : bool):
+    builder = table.get(data.get("type")) if isinstance(data, dict) else None
+    if builder is None:
+        if strict:
+            raise RuntimeError(f"No builder produces objects of type {data.get('type') if isinstance(data, dict) else data!r}")
+        return data
+    parameters = _parameters.get(builder)
+    if parameters is None:
+        # keyword-only parameters are the deprecated names of renamed arguments
+        parameters = _parameters[builder] = frozenset(
+            name for name , parameter in signature(builder).parameters.items() if parameter.kind is not Parameter.KEYWORD_ONLY
+        )
+    kwargs , extra = {} , {}
+    for key , value in data.items():
+        if key == "type":
+            continue
+        try:
+            value = _convert(key, value, strict)
+        except ValueError as exc:
+            # a composition object failing its model, nested objects raise their own errors
+            return _not_rebuilt(data, builder, exc, strict)
+        if key in parameters:
+            kwargs[key] = value
+        else:
+            extra[key] = value
+    try:
+        res = builder(**kwargs)
+    except (TypeError, RuntimeError) as exc:
+        return _not_rebuilt(data, builder, exc, strict)
+    res.update(extra)
+    return res
+
+
+def parse_block(data : dict, strict : bool = False) -> dict:
+    """Rebuilds a block from its JSON form through the matching builder.
+    Composition objects are validated against their models, fields the builders do not know about are kept as is
+    and the builders' defaults are filled in.
+
+    Args:
+        data (dict): the block, as found in a message or view payload.
+        strict (bool, optional): raise a RuntimeError on unknown block or element types and on objects their builder can not rebuild,
+            instead of keeping them as is. Defaults to False.
+    """
+    return _parse(data, BLOCK_TYPES, strict)
+
+
+def parse_element(data : dict, strict : bool = False) -> dict:
+    """Rebuilds a block element (or a context block text object) from its JSON form through the matching builder.
+
+    Args:
+        data (dict): the element, as found in a block.
+        strict (bool, optional): raise a RuntimeError on unknown element types and on objects their builder can not rebuild,
+            instead of keeping them as is. Defaults to False.
+    """
+    if isinstance(data, dict) and data.get("type") in ("plain_text", "mrkdwn"):
+        try:
+            return _validated(TextObject, data)
+        except ValueError as exc:
+            return _not_rebuilt(data, TextObject, exc, strict)
+    return _parse(data, ELEMENT_TYPES, strict)
+
+
+def parse_blocks(data : list, strict : bool = False) -> list:
+    """Rebuilds a list of blocks from their JSON form. See parse_block."""
+    return [parse_block(block, strict) for block in data]
+
+
+def parse_message(message : dict, strict : bool = False) -> dict:
+    """Returns a copy of a message (or a view) where the blocks, including the attachments' blocks, are rebuilt. See parse_block."""
+    message = dict(message)
+    if isinstance(message.get("blocks"), list):
+        message["blocks"] = parse_blocks(message["blocks"], strict)
+    if isinstance(message.get("attachments"), list):
+        message["attachments"] = [
+            dict(attachment, blocks=parse_blocks(attachment["blocks"], strict))
+            if isinstance(attachment.get("blocks"), list) else attachment
+            for attachment in message["attachments"]
+        ]
+    return message
+
+
+def _chunks(source, chunk_size : int) -> Iterator[str]:
+    if isinstance(source, str):
+        with open(source, "rb") as fp:
+            yield from _chunks(fp, chunk_size)
+        return
+    decoder = getincrementaldecoder("utf-8")()
+    if hasattr(source, "read"):
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk if isinstance(chunk, str) else decoder.decode(chunk)
+    else:
+        # bytes, bytearray, memoryview or mmap: only one chunk is decoded at a time
+        view = memoryview(source)
+        for start in range(0, len(view), chunk_size):
+            yield decoder.decode(view[start:start + chunk_size])
+    yield decoder.decode(b"", final=True)
+
+
+_DELIMITERS = frozenset(" \t\r\n,:]}")
+
+
+class _JsonStream:
+    """Decodes JSON values one at a time from a stream of text chunks."""
+
+    def __init__(self, chunks : Iterator[str]):
+        self.chunks = chunks
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = JSONDecoder()
+
+    def _fill(self, min_size : int = 0) -> bool:
+        """Reads chunks until the unread part of the buffer is larger than min_size, returns False at the end of the stream."""
+        self.buffer = self.buffer[self.pos:]
+        self.pos = 0
+        read = False
+        while not self.eof and (not read or len(self.buffer) <= min_size):
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                self.eof = True
+            else:
+                self.buffer += chunk
+                read = True
+        return read
+
+    def peek(self) -> str:
+        """Returns the next non whitespace character without consuming it, or an empty string at the end of the stream."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char : str):
+        if self.peek() != char:
+            raise RuntimeError(f"Expected {char!r} at offset {self.pos} of the JSON stream")
+        self.pos += 1
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value , end = self.decoder.raw_decode(self.buffer, self.pos)
+            except JSONDecodeError:
+                # the value is incomplete: read at least as much again as what is buffered
+                if not self._fill(2 * (len(self.buffer) - self.pos)):
+                    raise
+                continue
+            if not isinstance(value, (dict, list, str)) and (end == len(self.buffer) or self.buffer[end] not in _DELIMITERS) and self._fill():
+                continue # a number or a literal may go on in the next chunk, e.g. "1." then "25"
+            self.pos = end
+            return value
+
+    def array(self) -> Iterator:
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+            self.expect("]")
+            return
+
+
+def iter_messages(source : Union[str, bytes, object], key : str = "messages", parse : bool = True, strict : bool = False, chunk_size : int = 1 << 16) -> Iterator[dict]:
+    """Yields the messages of a JSON export one at a time, holding a single message in memory.
+
+    Args:
+        source (str | bytes | file): path of the export, an open file (text or binary), or a bytes-like object such as an mmap.
+        key (str, optional): when the document is an object, such as a conversations.history response, the key holding the messages.
+            Documents that are an array of messages are read directly. Defaults to "messages".
+        parse (bool, optional): rebuild the blocks of each message through the builders, see parse_message. Defaults to True.
+        strict (bool, optional): raise a RuntimeError on unknown block or element types and on objects their builder can not rebuild.
+            Defaults to False.
+        chunk_size (int, optional): number of bytes read at a time. Defaults to 64KiB.
+    """
+    stream = _JsonStream(_chunks(source, chunk_size))
+    if stream.peek() == "{":
+        stream.pos += 1
+        while stream.peek() != "}":
+            name = stream.value()
+            stream.expect(":")
+            if name == key and stream.peek() == "[":
+                break
+            stream.value()
+            if stream.peek() == ",":
+                stream.pos += 1
+        else:
+            return
+    for message in stream.array():
+        yield parse_message(message, strict) if parse else message
@@ -0,0 +1,166 @@
+from typing import Sequence , Union
+from pydantic import BaseModel
+
+__all__ = ["PersistentDict", "PersistentList", "freeze", "thaw", "set_in", "get_in"]
+
+
+def _immutable(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} is immutable, use set_in to get an updated copy")
+
+
+class PersistentDict(dict):
+    """An immutable Slack object. Updates return a new object sharing every untouched value.
+
+    It is a dict subclass, so it serializes like the output of any builder.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __getattr__(self, key : str):
+        try:
+            return self[key]
+        except KeyError:
+            raise AttributeError(key) from None
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def set(self, key : str, value) -> "PersistentDict":
+        """Returns a copy of this object where key is set to value."""
+        items = dict(self)
+        items[key] = freeze(value)
+        return PersistentDict(items)
+
+    def remove(self, key : str) -> "PersistentDict":
+        """Returns a copy of this object without key."""
+        items = dict(self)
+        del items[key]
+        return PersistentDict(items)
+
+    def set_in(self, path : Union[str, Sequence], value) -> "PersistentDict":
+        """Returns a copy of this object where the value at path is replaced. See set_in."""
+        return set_in(self, path, value)
+
+
+class PersistentList(tuple):
+    """An immutable list of Slack objects, such as the blocks of a message.
+
+    It is a tuple subclass, so it serializes as a JSON array. It compares equal to lists and tuples with equal items,
+    so a frozen tree is equal to the tree it was frozen from.
+    """
+
+    __slots__ = ()
+
+    def __eq__(self, other):
+        if isinstance(other, list):
+            return len(self) == len(other) and all(a == b for a , b in zip(self, other))
+        return tuple.__eq__(self, other)
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = tuple.__hash__
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def set(self, index : int, value) -> "PersistentList":
+        """Returns a copy of this list where the item at index is replaced by value."""
+        items = list(self)
+        items[index] = freeze(value)
+        return PersistentList(items)
+
+    def insert(self, index : int, value) -> "PersistentList":
+        """Returns a copy of this list with value inserted before index."""
+        items = list(self)
+        items.insert(index, freeze(value))
+        return PersistentList(items)
+
+    def append(self, value) -> "PersistentList":
+        """Returns a copy of this list with value appended."""
+        return PersistentList((*self, freeze(value)))
+
+    def remove(self, index : int) -> "PersistentList":
+        """Returns a copy of this list without the item at index."""
+        return PersistentList(self[:index] + self[index + 1:])
+
+    def set_in(self, path : Union[str, Sequence], value) -> "PersistentList":
+        """Returns a copy of this list where the value at path is replaced. See set_in."""
+        return set_in(self, path, value)
+
+
+def freeze(value):
+    """Converts a Slack object in the dict form (dicts, lists and pydantic models) into its persistent form.
+    Values already persistent are returned as is, so they are shared rather than copied."""
+    if isinstance(value, (PersistentDict, PersistentList)):
+        return value
+    if isinstance(value, BaseModel):
+        value = value.dict()
+    if isinstance(value, dict):
+        return PersistentDict({k : freeze(v) for k , v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return PersistentList(freeze(v) for v in value)
+    return value
+
+
+def thaw(value):
+    """Converts a persistent Slack object back into mutable dicts and lists."""
+    if isinstance(value, dict):
+        return {k : thaw(v) for k , v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(v) for v in value]
+    return value
+
+
+def _split_path(path : Union[str, Sequence]) -> tuple:
+    return tuple(path.split(".")) if isinstance(path, str) else tuple(path)
+
+
+def _step(node, step):
+    """Digit steps of a string path are list indices in lists, and keys everywhere else (block ids, state keys...)."""
+    if isinstance(step, str) and isinstance(node, (list, tuple)) and step.lstrip("-").isdigit():
+        return int(step)
+    return step
+
+
+def set_in(tree, path : Union[str, Sequence], value):
+    """Returns a copy of tree where the value at path is replaced.
+    Only the objects along the path are copied, every other subtree is shared with the original tree.
+
+    Args:
+        tree (PersistentDict | PersistentList): tree to update. Mutable trees are frozen first.
+        path (str | Sequence): keys and list indices leading to the value, e.g. (3, "accessory", "value") or "3.accessory.value".
+        value: new value.
+    """
+    steps = _split_path(path)
+    if not steps:
+        return freeze(value)
+    node = freeze(tree)
+    head , rest = _step(node, steps[0]) , steps[1:]
+    if rest:
+        child = node[head] if isinstance(node, PersistentList) else node.get(head, PersistentDict())
+        value = set_in(child, rest, value)
+    return node.set(head, value)
+
+
+def get_in(tree, path : Union[str, Sequence], default = None):
+    """Returns the value at path in tree, or default if it does not exist."""
+    for step in _split_path(path):
+        try:
+            tree = tree[_step(tree, step)]
+        except (KeyError, IndexError, TypeError):
+            return default
+    return tree
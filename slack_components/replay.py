@@ -0,0 +1,273 @@
+"""Records interaction payloads to a compact, sanitized log and replays them through handlers to measure them offline.
+
+Usage: python -m slack_components.replay interactions.jsonl.gz my_app.handlers:HANDLERS --rate 50
+"""
+from hashlib import blake2b
+from importlib import import_module
+from threading import Lock
+from time import monotonic , perf_counter , sleep
+from typing import Callable , Dict , Iterable , Iterator , Mapping , Union
+import argparse
+import gzip
+import json
+import re
+import tracemalloc
+from .metrics import BuilderStats
+
+__all__ = ["INTERACTION_TYPES", "PayloadRecorder", "iter_recorded", "HandlerReport", "replay", "format_report"]
+
+INTERACTION_TYPES = ("block_actions", "block_suggestion", "view_submission")
+
+_DROPPED_KEYS = {"token", "response_url", "response_urls", "trigger_id", "hash"}
+_IDENTIFIER_KEYS = {
+    "id", "user_id", "team_id", "channel_id", "enterprise_id", "app_installed_team_id", "bot_id", "app_id", "view_id", "root_view_id",
+    "previous_view_id", "user", "users", "channel", "team", "parent_user_id", "selected_user", "selected_users", "selected_channel",
+    "selected_channels", "selected_conversation", "selected_conversations", "initial_user", "initial_users", "initial_channel",
+    "initial_channels", "initial_conversation", "initial_conversations",
+}
+"""Keys holding Slack ids. Other strings are app-defined (button values, option values...) and kept, however they look."""
+_NAME_KEYS = {"name", "username", "real_name", "display_name", "domain", "email"}
+_KEPT_KEYS = {"type", "action_id", "block_id", "callback_id", "external_id", "action_ts", "ts", "message_ts"}
+_TEXT_INPUTS = {"plain_text_input", "email_text_input", "url_text_input", "number_input"}
+_CONTENT_KEYS = {"message", "rich_text_value"}
+_IDENTIFIER = re.compile(r"^(?=.*\d)[UWBTCGDEAV][A-Z0-9]{6,}$")
+
+
+def _mask(value : str) -> str:
+    return "x" * len(value)
+
+
+class PayloadRecorder:
+    """Appends interaction payloads to a gzipped JSON lines log, with the time they were received.
+
+    Payloads are sanitized before being written: tokens, trigger ids and response urls are dropped and
+    Slack ids and names are replaced by stable pseudonyms. Unless disabled, user content is masked with strings of the same length:
+    the values of text inputs (in the view state or dispatched as actions), block_suggestion queries, the messages the interaction
+    comes from and the views' private_metadata. Values the app defined, such as button and selected option values, are kept
+    so replayed handlers take the same code paths.
+
+    Args:
+        path (str): log file, appended to if it exists.
+        salt (str | bytes): secret mixed in the pseudonyms, so ids can not be recovered by hashing known ids. Keep it out of the log.
+        types (Iterable[str], optional): payload types to record. Defaults to INTERACTION_TYPES.
+        mask_values (bool, optional): mask user content. Disable it only when replays need the exact texts. Defaults to True.
+    """
+
+    def __init__(self, path : str, salt : Union[str, bytes], types : Iterable[str] = INTERACTION_TYPES, mask_values : bool = True):
+        if not salt:
+            raise RuntimeError("A secret salt is required, unsalted pseudonyms can be reversed by hashing known ids")
+        salt = salt.encode() if isinstance(salt, str) else bytes(salt)
+        self.path = path
+        self.types = frozenset(types)
+        # blake2b keys are at most 64 bytes
+        self.salt = salt if len(salt) <= 64 else blake2b(salt).digest()
+        self.mask_values = mask_values
+        self.recorded = 0
+        self._file = gzip.open(path, "at", encoding="utf-8")
+        self._started = monotonic()
+        self._lock = Lock()
+
+    def _pseudonym(self, value : str) -> str:
+        digest = blake2b(value.encode(), key=self.salt, digest_size=6).hexdigest().upper()
+        return value[0] + digest if _IDENTIFIER.match(value) else "anon-" + digest.lower()
+
+    def sanitize(self, payload : dict) -> dict:
+        """Returns a sanitized copy of a payload."""
+        clean = self._clean(payload, None, False)
+        if self.mask_values and clean.get("type") == "block_suggestion" and isinstance(clean.get("value"), str):
+            clean["value"] = _mask(clean["value"]) # the query typed in the menu
+        return clean
+
+    def _clean(self, value, key : Union[str, None], masked : bool):
+        """masked is True under user content (messages, rich text, the value of a text input), where every string is masked."""
+        if isinstance(value, dict):
+            text_input = value.get("type") in _TEXT_INPUTS
+            return {
+                k : self._clean(v, k, masked or self._masks(k, text_input))
+                for k , v in value.items() if k not in _DROPPED_KEYS
+            }
+        if isinstance(value, list):
+            return [self._clean(v, key, masked) for v in value]
+        if isinstance(value, str) and key not in _KEPT_KEYS:
+            if key in _NAME_KEYS or key in _IDENTIFIER_KEYS:
+                return self._pseudonym(value)
+            if masked or (self.mask_values and key == "private_metadata"):
+                return _mask(value)
+        return value
+
+    def _masks(self, key : str, text_input : bool) -> bool:
+        return self.mask_values and (key in _CONTENT_KEYS or (text_input and key == "value"))
+
+    def record(self, payload : dict) -> bool:
+        """Writes payload to the log if its type is recorded. Returns whether it was."""
+        if payload.get("type") not in self.types:
+            return False
+        line = json.dumps({"t" : round(monotonic() - self._started, 6), "p" : self.sanitize(payload)}, separators=(",", ":"))
+        with self._lock:
+            self._file.write(line + "\n")
+            self.recorded += 1
+        return True
+
+    def bolt_middleware(self, body : dict, next : Callable):
+        """A Bolt global middleware recording every interaction: app.use(recorder.bolt_middleware)."""
+        self.record(body)
+        return next()
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def iter_recorded(path : str) -> Iterator[tuple]:
+    """Yields the (offset in seconds, payload) pairs of a log written by PayloadRecorder."""
+    with gzip.open(path, "rt", encoding="utf-8") as fp:
+        for line in fp:
+            if line.strip():
+                entry = json.loads(line)
+                yield entry["t"] , entry["p"]
+
+
+class HandlerReport:
+    """Latencies and allocations measured for one handler during a replay."""
+
+    def __init__(self, name : str):
+        self.name = name
+        self.latencies = BuilderStats(name, sample_size=1 << 20)
+        self.errors = 0
+        self.allocated = 0
+        self.peak = 0
+
+    def summary(self) -> dict:
+        calls = self.latencies.calls
+        return {
+            "calls" : calls,
+            "errors" : self.errors,
+            "p50_ms" : self.latencies.percentile(50) * 1000,
+            "p95_ms" : self.latencies.percentile(95) * 1000,
+            "p99_ms" : self.latencies.percentile(99) * 1000,
+            "max_ms" : max(self.latencies.samples, default=0) * 1000,
+            "allocated_bytes_per_call" : self.allocated / calls if calls else 0,
+            "peak_bytes" : self.peak,
+        }
+
+
+def _handler_for(handlers : Union[Mapping, Callable], payload : dict) -> tuple:
+    if callable(handlers):
+        return getattr(handlers, "__name__", "handler") , handlers
+    kind = payload.get("type")
+    if kind == "block_actions" and payload.get("actions"):
+        action = payload["actions"][0].get("action_id")
+        if action in handlers:
+            return action , handlers[action]
+    if kind == "view_submission":
+        callback = payload.get("view", {}).get("callback_id")
+        if callback in handlers:
+            return callback , handlers[callback]
+    if kind == "block_suggestion" and payload.get("action_id") in handlers:
+        return payload["action_id"] , handlers[payload["action_id"]]
+    return kind , handlers.get(kind)
+
+
+def replay(
+    payloads : Union[str, Iterable],
+    handlers : Union[Mapping, Callable],
+    rate : float = None,
+    speed : float = None,
+    repeat : int = 1,
+    track_allocations : bool = True
+) -> Dict[str, dict]:
+    """Feeds recorded payloads to handlers and measures each call.
+
+    Args:
+        payloads (str | Iterable): a log written by PayloadRecorder, or an iterable of (offset, payload) pairs.
+        handlers (Mapping | Callable): a single handler, or handlers keyed by action_id, view callback_id or payload type,
+            tried in that order. Each one is called with the payload. Payloads without a handler are skipped.
+        rate (float, optional): payloads per second. Defaults to None, as fast as possible.
+        speed (float, optional): replay with the recorded timing, sped up by this factor. Overrides rate. Defaults to None.
+        repeat (int, optional): number of times the log is replayed. An iterable that is not a log is read once and kept in memory
+            for the next cycles. Defaults to 1.
+        track_allocations (bool, optional): measure the memory each call allocates with tracemalloc, which slows calls down. Defaults to True.
+
+    Returns:
+        Dict[str, dict]: a summary per handler: calls, errors, latency percentiles in milliseconds and allocations.
+    """
+    reports : Dict[str, HandlerReport] = {}
+    if not isinstance(payloads, str) and repeat > 1:
+        payloads = list(payloads) # a generator would be exhausted after the first cycle
+    tracing = track_allocations and not tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.start()
+    try:
+        started = monotonic()
+        sent = 0
+        for cycle in range(repeat):
+            entries = iter_recorded(payloads) if isinstance(payloads, str) else payloads
+            cycle_start = monotonic()
+            for offset , payload in entries:
+                if speed:
+                    delay = cycle_start + offset / speed - monotonic()
+                elif rate:
+                    delay = started + sent / rate - monotonic()
+                else:
+                    delay = 0
+                if delay > 0:
+                    sleep(delay)
+                name , handler = _handler_for(handlers, payload)
+                if handler is None:
+                    continue
+                report = reports.get(name)
+                if report is None:
+                    report = reports[name] = HandlerReport(name)
+                if track_allocations:
+                    tracemalloc.reset_peak()
+                    before , _ = tracemalloc.get_traced_memory()
+                call_start = perf_counter()
+                try:
+                    handler(payload)
+                except Exception:
+                    report.errors += 1
+                report.latencies.add(perf_counter() - call_start)
+                if track_allocations:
+                    after , peak = tracemalloc.get_traced_memory()
+                    report.allocated += max(0, peak - before)
+                    report.peak = max(report.peak, peak - before)
+                sent += 1
+    finally:
+        if tracing:
+            tracemalloc.stop()
+    return {name : report.summary() for name , report in reports.items()}
+
+
+def format_report(summary : Dict[str, dict]) -> str:
+    lines = [f"{'handler':30} {'calls':>7} {'errors':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8} {'bytes/call':>11}"]
+    for name , s in sorted(summary.items()):
+        lines.append(
+            f"{str(name)[:30]:30} {s['calls']:7} {s['errors']:6} {s['p50_ms']:8.3f} {s['p95_ms']:8.3f} {s['p99_ms']:8.3f} "
+            f"{s['max_ms']:8.3f} {s['allocated_bytes_per_call']:11.0f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description="Replays recorded Slack interactions through handlers.")
+    parser.add_argument("log", help="log written by PayloadRecorder")
+    parser.add_argument("handlers", help="module:attribute of a handler or of a mapping of handlers")
+    parser.add_argument("--rate", type=float, default=None, help="payloads per second, as fast as possible by default")
+    parser.add_argument("--speed", type=float, default=None, help="replay with the recorded timing, sped up by this factor")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--no-allocations", action="store_true", help="do not trace allocations")
+    args = parser.parse_args(argv)
+    module , _ , attribute = args.handlers.partition(":")
+    handlers = getattr(import_module(module), attribute)
+    summary = replay(args.log, handlers, rate=args.rate, speed=args.speed, repeat=args.repeat, track_allocations=not args.no_allocations)
+    print(format_report(summary))
+
+
+if __name__ == "__main__":
+    main()
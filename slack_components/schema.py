@@ -0,0 +1,853 @@
+from ast import literal_eval
+from textwrap import wrap
+from inspect import cleandoc
+from linecache import cache as _linecache
+from pathlib import Path
+from typing import Callable , Dict , List , Literal , NamedTuple , Tuple , get_args , get_origin
+from warnings import warn
+from pydantic import BaseModel
+from .commons import TextObject , OptionObject , ConfirmDialogObject , DispatchActionObject , OptionGroupObject , WorkFlowObject
+from .metrics import instrumentation
+
+__all__ = ["REQUIRED", "Field", "Component", "generate", "module_source", "BLOCKS", "ELEMENTS", "validate"]
+
+REQUIRED = object()
+"""Default of the fields that must be given."""
+
+
+class Field(NamedTuple):
+    """An argument of a builder, emitted under the same key."""
+    name : str
+    annotation : object
+    default : object = REQUIRED
+
+
+class Component(NamedTuple):
+    """Describes a builder: its name, the Slack type it emits and its arguments in signature order."""
+    name : str
+    type : str
+    fields : Tuple[Field, ...]
+    doc : str
+    order : Tuple[str, ...] = None
+    """Order of the keys in the output when it differs from the signature."""
+    check : Tuple[str, str] = None
+    """A condition on the arguments and the message of the RuntimeError raised when it holds."""
+    renamed : Tuple[Tuple[str, str], ...] = ()
+    """Former names of arguments as (old, new) pairs, still accepted as keywords with a DeprecationWarning."""
+
+
+def _annotation(annotation , names : dict) -> str:
+    """Writes an annotation in the generated source, collecting the names it needs into names."""
+    origin , args = get_origin(annotation) , get_args(annotation)
+    if origin is Literal:
+        names["Literal"] = Literal
+        return f"Literal[{', '.join(repr(arg) for arg in args)}]"
+    if annotation is List or origin is list:
+        names["List"] = List
+        return f"List[{', '.join(_annotation(arg, names) for arg in args)}]" if args else "List"
+    if isinstance(annotation, type):
+        if annotation.__module__ != "builtins":
+            names[annotation.__name__] = annotation
+        return annotation.__name__
+    raise RuntimeError(f"The annotation {annotation!r} can not be written in the generated source")
+
+
+def _parameter(component : Component, field : Field, names : dict) -> str:
+    parameter = f"{field.name} : {_annotation(field.annotation, names)}"
+    if field.default is REQUIRED:
+        return parameter
+    try:
+        literal = literal_eval(repr(field.default)) == field.default
+    except (ValueError, SyntaxError):
+        literal = False
+    if not literal:
+        raise RuntimeError(f"The default of {component.name}.{field.name} can not be written in the generated source")
+    return f"{parameter} = {field.default!r}"
+
+
+def _source(component : Component, names : dict = None) -> str:
+    """Writes the source of a builder, collecting the names its annotations need into names."""
+    names = {} if names is None else names
+    fields = {field.name : field for field in component.fields}
+    parameters = [_parameter(component, field, names) for field in component.fields]
+    if component.renamed:
+        parameters += ["*", *(_parameter(component, Field(old, fields[new].annotation, None), names) for old , new in component.renamed)]
+    if '"""' in component.doc or "\\" in component.doc:
+        raise RuntimeError(f"The doc of {component.name} can not be written in the generated source")
+    doc = "\n".join(("    " + line).rstrip() for line in cleandoc(component.doc).splitlines()).lstrip()
+    doc += "\n    " if "\n" in doc else ""
+    lines = [f"def {component.name}(", *(f"    {parameter}," for parameter in parameters), "):", f'    """{doc}"""']
+    for old , new in component.renamed:
+        message = f"{component.name}({old}=...) is deprecated, use {new}"
+        lines += [
+            f"    if {old} is not None:",
+            f"        _warn({message!r}, DeprecationWarning, stacklevel=2)",
+            f"        if {new} is None:",
+            f"            {new} = {old}",
+        ]
+    if component.check is not None:
+        condition , message = component.check
+        lines += [f"    if {condition}:", f"        raise RuntimeError({message!r})"]
+    lines += [
+        f"    _token = _instrumentation.start({component.name!r}) if _instrumentation.enabled else None",
+        f"    _res = {{'type': {component.type!r}}}",
+    ]
+    for name in component.order or fields:
+        if fields[name].annotation in (bool, int):
+            value = name
+        else:
+            # models are converted inline, anything else (dicts, lists, thunks) is kept as is
+            value = f"{name}.dict() if isinstance({name}, _BaseModel) else {name}"
+        lines += [f"    if {name} is not None:", f"        _res[{name!r}] = {value}"]
+    lines += [
+        "    if _token is not None:",
+        f"        _instrumentation.record({component.name!r}, _token, _res)",
+        "    return _res",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def generate(components : Tuple[Component, ...], module : str) -> Dict[str, Callable]:
+    """Compiles a specialized builder for every component: it only emits the keys that were given
+    and converts models inline, with the output ObjectWrapper would give.
+
+    Args:
+        components (Tuple[Component, ...]): the schema of the builders.
+        module (str): name of the module the builders belong to.
+    """
+    builders = {}
+    for component in components:
+        names = {}
+        source = _source(component, names)
+        filename = f"<{module}.{component.name}>"
+        # registered so tracebacks can show the generated code
+        _linecache[filename] = (len(source), None, source.splitlines(True), filename)
+        namespace = {**names, "__name__" : module, "_instrumentation" : instrumentation, "_BaseModel" : BaseModel, "_warn" : warn}
+        exec(compile(source, filename, "exec"), namespace)
+        builder = namespace[component.name]
+        builder.__source__ = source
+        builders[component.name] = builder
+    return builders
+
+
+def module_source(components : Tuple[Component, ...], doc : str) -> str:
+    """Writes a module defining the builders of components, as checked in for the blocks and elements modules
+    so IDEs and type checkers see plain functions. generate compiles the same builders at run time.
+
+    Args:
+        components (Tuple[Component, ...]): the schema of the builders.
+        doc (str): first line of the module docstring.
+    """
+    names = {}
+    sources = [_source(component, names) for component in components]
+    typing = sorted(name for name in names if name in ("List", "Literal"))
+    models = sorted(name for name in names if name not in typing)
+    for name in models:
+        if names[name].__module__ != TextObject.__module__:
+            raise RuntimeError(f"{name} is not defined in the commons module")
+    imports = [f"from typing import {' , '.join(typing)}"] if typing else []
+    imports.append("from warnings import warn as _warn") if any(component.renamed for component in components) else None
+    imports += ["from pydantic import BaseModel as _BaseModel"]
+    imports += [f"from .commons import {' , '.join(models)}"] if models else []
+    imports += ["from .metrics import instrumentation as _instrumentation"]
+    exported = wrap(", ".join(f'"{component.name}"' for component in components), 120, break_long_words=False, break_on_hyphens=False)
+    header = [
+        f'"""{doc}',
+        "",
+        "Generated from the schema in schema.py by schema.write_modules(): edit the schema, not this file.",
+        '"""',
+        *imports,
+        "",
+        "__all__ = [",
+        *(f"    {line}" for line in exported),
+        "]",
+    ]
+    return "\n".join(header) + "\n\n\n" + "\n\n".join(sources)
+
+
+_MODULES = {"blocks" : ("BLOCKS", "Builders of Slack's layout blocks."), "elements" : ("ELEMENTS", "Builders of Slack's block elements.")}
+"""Checked in modules generated from the schema: the schema each one is generated from and its docstring."""
+
+
+BLOCKS = (
+    Component(
+        "Actions", "actions",
+        fields=(
+            Field("elements", List),
+            Field("block_id", str, None),
+        ),
+        doc="""A block that is used to hold interactive elements.
+
+        Args:
+            elements (List): An array of interactive element objects - buttons, select menus,
+                             overflow menus, or date pickers. There is a maximum of 25 elements
+                             in each action block.
+            block_id (str, optional): A string acting as a unique identifier for a block. Defaults to None.
+        """,
+    ),
+    Component(
+        "ContextBlock", "context",
+        fields=(
+            Field("elements", List),
+            Field("block_id", str, None),
+        ),
+        doc="""Displays message context, which can include both images and text.
+
+        Args:
+            elements (List): An array of interactive element objects - buttons, select menus, 
+                            overflow menus, or date pickers. There is a maximum of 25 elements
+                            in each action block.
+            block_id (str, optional): A string acting as a unique identifier for a block.
+                                      Defaults to None.
+        """,
+    ),
+    Component(
+        "Divider", "divider",
+        fields=(
+            Field("block_id", str, None),
+        ),
+        doc="""A content divider, like an <hr>, to split up different blocks inside of a message.
+        Args:
+            block_id (str, optional): A string acting as a unique identifier for a block. Defaults to None.
+        """,
+    ),
+    Component(
+        "FileBlock", "file",
+        fields=(
+            Field("external_id", str),
+            Field("source", str, "remote"),
+            Field("block_id", str, None),
+        ),
+        doc="""Displays a remote file. You can't add this block to app surfaces directly, but it will show up when retrieving messages that contain remote files.
+
+        Args:
+            external_id (str): The external unique ID for this file.
+            source (str, optional): At the moment, source will always be remote for a remote file.
+            block_id (str, optional): A string acting as a unique identifier for a block. Defaults to None.
+        """,
+    ),
+    Component(
+        "HeaderBlock", "header",
+        fields=(
+            Field("text", TextObject),
+            Field("block_id", str, None),
+        ),
+        doc="""A header is a plain-text block that displays in a larger, bold font. Use it to delineate between different groups of content in your app's surfaces.  
+
+        Args:
+            text (TextObject) : text object to display
+            block_id (str, optional): A string acting as a unique identifier for a block. Defaults to None.
+        """,
+    ),
+    Component(
+        "ImageBlock", "image",
+        fields=(
+            Field("image_url", str),
+            Field("alt_text", str),
+            Field("title", TextObject, None),
+            Field("block_id", str, None),
+        ),
+        order=("image_url", "alt_text", "block_id", "title"),
+        doc="""A simple image block, designed to make those cat photos really pop.
+
+        Args:
+            image_url (str): The URL of the image to be displayed. Maximum length for this field is 3000 characters.
+            alt_text (str): A plain-text summary of the image. This should not contain any markup. Maximum length for this field is 2000 characters.
+            title (TextObject, optional): title for the image. Defaults to None.
+            block_id (str, optional): A string acting as a unique identifier for a block. Defaults to None.
+        """,
+    ),
+    Component(
+        "InputBlock", "input",
+        fields=(
+            Field("label", str),
+            Field("element", object),
+            Field("dispatch_action", bool, False),
+            Field("block_id", str, None),
+            Field("hint", TextObject, None),
+            Field("optional", bool, False),
+        ),
+        order=("element", "label", "dispatch_action", "block_id", "hint", "optional"),
+        doc="""A block that collects information from users - it can hold a plain-text input element, a checkbox element, a radio button element, a select menu element, a multi-select menu element, or a datepicker.
+
+        Args:
+            label (str): A label that appears above an input element in the form of a text object that must have type of plain_text. Maximum length for the text in this field is 2000 characters.
+            element (object): A plain-text input element, a checkbox element, a radio button element, a select menu element, a multi-select menu element, or a datepicker.
+            dispatch_action (bool, optional): A boolean that indicates whether or not the use of elements in this block should dispatch a block_actions payload. Defaults to false. Defaults to False.
+            block_id (str, optional):A string acting as a unique identifier for a block. If not specified, one will be generated. Maximum length for this field is 255 characters. block_id should be unique for each message or view and each iteration of a message or view. If a message or view is updated, use a new block_id. Defaults to None.
+            hint (TextObject, optional): An optional hint that appears below an input element in a lighter grey. It must be a text object with a type of plain_text. Maximum length for the text in this field is 2000 characters. Defaults to None.
+            optional (bool, optional): A boolean that indicates whether the input element may be empty when a user submits the modal. Defaults to false. Defaults to False.
+        """,
+    ),
+    Component(
+        "SectionBlock", "section",
+        fields=(
+            Field("text", TextObject, None),
+            Field("block_id", str, None),
+            Field("fields", List[TextObject], None),
+            Field("accessory", object, None),
+        ),
+        check=("text is None and fields is None", "Section Blocks needs a text object or a fields Object , got neither of these"),
+        doc="""A section is one of the most flexible blocks available - it can be used as a simple text block, in combination with text fields, 
+        or side-by-side with any of the available block elements.
+
+        Args:
+            text (TextObject, optional): The text for the block, in the form of a text object. Minimum length for the text in this field is 1 and maximum length is 3000 characters. 
+            This field is not required if a valid array of fields objects is provided instead. Defaults to None.
+            block_id (str, optional): _description_. Defaults to None.
+            fields (List[TextObject], optional): _description_. Defaults to None.
+            accessory (object, optional): _description_. Defaults to None.
+        """,
+    ),
+    Component(
+        "VideoBlock", "video",
+        fields=(
+            Field("title", TextObject),
+            Field("thumbnail_url", str),
+            Field("video_url", str),
+            Field("alt_text", str),
+            Field("author_name", str, None),
+            Field("block_id", str, None),
+            Field("description", TextObject, None),
+            Field("provider_icon_url", str, None),
+            Field("provider_name", str, None),
+            Field("title_url", str, None),
+        ),
+        doc="""A video block is designed to embed videos in all app surfaces (e.g. link unfurls, messages, modals, App Home) — anywhere you can put blocks! 
+        To use the video block within your app, you must have the links.embed:write scope.
+
+        Args:
+            title (str): Video title in plain text format. Must be less than 200 characters.
+            thumbnail_url (str): The thumbnail image URL.
+            video_url (str): The URL to be embedded. Must match any existing unfurl domains within the app and point to a HTTPS URL.
+            alt_text (str): A tooltip for the video. Required for accessibility
+            author_name (str, optional): Author name to be displayed. Must be less than 50 characters. Defaults to None.
+            block_id (str, optional): A string acting as a unique identifier for a block. If not specified, one will be generated. 
+                Maximum length for this field is 255 characters. block_id should be unique for each message and each iteration of a message. 
+                If a message is updated, use a new block_id. Defaults to None.
+            description (TextObject, optional): Description for video in plain text format. Defaults to None.
+            provider_icon_url (str, optional): Icon for the video provider - ex. Youtube icon. Defaults to None.
+            provider_name (str, optional): The originating application or domain of the video ex. Youtube. Defaults to None.
+            title_url (str, optional): Video title in plain text format. Must be less than 200 characters. Defaults to None.
+        """,
+    ),
+)
+"""Schema of the builders of the blocks module."""
+
+ELEMENTS = (
+    Component(
+        "Button", "button",
+        fields=(
+            Field("text", TextObject),
+            Field("action_id", str),
+            Field("url", str, None),
+            Field("value", str, None),
+            Field("style", Literal["primary","danger"], None),
+            Field("confirm", object, None),
+            Field("accessibility_label", TextObject, None),
+        ),
+        renamed=(("acessibility_label", "accessibility_label"),),
+        doc="""An interactive component that inserts a button. The button can be a trigger for anything from opening a simple link to starting a complex workflow.
+
+        Args:
+            text (TextObject): A text object that defines the button's text. Can only be of type: plain_text.
+                text may truncate with ~30 characters. Maximum length for the text in this field is 75 characters.
+            action_id (str): An identifier for this action. You can use this when you receive an interaction payload to identify the source of the action.
+                Should be unique among all other action_ids in the containing block. Maximum length for this field is 255 characters.
+            url (str, optional): A URL to load in the user's browser when the button is clicked. Maximum length for this field is 3000 characters. 
+                If you're using url, you'll still receive an interaction payload and will need to send an acknowledgement response. Defaults to None.
+            value (str, optional): The value to send along with the interaction payload. Maximum length for this field is 2000 characters. Defaults to None.
+            style (Literal[&#39;primary&#39;,&#39;danger&#39;], optional): Decorates buttons with alternative visual color schemes.
+                Use this option with restraint. Defaults to 'default'.
+            confirm (object, optional): A confirm object that defines an optional confirmation dialog after the button is clicked. Defaults to None.
+            accessibility_label (TextObject, optional): A label for longer descriptive text about a button element. 
+                This label will be read out by screen readers instead of the button text object. Maximum length for this field is 75 characters. Defaults to None.
+        """,
+    ),
+    Component(
+        "CheckBoxGroup", "checkboxes",
+        fields=(
+            Field("action_id", str),
+            Field("options", List[OptionObject]),
+            Field("initial_options", List[OptionObject], None),
+            Field("confirm", ConfirmDialogObject, None),
+            Field("focus_on_load", bool, False),
+        ),
+        doc="""A checkbox group that allows a user to choose multiple items from a list of possible options.
+
+        Args:
+            action_id (str): An identifier for the action triggered when the checkbox group is changed.
+            options (List[OptionObject]): An array of option objects. A maximum of 10 options are allowed.
+            initial_options (List[OptionObject], optional): An array of option objects that exactly matches one or more of
+                the options within options. These options will be selected when the checkbox group initially loads.. Defaults to None.
+            confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that appears after 
+                clicking one of the checkboxes in this element. Defaults to None.
+            focus_on_load (bool, optional): Indicates whether the element will be set to auto focus within the view object. 
+                Only one element can be set to true. Defaults to False.
+        """,
+    ),
+    Component(
+        "DatePicker", "datepicker",
+        fields=(
+            Field("action_id", str),
+            Field("initial_date", str, None),
+            Field("confirm", ConfirmDialogObject, None),
+            Field("focus_on_load", bool, False),
+            Field("placeholder", TextObject, None),
+        ),
+        doc="""An element which lets users easily select a date from a calendar style UI.
+
+        Args:
+            action_id (str): An identifier for the action triggered when a menu option is selected.
+            initial_date (str, optional): The initial date that is selected when the element is loaded. Defaults to None.
+            confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that appears after a date is selected. Defaults to None.
+            focus_on_load (bool, optional): Indicates whether the element will be set to auto focus within the view object. Only one element can be set to true. Defaults to False.
+            placeholder (TextObject, optional): A plain_text only text object that defines the placeholder text shown on the datepicker. Defaults to None.
+        """,
+    ),
+    Component(
+        "DateTimePicker", "datetimepicker",
+        fields=(
+            Field("action_id", str),
+            Field("initial_date_time", str, None),
+            Field("confirm", ConfirmDialogObject, None),
+            Field("focus_on_load", bool, False),
+        ),
+        doc="""An element that allows the selection of both a date and a time of day formatted as a Unix timestamp.
+
+        Args:
+            action_id (str): An identifier for the action triggered when a menu option is selected.
+            initial_date_time (str, optional): The initial date and time that is selected when the element is loaded, represented as a UNUIX timestamp in seconds.
+                This should be in the format of 10 digits, for example 1628633820 represents the date and time August 10th, 2021 at 03:17pm PST. Defaults to None.
+            confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that appears after a date is selected. Defaults to None.
+            focus_on_load (bool, optional): Indicates whether the element will be set to auto focus within the view object. Only one element can be set to true. Defaults to False.
+        """,
+    ),
+    Component(
+        "EmailInput", "email_text_input",
+        fields=(
+            Field("action_id", str),
+            Field("initial_value", str, None),
+            Field("dispatch_action_config", DispatchActionObject, None),
+            Field("focus_on_load", bool, False),
+            Field("placeholder", TextObject, None),
+        ),
+        doc="""Text input dedicated to email
+
+        Args:
+            action_id (str): An identifier for the input value when the parent modal is submitted.
+            initial_value (str, optional): The initial value in the email input when it is loaded. Defaults to None.
+            dispatch_action_config (DispatchActionObject, optional): A dispatch configuration object that determines when during text input
+                the element returns a block_actions payload. Defaults to None.
+            focus_on_load (bool, optional): Indicates whether the element will be set to auto focus within the view object. Only one element
+                can be set to true. Defaults to False.
+            placeholder (TextObject, optional): A plain_text only text object that defines the placeholder text shown in the email input. Defaults to None.
+        """,
+    ),
+    Component(
+        "Image", "image",
+        fields=(
+            Field("image_url", str),
+            Field("alt_text", str),
+        ),
+        doc="""An element to insert an image as part of a larger block of content. 
+        If you want a block with only an image in it, you're looking for the image block.
+
+        Args:
+            image_url (str): The URL of the image to be displayed.
+            alt_text (str): A plain-text summary of the image. This should not contain any markup.
+        """,
+    ),
+    Component(
+        "MultiSelectStatic", "multi_static_select",
+        fields=(
+            Field("action_id", str),
+            Field("options", List[OptionObject]),
+            Field("option_groups", List[OptionGroupObject], None),
+            Field("initial_options", List[OptionObject], None),
+            Field("confirm", ConfirmDialogObject, None),
+            Field("max_selected_items", int, None),
+            Field("focus_on_load", bool, False),
+            Field("placeholder", TextObject, None),
+        ),
+        doc="""This is the simplest form of select menu, with a static list of options passed in when defining the element.
+
+        Args:
+            action_id (str): An identifier for the action triggered when a menu option is selected. 
+            options (List[OptionObject]): An array of option objects. 
+            option_groups (List[OptionGroupObject], optional): An array of option group objects. Defaults to None.
+            initial_options (List[OptionObject], optional): An array of option objects that exactly match one or more of 
+                the options within options or option_groups. Defaults to None.
+            confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that appears before the multi-select choices are submitted. Defaults to None.
+            max_selected_items (int, optional): Specifies the maximum number of items that can be selected in the menu. Minimum number is 1. Defaults to None.
+            focus_on_load (bool, optional): Indicates whether the element will be set to auto focus within the view object. Only one element can be set to true. Defaults to false. Defaults to False.
+            placeholder (TextObject, optional): A plain_text only text object that defines the placeholder text shown on the menu. Defaults to None.
+        """,
+    ),
+    Component(
+        "MultiSelectExternal", "multi_external_select",
+        fields=(
+            Field("action_id", str),
+            Field("min_query_length", int),
+            Field("initial_options", List[OptionObject], None),
+            Field("confirm", ConfirmDialogObject, None),
+            Field("max_selected_items", int, None),
+            Field("focus_on_load", bool, False),
+            Field("placeholder", TextObject, None),
+        ),
+        doc="""This menu will load its options from an external data source, allowing for a dynamic list of options.
+
+        Args:
+            action_id (str): An identifier for the action triggered when a menu option is selected. 
+            min_query_length (int): When the typeahead field is used, a request will be sent on every character change.
+                If you prefer fewer requests or more fully ideated queries, use the min_query_length attribute to tell Slack
+                the fewest number of typed characters required before dispatch. The default value is 3.
+            initial_options (List[OptionObject], optional): An array of option objects that exactly match one or more of 
+                the options within options or option_groups. Defaults to None.
+            confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that appears before the 
+                multi-select choices are submitted. Defaults to None.
+            max_selected_items (int, optional): Specifies the maximum number of items that can be selected in the menu. 
+                Minimum number is 1. Defaults to None.
+            focus_on_load (bool, optional): Indicates whether the element will be set to auto focus within the view object. 
+                Only one element can be set to true. Defaults to false. Defaults to False.
+            placeholder (TextObject, optional): A plain_text only text object that defines the placeholder text shown on the menu. Defaults to None.
+        """,
+    ),
+    Component(
+        "MultiSelectUsers", "multi_users_select",
+        fields=(
+            Field("action_id", str),
+            Field("initial_users", List[str], None),
+            Field("confirm", ConfirmDialogObject, None),
+            Field("max_selected_items", int, None),
+            Field("focus_on_load", bool, False),
+            Field("placeholder", TextObject, None),
+        ),
+        doc="""This multi-select menu will populate its options with a list of Slack users visible to the current user in the active workspace.
+
+        Args:
+            action_id (str): An identifier for the action triggered when a menu option is selected. 
+            initial_users (List[str], optional): An array of user IDs of any valid users to be pre-selected when the menu loads. Defaults to None.
+            confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that appears before the multi-select choices are submitted. Defaults to None.
+            max_selected_items (int, optional): Specifies the maximum number of items that can be selected in the menu. Minimum number is 1. Defaults to None.
+            focus_on_load (bool, optional): Indicates whether the element will be set to auto focus within the view object. Only one element can be set to true. Defaults to false. Defaults to False.
+            placeholder (TextObject, optional): A plain_text only text object that defines the placeholder text shown on the menu. Defaults to None.
+        """,
+    ),
+    Component(
+        "MultiSelectConversations", "multi_conversations_select",
+        fields=(
+            Field("action_id", str),
+            Field("initial_conversations", List[str], None),
+            Field("default_to_current_conversation", bool, False),
+            Field("confirm", ConfirmDialogObject, None),
+            Field("max_selected_items", int, None),
+            Field("focus_on_load", bool, False),
+            Field("placeholder", TextObject, None),
+        ),
+        doc="""This multi-select menu will populate its options with a list of public and private channels, DMs, and MPIMs visible to the current user in the active workspace.
+
+        Args:
+            action_id (str): An identifier for the action triggered when a menu option is selected. 
+            initial_conversations (List[str], optional): An array of one or more IDs of any valid conversations to be pre-selected when the menu loads. 
+                If default_to_current_conversation is also supplied, initial_conversations will be ignored. Defaults to None.
+            default_to_current_conversation (bool, optional): Pre-populates the select menu with the conversation that the user was viewing when they opened the modal, 
+                if available. Defaults to False.
+            confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that appears before the multi-select choices are submitted. Defaults to None.
+            max_selected_items (int, optional): Specifies the maximum number of items that can be selected in the menu. Minimum number is 1. Defaults to None.
+            focus_on_load (bool, optional): Indicates whether the element will be set to auto focus within the view object. Only one element can be set to true. Defaults to false. Defaults to False.
+            placeholder (TextObject, optional): A plain_text only text object that defines the placeholder text shown on the menu. Defaults to None.
+        """,
+    ),
+    Component(
+        "MultiSelectChannels", "multi_channels_select",
+        fields=(
+            Field("action_id", str),
+            Field("initial_channels", List[str], None),
+            Field("confirm", ConfirmDialogObject, None),
+            Field("max_selected_items", int, None),
+            Field("focus_on_load", bool, False),
+            Field("placeholder", TextObject, None),
+        ),
+        doc="""This multi-select menu will populate its options with a list of public channels visible to the current user in the active workspace.
+
+        Args:
+            action_id (str): An identifier for the action triggered when a menu option is selected. 
+            initial_channels (List[str], optional): An array of one or more IDs of any valid public channel to be pre-selected when the menu loads. Defaults to None.
+            confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that appears before the multi-select choices are submitted. Defaults to None.
+            max_selected_items (int, optional): Specifies the maximum number of items that can be selected in the menu. Minimum number is 1. Defaults to None.
+            focus_on_load (bool, optional): Indicates whether the element will be set to auto focus within the view object. Only one element can be set to true. Defaults to false. Defaults to False.
+            placeholder (TextObject, optional): A plain_text only text object that defines the placeholder text shown on the menu. Defaults to None.
+        """,
+    ),
+    Component(
+        "NumberInput", "number_input",
+        fields=(
+            Field("action_id", str),
+            Field("is_decimal_allowed", bool, True),
+            Field("initial_value", str, None),
+            Field("min_value", str, None),
+            Field("max_value", str, None),
+            Field("dispatch_action_config", DispatchActionObject, None),
+            Field("focus_on_load", bool, False),
+            Field("placeholder", TextObject, None),
+        ),
+        doc="""This input elements accepts both whole and decimal numbers.
+
+        Args:
+            action_id (str): An identifier for the input value when the parent modal is submitted.
+            is_decimal_allowed (bool, optional): Whether floats are accepted. Defaults to True.
+            initial_value (str, optional): The initial value in the plain-text input when it is loaded. Defaults to None.
+            min_value (str, optional): minimum value. Defaults to None.
+            max_value (str, optional): maximum value. Defaults to None.
+            dispatch_action_config (DispatchActionObject, optional): A dispatch configuration object that determines when during 
+                text input the element returns a block_actions payload. Defaults to None.
+            focus_on_load (bool, optional): Indicates whether the element will be set to auto focus within the view object. Defaults to False.
+            placeholder (TextObject, optional):A plain_text only text object that defines the placeholder text shown in the number input. Defaults to None.
+        """,
+    ),
+    Component(
+        "OverflowMenu", "overflow",
+        fields=(
+            Field("action_id", str),
+            Field("options", List[OptionObject]),
+            Field("confirm", ConfirmDialogObject, None),
+        ),
+        doc="""when a user clicks on this overflow button, they will be presented with a list of options to choose from
+
+        Args:
+            action_id (str): An identifier for the action triggered when a menu option is selected
+            options (List[OptionObject]): An array of up to five option objects to display in the menu.
+            confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that 
+                appears after a menu item is selected. Defaults to None.
+        """,
+    ),
+    Component(
+        "PlainTextInput", "plain_text_input",
+        fields=(
+            Field("action_id", str),
+            Field("initial_value", str, None),
+            Field("multiline", bool, False),
+            Field("min_length", int, None),
+            Field("max_length", int, None),
+            Field("dispatch_action_config", DispatchActionObject, None),
+            Field("focus_on_load", bool, False),
+            Field("placeholder", TextObject, None),
+        ),
+        doc="""A plain-text input, similar to the HTML input tag, creates a field where a user can enter freeform data.
+
+        Args:
+            action_id (str): action's id
+            initial_value (str, optional): initial value of the input. Defaults to None.
+            multiline (bool, optional): whether user can write multiple lines. Defaults to False.
+            min_length (int, optional): minimum length for valid text. Defaults to None.
+            max_length (int, optional): maximum length for valid text. Defaults to None.
+            dispatch_action_config (DispatchActionObject, optional): A dispatch configuration object that determines 
+                when during text input the element returns a block_actions payload.. Defaults to None.
+            focus_on_load (bool, optional): whether input should be focused on entering. Defaults to False.
+            placeholder (TextObject, optional): A plain_text only text object that defines the placeholder 
+                text shown in the plain-text input. Defaults to None.
+        """,
+    ),
+    Component(
+        "RadioButtonGroup", "radio_buttons",
+        fields=(
+            Field("action_id", str),
+            Field("options", List[OptionObject]),
+            Field("initial_option", OptionObject, None),
+            Field("confirm", ConfirmDialogObject, None),
+            Field("focus_on_load", bool, False),
+        ),
+        renamed=(("initial_options", "initial_option"),),
+        doc="""Visit https://api.slack.com/reference/block-kit/block-elements#radio for more details""",
+    ),
+    Component(
+        "SelectStatic", "static_select",
+        fields=(
+            Field("action_id", str),
+            Field("options", List[OptionObject]),
+            Field("option_groups", List[OptionGroupObject], None),
+            Field("initial_option", OptionObject, None),
+            Field("confirm", ConfirmDialogObject, None),
+            Field("focus_on_load", bool, False),
+            Field("placeholder", TextObject, None),
+        ),
+        doc="""This is the simplest form of select menu, with a static list of options passed in when defining the element.
+
+        Args:
+            action_id (str): An identifier for the action triggered when a menu option is selected. 
+            options (List[OptionObject]): An array of option objects. 
+            option_groups (List[OptionGroupObject], optional): An array of option group objects. Defaults to None.
+            initial_option (OptionObject, optional): An option object that exactly matches one of the options within options or option_groups.
+                It will be selected when the menu initially loads. Defaults to None.
+            confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that appears after a menu item is selected. Defaults to None.
+            focus_on_load (bool, optional): Indicates whether the element will be set to auto focus within the view object. Only one element can be set to true. Defaults to false. Defaults to False.
+            placeholder (TextObject, optional): A plain_text only text object that defines the placeholder text shown on the menu. Defaults to None.
+        """,
+    ),
+    Component(
+        "SelectExternal", "external_select",
+        fields=(
+            Field("action_id", str),
+            Field("min_query_length", int),
+            Field("initial_option", OptionObject, None),
+            Field("confirm", ConfirmDialogObject, None),
+            Field("focus_on_load", bool, False),
+            Field("placeholder", TextObject, None),
+        ),
+        doc="""This menu will load its options from an external data source, allowing for a dynamic list of options.
+
+        Args:
+            action_id (str): An identifier for the action triggered when a menu option is selected. 
+            min_query_length (int): When the typeahead field is used, a request will be sent on every character change.
+                If you prefer fewer requests or more fully ideated queries, use the min_query_length attribute to tell Slack
+                the fewest number of typed characters required before dispatch. The default value is 3.
+            initial_option (OptionObject, optional): An option object that exactly matches one of the options within options or option_groups.
+                It will be selected when the menu initially loads. Defaults to None.
+            confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that appears after a menu item is selected. Defaults to None.
+            focus_on_load (bool, optional): Indicates whether the element will be set to auto focus within the view object. 
+                Only one element can be set to true. Defaults to false. Defaults to False.
+            placeholder (TextObject, optional): A plain_text only text object that defines the placeholder text shown on the menu. Defaults to None.
+        """,
+    ),
+    Component(
+        "SelectUsers", "users_select",
+        fields=(
+            Field("action_id", str),
+            Field("initial_user", str, None),
+            Field("confirm", ConfirmDialogObject, None),
+            Field("focus_on_load", bool, False),
+            Field("placeholder", TextObject, None),
+        ),
+        doc="""This select menu will populate its options with a list of Slack users visible to the current user in the active workspace.
+
+        Args:
+            action_id (str): An identifier for the action triggered when a menu option is selected. 
+            initial_user (str, optional): user ID of any valid users to be pre-selected when the menu loads. Defaults to None.
+            confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that appears after a menu item is selected. Defaults to None.
+            focus_on_load (bool, optional): Indicates whether the element will be set to auto focus within the view object. Only one element can be set to true. Defaults to false. Defaults to False.
+            placeholder (TextObject, optional): A plain_text only text object that defines the placeholder text shown on the menu. Defaults to None.
+        """,
+    ),
+    Component(
+        "SelectConversations", "conversations_select",
+        fields=(
+            Field("action_id", str),
+            Field("initial_conversation", str, None),
+            Field("default_to_current_conversation", bool, False),
+            Field("confirm", ConfirmDialogObject, None),
+            Field("focus_on_load", bool, False),
+            Field("placeholder", TextObject, None),
+        ),
+        doc="""This select menu will populate its options with a list of public and private channels, DMs, and MPIMs visible to the current user in the active workspace.
+
+        Args:
+            action_id (str): An identifier for the action triggered when a menu option is selected. 
+            initial_conversation (str, optional): ID of any valid conversation to be pre-selected when the menu loads.
+                If default_to_current_conversation is also supplied, initial_conversation will be ignored. Defaults to None.
+            default_to_current_conversation (bool, optional): Pre-populates the select menu with the conversation that the user was viewing when they opened the modal, 
+                if available. Defaults to False.
+            confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that appears after a menu item is selected. Defaults to None.
+            focus_on_load (bool, optional): Indicates whether the element will be set to auto focus within the view object. Only one element can be set to true. Defaults to false. Defaults to False.
+            placeholder (TextObject, optional): A plain_text only text object that defines the placeholder text shown on the menu. Defaults to None.
+        """,
+    ),
+    Component(
+        "SelectChannels", "channels_select",
+        fields=(
+            Field("action_id", str),
+            Field("initial_channel", str, None),
+            Field("confirm", ConfirmDialogObject, None),
+            Field("focus_on_load", bool, False),
+            Field("placeholder", TextObject, None),
+        ),
+        doc="""This select menu will populate its options with a list of public channels visible to the current user in the active workspace.
+
+        Args:
+            action_id (str): An identifier for the action triggered when a menu option is selected. 
+            initial_channel (str, optional): ID of any valid public channel to be pre-selected when the menu loads. Defaults to None.
+            confirm (ConfirmDialogObject, optional): A confirm object that defines an optional confirmation dialog that appears after a menu item is selected. Defaults to None.
+            focus_on_load (bool, optional): Indicates whether the element will be set to auto focus within the view object. Only one element can be set to true. Defaults to false. Defaults to False.
+            placeholder (TextObject, optional): A plain_text only text object that defines the placeholder text shown on the menu. Defaults to None.
+        """,
+    ),
+    Component(
+        "TimePicker", "timepicker",
+        fields=(
+            Field("action_id", str),
+            Field("initial_time", str, None),
+            Field("confirm", ConfirmDialogObject, None),
+            Field("focus_on_load", bool, False),
+            Field("placeholder", TextObject, None),
+            Field("timezone", str, None),
+        ),
+        doc="""Visit https://api.slack.com/reference/block-kit/block-elements#timepicker for more informations""",
+    ),
+    Component(
+        "URLInput", "url_text_input",
+        fields=(
+            Field("action_id", str),
+            Field("initial_value", str, None),
+            Field("dispatch_action_config", DispatchActionObject, None),
+            Field("focus_on_load", bool, False),
+            Field("placeholder", TextObject, None),
+        ),
+        doc="""Visit https://api.slack.com/reference/block-kit/block-elements#url for more informations""",
+    ),
+    Component(
+        "WorkflowButton", "workflow_button",
+        fields=(
+            Field("text", TextObject),
+            Field("workflow", WorkFlowObject),
+            Field("accessibility_label", str, None),
+            Field("style", Literal["primary","danger"], None),
+        ),
+        order=("text", "workflow", "style", "accessibility_label"),
+        doc="""Visit https://api.slack.com/reference/block-kit/block-elements#workflow_button for more informations""",
+    ),
+)
+"""Schema of the builders of the elements module."""
+
+
+def _rules(components : Tuple[Component, ...]) -> Dict[str, tuple]:
+    rules = {"plain_text" : (("text",), None, None, "TextObject"), "mrkdwn" : (("text",), None, None, "TextObject")}
+    for component in components:
+        required = tuple(field.name for field in component.fields if field.default is REQUIRED)
+        check = None
+        if component.check is not None:
+            condition , message = component.check
+            check = (compile(condition, f"<{component.name} check>", "eval"), message)
+        names = tuple(field.name for field in component.fields)
+        if component.type in rules:
+            # components sharing a type (the image block and element) must agree on what is required
+            required = tuple(name for name in required if name in rules[component.type][0])
+        rules[component.type] = (required, check, names, component.name)
+    return rules
+
+
+_RULES = _rules(BLOCKS + ELEMENTS)
+
+
+def write_modules():
+    """Writes the blocks and elements modules from the schema."""
+    for module , (schema , doc) in _MODULES.items():
+        (Path(__file__).parent / f"{module}.py").write_text(module_source(globals()[schema], doc))
+
+
+def validate(value : dict):
+    """Runs the checks of the builder that emits value's type again, e.g. on a block whose thunks were just rendered.
+
+    Raises:
+        RuntimeError: a required field is missing or the builder's check fails.
+    """
+    rule = _RULES.get(value.get("type"))
+    if rule is None:
+        return
+    required , check , names , name = rule
+    missing = [field for field in required if value.get(field) is None]
+    if missing:
+        raise RuntimeError(f"{name} of type {value['type']!r} has no value for {', '.join(missing)}")
+    if check is not None:
+        condition , message = check
+        if eval(condition, {}, {field : value.get(field) for field in names}):
+            raise RuntimeError(message)
@@ -0,0 +1,208 @@
+from contextlib import contextmanager
+from hashlib import blake2b
+from threading import Lock
+from typing import Callable , Union
+from zlib import crc32
+import json
+import mmap
+import os
+import struct
+from .lazy import render as render_tree
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+__all__ = ["SharedRenderCache"]
+
+_MAGIC = b"SCRC"
+_HEADER = struct.Struct("<4sIIII4xQQQ")
+"""magic, version, slot count, slot size, ways, clock, writes, evictions."""
+_HEADER_SIZE = 64
+_SLOT = struct.Struct("<Q16sQII")
+"""sequence, key hash, stamp, payload length, payload crc."""
+_VERSION = 1
+_CLOCK_OFFSET = 24
+
+
+def _key_hash(key : Union[str, bytes]) -> bytes:
+    return blake2b(key.encode() if isinstance(key, str) else key, digest_size=16).digest()
+
+
+class SharedRenderCache:
+    """A fixed size cache of encoded payloads in a memory mapped file, shared by every process opening the same path,
+    e.g. the workers of a gunicorn deployment.
+
+    Reads take no lock: each slot carries a sequence number that writers make odd while they write, readers retry or miss
+    when it changed under them. Writers are serialized with a file lock. Entries are grouped in sets of `ways` slots,
+    a full set evicts its oldest entry.
+
+    Args:
+        path (str): file backing the cache, created if needed. An existing file keeps the geometry it was created with.
+        capacity (int, optional): number of entries. Defaults to 4096.
+        slot_size (int, optional): maximum size of an encoded payload in bytes, larger payloads are not cached. Defaults to 16KiB.
+        ways (int, optional): number of slots a key may be stored in. Defaults to 8.
+    """
+
+    def __init__(self, path : str, capacity : int = 4096, slot_size : int = 16 * 1024, ways : int = 8):
+        if capacity < 1 or slot_size < 1 or ways < 1:
+            raise RuntimeError(f"capacity, slot_size and ways must be at least 1, got {capacity}, {slot_size} and {ways}")
+        self.path = path
+        self._thread_lock = Lock()
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        self._pid = os.getpid()
+        with self._locked():
+            if os.fstat(self._fd).st_size == 0:
+                ways = max(1, min(ways, capacity))
+                capacity -= capacity % ways
+                os.ftruncate(self._fd, _HEADER_SIZE + capacity * (_SLOT.size + slot_size))
+                os.pwrite(self._fd, _HEADER.pack(_MAGIC, _VERSION, capacity, slot_size, ways, 0, 0, 0), 0)
+            magic , version , capacity , slot_size , ways , *_ = _HEADER.unpack(os.pread(self._fd, _HEADER.size, 0))
+        if magic != _MAGIC or version != _VERSION or capacity < 1 or ways < 1 or capacity % ways:
+            os.close(self._fd)
+            raise RuntimeError(f"{path} is not a shared render cache")
+        self.capacity = capacity
+        self.slot_size = slot_size
+        self.ways = ways
+        self._sets = capacity // ways
+        self._stride = _SLOT.size + slot_size
+        self._map = mmap.mmap(self._fd, _HEADER_SIZE + capacity * self._stride)
+        self.hits = 0
+        self.misses = 0
+
+    @contextmanager
+    def _locked(self):
+        """Serializes writers, across threads and processes."""
+        with self._thread_lock:
+            if fcntl is None:
+                yield
+                return
+            if self._pid != os.getpid():
+                # a forked worker shares the parent's file description, flock needs its own
+                inherited = self._fd
+                self._fd = os.open(self.path, os.O_RDWR)
+                self._pid = os.getpid()
+                os.close(inherited)
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _offsets(self, digest : bytes) -> range:
+        first = int.from_bytes(digest[:8], "little") % self._sets * self.ways
+        return range(_HEADER_SIZE + first * self._stride, _HEADER_SIZE + (first + self.ways) * self._stride, self._stride)
+
+    def get(self, key : Union[str, bytes]) -> Union[bytes, None]:
+        """Returns the payload stored for key, or None."""
+        digest = _key_hash(key)
+        view = self._map
+        for offset in self._offsets(digest):
+            for _ in range(3):
+                sequence , slot_key , _stamp , length , crc = _SLOT.unpack_from(view, offset)
+                if slot_key != digest or sequence & 1 or length > self.slot_size:
+                    break
+                start = offset + _SLOT.size
+                payload = view[start:start + length]
+                if struct.unpack_from("<Q", view, offset)[0] == sequence and crc32(payload) == crc:
+                    self.hits += 1
+                    return payload
+        self.misses += 1
+        return None
+
+    def put(self, key : Union[str, bytes], payload : bytes) -> bool:
+        """Stores payload for key, evicting the oldest entry of its set if needed. Returns False if the payload is too large."""
+        if len(payload) > self.slot_size:
+            return False
+        digest = _key_hash(key)
+        view = self._map
+        with self._locked():
+            target = None
+            oldest = None
+            for offset in self._offsets(digest):
+                sequence , slot_key , stamp , length , _crc = _SLOT.unpack_from(view, offset)
+                if slot_key == digest:
+                    target = offset
+                    break
+                if target is None and stamp == 0:
+                    target = offset
+                if oldest is None or stamp < oldest[1]:
+                    oldest = (offset, stamp)
+            _ , _ , _ , _ , _ , clock , writes , evictions = _HEADER.unpack_from(view, 0)
+            if target is None:
+                target = oldest[0]
+                evictions += 1
+            clock += 1
+            sequence = struct.unpack_from("<Q", view, target)[0]
+            struct.pack_into("<Q", view, target, sequence + 1)
+            start = target + _SLOT.size
+            view[start:start + len(payload)] = payload
+            _SLOT.pack_into(view, target, sequence + 1, digest, clock, len(payload), crc32(payload))
+            struct.pack_into("<Q", view, target, sequence + 2)
+            struct.pack_into("<QQQ", view, _CLOCK_OFFSET, clock, writes + 1, evictions)
+        return True
+
+    def get_blocks(self, key : Union[str, bytes]) -> Union[list, dict, None]:
+        """Returns the decoded blocks stored for key, or None."""
+        payload = self.get(key)
+        return None if payload is None else json.loads(payload)
+
+    def put_blocks(self, key : Union[str, bytes], blocks : Union[list, dict]) -> bool:
+        """Renders blocks (any builder output, thunks and models included), encodes them and stores them for key. See put.
+
+        Raises:
+            RuntimeError: the rendered blocks are not JSON serializable.
+        """
+        try:
+            payload = json.dumps(render_tree(blocks), separators=(",", ":"))
+        except TypeError as exc:
+            # every worker reads this entry, refuse it rather than caching a repr
+            raise RuntimeError(f"Blocks stored under {key!r} are not JSON serializable: {exc}") from None
+        return self.put(key, payload.encode())
+
+    def get_or_render(self, key : Union[str, bytes], render : Callable) -> Union[list, dict]:
+        """Returns the blocks stored for key, rendering and publishing them first if no worker did yet.
+        The rendered tree is returned on a miss too, so hits and misses return the same blocks."""
+        blocks = self.get_blocks(key)
+        if blocks is None:
+            blocks = render_tree(render())
+            self.put_blocks(key, blocks)
+        return blocks
+
+    def clear(self):
+        """Drops every entry."""
+        with self._locked():
+            empty = bytes(_SLOT.size)
+            for offset in range(_HEADER_SIZE, _HEADER_SIZE + self.capacity * self._stride, self._stride):
+                sequence = struct.unpack_from("<Q", self._map, offset)[0]
+                self._map[offset:offset + _SLOT.size] = empty
+                struct.pack_into("<Q", self._map, offset, sequence + 2 + (sequence & 1))
+
+    def stats(self) -> dict:
+        """Hits and misses of this process, writes, evictions and occupancy shared by every process."""
+        _ , _ , _ , _ , _ , _ , writes , evictions = _HEADER.unpack_from(self._map, 0)
+        used = sum(
+            1 for offset in range(_HEADER_SIZE, _HEADER_SIZE + self.capacity * self._stride, self._stride)
+            if _SLOT.unpack_from(self._map, offset)[2]
+        )
+        return {
+            "hits" : self.hits,
+            "misses" : self.misses,
+            "writes" : writes,
+            "evictions" : evictions,
+            "entries" : used,
+            "capacity" : self.capacity,
+        }
+
+    def close(self):
+        if self._map.closed:
+            return
+        self._map.close()
+        os.close(self._fd)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
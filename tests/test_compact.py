@@ -0,0 +1,63 @@
+import pickle
+from slack_components import Actions , Button , Divider , SectionBlock , TextObject
+from slack_components.compact import CompactMessage , CompactNode , pack , unpack
+
+
+def _blocks():
+    return [
+        SectionBlock(text=TextObject(type="mrkdwn", text="*hello*"), block_id="intro"),
+        Divider(),
+        Actions(block_id="buttons", elements=[
+            Button(text=TextObject(type="plain_text", text="Approve"), action_id="approve", value="1", style="primary"),
+            Button(text=TextObject(type="plain_text", text="Deny"), action_id="deny", value="2", style="danger"),
+        ]),
+        {"type" : "section", "text" : {"type" : "plain_text", "text" : "raw", "emoji" : True}, "fields" : [], "count" : 3},
+    ]
+
+
+def test_round_trip_is_lossless():
+    blocks = _blocks()
+    message = CompactMessage(blocks)
+    assert message.to_dicts() == blocks
+    assert unpack(pack(blocks)) == blocks
+    assert [list(block.to_dict()) for block in message] == [list(block) for block in blocks]
+
+
+def test_round_trip_keeps_scalars():
+    value = {"a" : None, "b" : True, "c" : 1.5, "d" : [], "e" : {}, "f" : [[1, "x"]], "g" : "y" * 100}
+    assert unpack(pack(value)) == value
+
+
+def test_round_trip_through_pickle():
+    message = CompactMessage(_blocks())
+    assert unpack(pickle.loads(pickle.dumps(message.blocks))) == _blocks()
+
+
+def test_shapes_and_strings_are_shared():
+    first , second = pack(_blocks()) , pack(_blocks())
+    assert first[2][0] is second[2][0]
+    assert first[0].type is second[0].type
+
+
+def test_lookups():
+    message = CompactMessage(_blocks())
+    assert message.find("buttons").elements[1].action_id == "deny"
+    assert message.get("buttons", "elements", 0, "value") == "1"
+    assert message.get("buttons", "elements", 5, "value", default="none") == "none"
+    assert message.get("missing", "text", default=0) == 0
+    assert message.find("missing") is None
+    assert isinstance(message.find("intro"), CompactNode)
+
+
+def test_index_and_count_keys():
+    node = pack({"index" : 4, "count" : 7})
+    assert node.index == 4
+    assert node.count == 7
+    other = pack({"type" : "divider"})
+    assert other.index(other[0]) == 0
+    assert other.count("divider") == 1
+
+
+def test_find_uses_first_block_with_an_id():
+    message = CompactMessage([{"type" : "divider", "block_id" : "a"}, {"type" : "section", "block_id" : "a"}])
+    assert message.find("a").type == "divider"
@@ -0,0 +1,94 @@
+from threading import Event
+import pytest
+from slack_components import Divider , SectionBlock , TextObject
+from slack_components.executor import RenderExecutor , RenderQueueFull , busy_view , loading_view
+
+
+class FakeViewsClient:
+    def __init__(self, calls : list):
+        self.calls = calls
+
+    def views_open(self, trigger_id : str, view : dict):
+        self.calls.append(("open", view))
+        return {"ok" : True, "view" : {"id" : "V1", "hash" : "h1"}}
+
+    def views_update(self, view_id : str, view : dict, hash : str = None):
+        self.calls.append(("update", view_id, hash, view))
+        return {"ok" : True, "view" : {"id" : view_id}}
+
+
+def _blocked(executor : RenderExecutor) -> tuple:
+    release = Event()
+    return release , executor.submit(lambda : release.wait(5) and [])
+
+
+def test_submit_renders_thunks():
+    with RenderExecutor(max_workers=2) as executor:
+        future = executor.submit(lambda name : [SectionBlock(text=lambda : TextObject(type="plain_text", text=name))], "Ada")
+        assert future.result(5)[0]["text"]["text"] == "Ada"
+
+
+def test_stats():
+    with RenderExecutor(max_workers=2) as executor:
+        executor.submit(lambda : [Divider()]).result(5)
+        with pytest.raises(ZeroDivisionError):
+            executor.submit(lambda : 1 / 0).result(5)
+        stats = executor.stats()
+    assert (stats["completed"] , stats["failed"] , stats["pending"] , stats["rejected"]) == (1, 1, 0, 0)
+    assert stats["queue_time"]["calls"] == 1
+    assert stats["render_time"]["calls"] == 1
+    assert stats["render_time"]["p99"] >= 0
+
+
+def test_saturated_executor_rejects():
+    with RenderExecutor(max_workers=1, max_pending=1) as executor:
+        release , blocked = _blocked(executor)
+        with pytest.raises(RenderQueueFull):
+            executor.submit(lambda : [])
+        assert executor.stats()["rejected"] == 1
+        release.set()
+
+
+def test_open_after_ack():
+    calls = []
+    with RenderExecutor() as executor:
+        future = executor.open_after_ack(lambda : calls.append("ack"), FakeViewsClient(calls), "T1", lambda : [Divider()])
+        future.result(5)
+    assert calls[0] == "ack"
+    assert calls[1] == ("open", loading_view())
+    assert calls[2] == ("update", "V1", "h1", {**loading_view(), "blocks" : [{"type" : "divider"}]})
+
+
+def test_open_after_ack_when_saturated():
+    calls = []
+    with RenderExecutor(max_workers=1, max_pending=1) as executor:
+        release , blocked = _blocked(executor)
+        future = executor.open_after_ack(lambda : calls.append("ack"), FakeViewsClient(calls), "T1", lambda : [Divider()])
+        release.set()
+    with pytest.raises(RenderQueueFull):
+        future.result(5)
+    assert calls == ["ack", ("open", busy_view())]
+
+
+def test_update_after_ack_when_saturated():
+    calls = []
+    busy = {"type" : "modal", "blocks" : []}
+    with RenderExecutor(max_workers=1, max_pending=1) as executor:
+        release , blocked = _blocked(executor)
+        future = executor.update_after_ack(lambda : calls.append("ack"), FakeViewsClient(calls), "V9", lambda : {}, busy=busy)
+        release.set()
+        blocked.result(5)
+        assert isinstance(future.exception(5), RenderQueueFull)
+        calls.clear()
+        view = {"type" : "modal", "blocks" : [Divider()]}
+        executor.update_after_ack(lambda : calls.append("ack"), FakeViewsClient(calls), "V9", lambda : view).result(5)
+    assert calls == ["ack", ("update", "V9", None, view)]
+
+
+def test_ack_comes_after_the_slot_is_reserved():
+    order = []
+    with RenderExecutor(max_workers=1, max_pending=1) as executor:
+        submit = executor.submit
+        executor.submit = lambda *args , **kwargs : order.append("submit") or submit(*args, **kwargs)
+        executor.update_after_ack(lambda : order.append("ack"), FakeViewsClient([]), "V1", lambda : {}).result(5)
+    assert order == ["submit", "ack"]
@@ -0,0 +1,124 @@
+from threading import Event , Thread
+from slack_components import HomePublisher , FakeWebClient , SectionBlock , TextObject
+
+
+def _render(user_id : str, data) -> list:
+    team = data[f"team:{user_id}"]
+    return [SectionBlock(text=TextObject(type="plain_text", text=f"{user_id} in {team}: {data[team]}"))]
+
+
+def _text(client : FakeWebClient, user_id : str) -> str:
+    return client.published[user_id]["blocks"][0]["text"]["text"]
+
+
+def _publisher(client : FakeWebClient, render = _render, **kwargs) -> HomePublisher:
+    data = {"team:U1" : "red", "team:U2" : "blue", "red" : "winning", "blue" : "losing"}
+    publisher = HomePublisher(client, render, data, **kwargs)
+    publisher.add_users(["U1", "U2"])
+    return publisher
+
+
+def test_publishes_then_skips_unchanged_views():
+    client = FakeWebClient()
+    publisher = _publisher(client)
+    assert publisher.flush() == {"published" : 2, "unchanged" : 0, "stale" : 0, "failed" : {}}
+    assert _text(client, "U1") == "U1 in red: winning"
+    assert publisher.dependencies("U1") == frozenset({"team:U1", "red"})
+    assert publisher.flush()["published"] == 0
+    assert publisher.publish_all() == {"published" : 0, "unchanged" : 2, "stale" : 0, "failed" : {}}
+    assert client.calls == 2
+
+
+def test_updates_only_rerender_dependents():
+    client = FakeWebClient()
+    publisher = _publisher(client)
+    publisher.flush()
+    assert publisher.update({"blue" : "tied", "red" : "winning"}) == {"U2"}
+    assert publisher.flush()["published"] == 1
+    assert _text(client, "U2") == "U2 in blue: tied"
+    assert publisher.update({"team:U1" : "blue"}) == {"U1"}
+    publisher.flush()
+    assert _text(client, "U1") == "U1 in blue: tied"
+    assert publisher.update({"red" : "lost"}) == set()
+
+
+def test_updates_copy_the_data():
+    publisher = _publisher(FakeWebClient())
+    snapshot = publisher.data
+    publisher.update({"red" : "lost"})
+    assert snapshot["red"] == "winning"
+    assert publisher.data["red"] == "lost"
+    assert publisher.data is not snapshot
+
+
+def test_iterating_renders_depend_on_every_key():
+    client = FakeWebClient()
+    publisher = HomePublisher(client, lambda user_id , data : [SectionBlock(text=TextObject(type="plain_text", text=",".join(sorted(data))))], {"a" : 1})
+    publisher.add_users(["U1"])
+    publisher.flush()
+    assert publisher.update({"b" : 2}) == {"U1"}
+    publisher.flush()
+    assert _text(client, "U1") == "a,b"
+
+
+def test_data_changed_during_the_first_render_is_not_lost():
+    started , release = Event() , Event()
+    def slow_render(user_id , data):
+        value = data["score"]
+        started.set()
+        release.wait(5)
+        return [SectionBlock(text=TextObject(type="plain_text", text=str(value)))]
+    client = FakeWebClient()
+    publisher = HomePublisher(client, slow_render, {"score" : 1})
+    publisher.add_users(["U1"])
+    reports = []
+    worker = Thread(target=lambda : reports.append(publisher.flush()))
+    worker.start()
+    assert started.wait(5)
+    publisher.update({"score" : 2})
+    release.set()
+    worker.join(5)
+    assert reports == [{"published" : 0, "unchanged" : 0, "stale" : 1, "failed" : {}}]
+    assert "U1" not in client.published
+    assert publisher.flush()["published"] == 1
+    assert _text(client, "U1") == "2"
+
+
+def test_unrelated_changes_do_not_make_renders_stale():
+    started , release = Event() , Event()
+    def slow_render(user_id , data):
+        value = data["score"]
+        started.set()
+        release.wait(5)
+        return [SectionBlock(text=TextObject(type="plain_text", text=str(value)))]
+    publisher = HomePublisher(FakeWebClient(), slow_render, {"score" : 1, "other" : 1})
+    publisher.add_users(["U1"])
+    reports = []
+    worker = Thread(target=lambda : reports.append(publisher.flush()))
+    worker.start()
+    assert started.wait(5)
+    publisher.update({"other" : 2})
+    release.set()
+    worker.join(5)
+    assert reports[0]["published"] == 1
+
+
+def test_failed_users_stay_dirty():
+    client = FakeWebClient(fail_for=["U2"])
+    publisher = _publisher(client)
+    report = publisher.flush()
+    assert report["published"] == 1
+    assert isinstance(report["failed"]["U2"], RuntimeError)
+    client.fail_for.clear()
+    assert publisher.flush()["published"] == 1
+    assert _text(client, "U2") == "U2 in blue: losing"
+
+
+def test_removed_users_are_not_published():
+    client = FakeWebClient()
+    publisher = _publisher(client, batch_size=1, max_workers=2)
+    publisher.remove_users(["U2"])
+    publisher.flush()
+    assert list(client.published) == ["U1"]
+    assert publisher.update({"blue" : "tied"}) == set()
+    assert publisher.dependencies("U2") is None
@@ -0,0 +1,84 @@
+import gettext
+import pickle
+from types import SimpleNamespace
+import pytest
+from slack_components import HeaderBlock , SectionBlock , TextObject
+from slack_components.i18n import Catalog , LocalizedLayout , MessageKey , Slot
+
+
+def _layout(catalog : Catalog, **kwargs) -> LocalizedLayout:
+    return LocalizedLayout([
+        HeaderBlock(text=TextObject(type="plain_text", text=MessageKey("title", "Report"))),
+        SectionBlock(text=TextObject(type="mrkdwn", text=MessageKey("greeting", "Hello {user}")), block_id="greeting"),
+        SectionBlock(text=TextObject(type="plain_text", text=Slot("body"))),
+    ], catalog, **kwargs)
+
+
+CATALOG = Catalog({"fr" : {"title" : "Rapport", "greeting" : "Bonjour {user}"}, "de" : {"title" : "Bericht"}}, fallback="fr")
+
+
+def test_render_per_locale():
+    layout = _layout(CATALOG)
+    blocks = layout.render("fr", user="Ada", body="texte")
+    assert [block["text"]["text"] for block in blocks] == ["Rapport", "Bonjour Ada", "texte"]
+    assert [block["text"]["text"] for block in layout("de", user="Ada", body="Text")] == ["Bericht", "Bonjour Ada", "Text"]
+    assert [block["text"]["text"] for block in layout("en", user="Ada", body="text")] == ["Rapport", "Bonjour Ada", "text"]
+    defaults = _layout(Catalog(CATALOG.translations))
+    assert [block["text"]["text"] for block in defaults("en", user="Ada", body="text")] == ["Report", "Hello Ada", "text"]
+
+
+def test_static_parts_are_shared_and_renders_cached():
+    layout = _layout(CATALOG)
+    first = layout.render("fr", user="Ada", body="a")
+    second = layout.render("fr", user="Bob", body="a")
+    assert first[0] is second[0]
+    again = layout.render("fr", user="Ada", body="a")
+    assert type(again) is list and again == first and all(a is b for a , b in zip(again, first))
+    assert layout.render("fr", user="Ada", body=["unhashable"])[2]["text"]["text"] == ["unhashable"]
+
+
+def test_cache_is_bounded():
+    layout = _layout(CATALOG, cache_size=2)
+    first = layout.render("fr", user="A", body="")
+    layout.render("fr", user="B", body="")
+    layout.render("fr", user="C", body="")
+    assert layout.render("fr", user="A", body="")[1] is not first[1]
+
+
+def test_values_hashing_alike_are_rendered_apart():
+    layout = _layout(CATALOG)
+    assert layout.render("fr", user="Ada", body=1)[2]["text"]["text"] == 1
+    assert layout.render("fr", user="Ada", body=True)[2]["text"]["text"] is True
+    assert layout.render("fr", user=1, body="")[1]["text"]["text"] == "Bonjour 1"
+    assert layout.render("fr", user=1.0, body="")[1]["text"]["text"] == "Bonjour 1.0"
+
+
+def test_missing_values_raise():
+    with pytest.raises(RuntimeError, match="body"):
+        _layout(CATALOG).render("fr", user="Ada")
+
+
+def test_attribute_and_index_fields():
+    catalog = Catalog({"en" : {"welcome" : "Hi {user.name}, you have {counts[unread]} messages, first: {items[0]}"}})
+    layout = LocalizedLayout([SectionBlock(text=TextObject(type="mrkdwn", text=MessageKey("welcome")))], catalog)
+    user = SimpleNamespace(name="Ada")
+    blocks = layout.render("en", user=user, counts={"unread" : 3}, items=("a", "b"))
+    assert blocks[0]["text"]["text"] == "Hi Ada, you have 3 messages, first: a"
+    assert layout.variant("en")[2] == ("counts", "items", "user")
+    with pytest.raises(RuntimeError, match="items"):
+        layout.render("en", user=user, counts={})
+
+
+def test_gettext_catalogs():
+    class French(gettext.NullTranslations):
+        def gettext(self, message):
+            return {"title" : "Rapport"}.get(message, message)
+    blocks = _layout(Catalog({"fr" : French()})).render("fr", user="Ada", body="")
+    assert blocks[0]["text"]["text"] == "Rapport"
+    assert blocks[1]["text"]["text"] == "Hello Ada"
+
+
+def test_keys_survive_pickling():
+    key = pickle.loads(pickle.dumps(MessageKey("greeting", "Hello")))
+    assert key == "greeting" and key.default == "Hello"
+    assert isinstance(pickle.loads(pickle.dumps(Slot("body"))), Slot)
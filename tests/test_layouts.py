@@ -0,0 +1,117 @@
+import json
+import os
+import pickle
+import pytest
+from slack_components import layouts
+from slack_components.layouts import Layout , LayoutLoader , compile_spec , register_component
+from slack_components.persistent import PersistentDict
+
+SPEC = [
+    {"$component" : "HeaderBlock", "text" : {"$component" : "TextObject", "type" : "plain_text", "text" : "Report"}},
+    {"$component" : "SectionBlock", "text" : {"type" : "mrkdwn", "text" : {"$format" : "Hello *{name}*"}}, "block_id" : {"$slot" : "block_id", "default" : "greeting"}},
+    {"$component" : "Divider"},
+]
+
+
+def _write(directory, name : str, spec) -> str:
+    path = directory / f"{name}.json"
+    path.write_text(json.dumps(spec))
+    return path
+
+
+def test_render():
+    layout = Layout("report", compile_spec(SPEC))
+    blocks = layout(name="Ada")
+    assert blocks[0] == {"type" : "header", "text" : {"type" : "plain_text", "text" : "Report", "emoji" : False}}
+    assert blocks[1] == {"type" : "section", "text" : {"type" : "mrkdwn", "text" : "Hello *Ada*"}, "block_id" : "greeting"}
+    assert layout(name="Bob", block_id="b")[1]["block_id"] == "b"
+    assert isinstance(blocks[0], PersistentDict)
+    assert layout(name="Bob")[0] is blocks[0]
+
+
+def test_dynamic_models_render_like_static_ones():
+    spec = {"type" : "modal", "title" : {"$component" : "TextObject", "type" : "plain_text", "text" : {"$slot" : "title"}}, "blocks" : [
+        {"$component" : "TextObject", "type" : "plain_text", "text" : {"$slot" : "title"}},
+    ]}
+    static = {"type" : "modal", "title" : {"$component" : "TextObject", "type" : "plain_text", "text" : "Hi"}, "blocks" : [
+        {"$component" : "TextObject", "type" : "plain_text", "text" : "Hi"},
+    ]}
+    view = Layout("modal", compile_spec(spec))(title="Hi")
+    assert view == Layout("modal", compile_spec(static))()
+    assert json.loads(json.dumps(view))["title"] == {"type" : "plain_text", "text" : "Hi", "emoji" : False}
+
+
+def test_package_exports_only_the_public_api():
+    import slack_components as sc
+    for leaked in ("os", "pickle", "marshal", "mmap", "fcntl", "struct", "yaml", "json", "re", "version"):
+        assert not hasattr(sc, leaked), leaked
+    assert sc.LayoutLoader is LayoutLoader and sc.compile_spec is compile_spec
+
+
+def test_compile_errors():
+    with pytest.raises(RuntimeError, match="Unknown component"):
+        compile_spec({"$component" : "Nope"})
+    with pytest.raises(RuntimeError, match="missing required"):
+        compile_spec({"$component" : "HeaderBlock"})
+    with pytest.raises(RuntimeError, match="unexpected"):
+        compile_spec({"$component" : "Divider", "colour" : "red"})
+    with pytest.raises(RuntimeError, match="Missing value for slot 'name'"):
+        Layout("report", compile_spec(SPEC))(block_id="x")
+    with pytest.raises(RuntimeError, match="Missing value for slot"):
+        Layout("x", compile_spec({"$component" : "Divider", "block_id" : {"$slot" : "id"}}))()
+
+
+def test_disk_cache_is_reused(tmp_path, monkeypatch):
+    path = _write(tmp_path, "report", SPEC)
+    loader = LayoutLoader(tmp_path / "cache")
+    assert loader.load(path)(name="Ada")[1]["text"]["text"] == "Hello *Ada*"
+    compiled = []
+    monkeypatch.setattr(layouts, "compile_spec", lambda spec : compiled.append(spec) or compile_spec(spec))
+    assert loader.load(path)(name="Ada")[1]["text"]["text"] == "Hello *Ada*"
+    os.utime(path, ns=(1, 1))
+    loader.load(path)
+    assert compiled == []
+    _write(tmp_path, "report", SPEC[:1])
+    assert len(loader.load(path)()) == 1
+    assert compiled[0] == SPEC[:1]
+    assert list(LayoutLoader(tmp_path / "cache").load_directory(tmp_path)) == ["report"]
+
+
+def test_cache_is_recompiled_when_components_change(tmp_path):
+    spec = [{"$component" : "Banner", "text" : "hi"}]
+    path = _write(tmp_path, "banner", spec)
+    loader = LayoutLoader(tmp_path / "cache")
+    register_component("Banner", lambda text : {"type" : "section", "text" : {"type" : "plain_text", "text" : text}})
+    try:
+        assert loader.load(path)()[0]["type"] == "section"
+        register_component("Banner", lambda text : {"type" : "header", "text" : {"type" : "plain_text", "text" : text}})
+        assert loader.load(path)()[0]["type"] == "header"
+    finally:
+        del layouts.COMPONENTS["Banner"]
+        layouts._components_digest = None
+
+
+def test_cache_is_recompiled_on_upgrade(tmp_path, monkeypatch):
+    path = _write(tmp_path, "report", SPEC)
+    loader = LayoutLoader(tmp_path / "cache")
+    loader.load(path)
+    cache_path = loader._cache_path(path.resolve())
+    assert loader._read_cache(cache_path) is not None
+    monkeypatch.setattr(layouts, "_PACKAGE_VERSION", "99.0")
+    assert loader._read_cache(cache_path) is None
+    assert loader.load(path)(name="Ada")[2] == {"type" : "divider"}
+
+
+@pytest.mark.parametrize("content", [
+    b"",
+    b"not a pickle",
+    pickle.dumps({"key" : "x"})[:-3],
+    pickle.dumps([1, 2]),
+    b"\x80\x04\x95\x1c\x00\x00\x00\x00\x00\x00\x00\x8c\x0bno_such_mod\x94\x8c\x03Foo\x94\x93\x94.",
+    b"\x80\x04\x95\x12\x00\x00\x00\x00\x00\x00\x00\x8c\x08builtins\x94\x8c\x03Foo\x94\x93\x94.",
+])
+def test_corrupt_or_foreign_caches_are_ignored(tmp_path, content):
+    path = _write(tmp_path, "report", SPEC)
+    loader = LayoutLoader(tmp_path / "cache")
+    loader._cache_path(path.resolve()).write_bytes(content)
+    assert loader.load(path)(name="Ada")[0]["type"] == "header"
@@ -0,0 +1,83 @@
+import pytest
+from pydantic import ValidationError
+from slack_components import Actions , Button , Divider , HeaderBlock , SectionBlock , TextObject
+from slack_components.lazy import RenderContext , is_thunk , render
+
+
+def _text(value : str) -> TextObject:
+    return TextObject(type="plain_text", text=value)
+
+
+def test_thunks_are_rendered():
+    block = SectionBlock(text=lambda : _text("late"), block_id="a")
+    assert render(block) == {"type" : "section", "text" : {"type" : "plain_text", "text" : "late", "emoji" : False}, "block_id" : "a"}
+
+
+def test_untouched_trees_are_returned_as_is():
+    blocks = [SectionBlock(text=_text("a")), Divider()]
+    assert render(blocks) is blocks
+
+
+def test_thunks_returning_none_are_dropped():
+    blocks = [Divider(), lambda : None, SectionBlock(text=_text("a"), block_id=lambda : None)]
+    assert render(blocks) == [{"type" : "divider"}, {"type" : "section", "text" : _text("a").dict()}]
+
+
+def test_missing_required_fields_raise():
+    with pytest.raises(RuntimeError, match="text"):
+        render(SectionBlock(text=lambda : None))
+    with pytest.raises(RuntimeError, match="text"):
+        render(HeaderBlock(text=lambda : None))
+    with pytest.raises(RuntimeError, match="action_id"):
+        render(Actions(elements=[Button(text=_text("Go"), action_id=lambda : None)]))
+
+
+def test_models_reject_thunks():
+    with pytest.raises(ValidationError, match="thunk returning the whole TextObject"):
+        TextObject(type="plain_text", text=lambda : "late")
+
+
+def test_thunks_are_memoized_per_context():
+    calls = []
+    def shared():
+        calls.append(1)
+        return _text("shared")
+    with RenderContext():
+        render(SectionBlock(text=shared))
+        render(HeaderBlock(text=shared))
+    assert len(calls) == 1
+    render(SectionBlock(text=shared))
+    render(SectionBlock(text=shared))
+    assert len(calls) == 3
+
+
+def test_nested_contexts():
+    calls = []
+    def counted():
+        calls.append(1)
+        return "x"
+    with RenderContext() as outer:
+        render([counted])
+        with RenderContext() as inner:
+            render([counted])
+        render([counted])
+    assert len(calls) == 2
+    assert outer is not inner
+
+
+def test_thunks_returning_thunks_and_models():
+    assert render([lambda : lambda : _text("deep")]) == [_text("deep").dict()]
+
+
+def test_is_thunk():
+    assert is_thunk(lambda : 1)
+    assert not is_thunk(TextObject)
+    assert not is_thunk(_text("a"))
+    assert not is_thunk("text")
+
+
+def test_only_thunks_returning_none_are_dropped():
+    assert render([None, lambda : 1]) == [None, 1]
+    assert render([None, 2]) == [None, 2]
+    assert render([lambda : None, 2]) == [2]
+    assert render({"a" : None, "b" : lambda : 1, "c" : lambda : None}) == {"a" : None, "b" : 1}
@@ -0,0 +1,82 @@
+from slack_components.markdown import HEADER_TEXT_LIMIT , SECTION_TEXT_LIMIT , iter_markdown_blocks , iter_markdown_messages
+
+
+def _texts(markdown : str) -> list:
+    return [(block["type"], block.get("text", {}).get("text")) for block in iter_markdown_blocks(markdown)]
+
+
+def test_block_types():
+    markdown = "# Title\n\nSome *text* and **bold**.\n\n- one\n- [two](https://example.com)\n\n---\n\n> quoted\n\n![logo](https://example.com/a.png)\n\nSub\n==="
+    blocks = list(iter_markdown_blocks(markdown))
+    assert [block["type"] for block in blocks] == ["header", "section", "section", "divider", "context", "image", "header"]
+    assert blocks[0]["text"] == {"type" : "plain_text", "text" : "Title", "emoji" : False}
+    assert blocks[1]["text"]["text"] == "Some _text_ and *bold*."
+    assert blocks[2]["text"]["text"] == "• one\n• <https://example.com|two>"
+    assert blocks[4]["elements"][0]["text"] == "quoted"
+    assert blocks[5]["image_url"] == "https://example.com/a.png"
+    assert blocks[6]["text"]["text"] == "Sub"
+
+
+def test_text_is_escaped():
+    assert _texts("a <b> & c") == [("section", "a &lt;b&gt; &amp; c")]
+    assert _texts("use `<div>` here") == [("section", "use `&lt;div&gt;` here")]
+
+
+def test_fenced_code_is_escaped():
+    assert _texts("```html\n<div>a & b</div>\n```") == [("section", "```\n&lt;div&gt;a &amp; b&lt;/div&gt;\n```")]
+
+
+def test_long_fenced_code_keeps_its_indentation():
+    lines = [f"    line {i}: " + "x" * 60 for i in range(200)]
+    blocks = _texts("```\n" + "\n".join(lines) + "\n```")
+    assert len(blocks) > 1
+    pieces = []
+    for kind , text in blocks:
+        assert kind == "section"
+        assert len(text) <= SECTION_TEXT_LIMIT
+        assert text.startswith("```\n    line ") and text.endswith("\n```")
+        pieces.append(text[4:-4])
+    assert "\n".join(pieces).split("\n") == lines
+
+
+def test_long_paragraphs_are_split():
+    words = " ".join(f"word{i}" for i in range(2000))
+    blocks = _texts(words)
+    assert len(blocks) > 1
+    assert all(len(text) <= SECTION_TEXT_LIMIT for _ , text in blocks)
+    assert " ".join(text for _ , text in blocks) == words
+
+
+def test_hard_splits_do_not_cut_entities():
+    blocks = _texts("&" * 5000)
+    assert "".join(text for _ , text in blocks) == "&amp;" * 5000
+    assert all(text.endswith(";") for _ , text in blocks)
+
+
+def test_long_headers_are_truncated():
+    assert len(_texts("# " + "h" * 500)[0][1]) == HEADER_TEXT_LIMIT
+
+
+def test_unclosed_fence_is_flushed():
+    assert _texts("```\ncode") == [("section", "```\ncode\n```")]
+
+
+def test_lines_are_read_lazily():
+    def lines():
+        yield "# Title"
+        raise AssertionError("read too far")
+    assert next(iter_markdown_blocks(lines()))["type"] == "header"
+
+
+def test_messages():
+    markdown = "\n\n".join(f"paragraph {i}" for i in range(120))
+    messages = list(iter_markdown_messages(markdown))
+    assert [len(message) for message in messages] == [50, 50, 20]
+    assert [len(message) for message in iter_markdown_messages(markdown, max_blocks=100)] == [100, 20]
+
+
+def test_setext_titles_are_built_from_the_markdown_source():
+    blocks = list(iter_markdown_blocks("See [docs](http://x) & **more** <now>\n==="))
+    assert blocks == [{"type" : "header", "text" : {"type" : "plain_text", "text" : "See docs & more <now>", "emoji" : False}}]
+    blocks = list(iter_markdown_blocks("Intro\n\nTwo `lines`\nof *title*\n---"))
+    assert blocks[-1]["text"]["text"] == "Two lines of title"
@@ -0,0 +1,67 @@
+from slack_components import SectionBlock , TextObject
+from slack_components.metrics import BuilderStats , Instrumentation , SpanExporter , disable_instrumentation , enable_instrumentation , instrumentation , prometheus_text
+
+
+def test_percentiles():
+    stats = BuilderStats("b")
+    for i in range(1, 101):
+        stats.add(i / 1000, 10)
+    assert stats.calls == 100
+    assert stats.total_bytes == 1000
+    assert stats.percentile(0) == 0.001
+    assert stats.percentile(50) in (0.05, 0.051)
+    assert stats.percentile(99) == 0.099
+    assert stats.percentile(100) == 0.1
+    assert BuilderStats("empty").percentile(50) == 0.0
+
+
+def test_percentiles_use_recent_samples():
+    stats = BuilderStats("b", sample_size=10)
+    for i in range(100):
+        stats.add(float(i))
+    assert stats.calls == 100
+    assert stats.percentile(0) == 90.0
+
+
+def test_builders_are_recorded():
+    instrumentation.reset()
+    enable_instrumentation()
+    try:
+        SectionBlock(text=TextObject(type="plain_text", text="hello"))
+        SectionBlock(text=TextObject(type="plain_text", text="world"))
+    finally:
+        disable_instrumentation()
+    snapshot = instrumentation.snapshot()
+    assert snapshot["SectionBlock"]["calls"] == 2
+    assert snapshot["SectionBlock"]["total_bytes"] > 0
+    SectionBlock(text=TextObject(type="plain_text", text="off"))
+    assert instrumentation.snapshot()["SectionBlock"]["calls"] == 2
+    instrumentation.reset()
+
+
+def test_spans_end_on_their_exporter_when_disabled_mid_call():
+    ended = []
+    exporter = SpanExporter(on_start=lambda name : ("span", name), on_end=lambda span , *rest : ended.append(span))
+    registry = Instrumentation()
+    registry.exporters = [exporter]
+    token = registry.start("SectionBlock")
+    registry.exporters = [SpanExporter(on_end=lambda *args : ended.append("wrong exporter"))]
+    registry.record("SectionBlock", token, {"type" : "section"})
+    assert ended == [("span", "SectionBlock")]
+    token = registry.start("Divider")
+    registry.exporters = []
+    registry.record("Divider", token, {"type" : "divider"})
+    assert ended == [("span", "SectionBlock"), "wrong exporter"]
+
+
+def test_prometheus_text():
+    registry = Instrumentation()
+    registry.record("Divider", registry.start("Divider"), {"type" : "divider"})
+    text = prometheus_text(registry, prefix="sc")
+    lines = text.splitlines()
+    assert text.endswith("\n")
+    assert "# TYPE sc_calls_total counter" in lines
+    assert 'sc_calls_total{builder="Divider"} 1' in lines
+    assert 'sc_payload_bytes_total{builder="Divider"} 19' in lines
+    assert 'sc_seconds_count{builder="Divider"} 1' in lines
+    assert any(line.startswith('sc_seconds{builder="Divider",quantile="0.99"} ') for line in lines)
@@ -0,0 +1,160 @@
+import time
+import pytest
+from slack_components import Divider , SectionBlock , TextObject
+from slack_components.executor import RenderExecutor
+from slack_components.pagination import InvalidCursor , Paginator , decode_cursor , encode_cursor
+
+ROWS = list(range(250))
+
+
+class Source:
+    def __init__(self, rows = ROWS):
+        self.rows = rows
+        self.calls = []
+
+    def __call__(self, cursor , limit : int):
+        self.calls.append(cursor)
+        start = cursor or 0
+        end = start + limit
+        return self.rows[start:end] , (end if end < len(self.rows) else None)
+
+
+def row_to_blocks(row : int) -> list:
+    blocks = [SectionBlock(text=TextObject(type="plain_text", text=f"row {row}"))]
+    return blocks + [Divider()] if row % 2 else blocks
+
+
+def _rows(page) -> list:
+    return [int(block["text"]["text"][4:]) for block in page.blocks if block["type"] == "section"]
+
+
+def _wait_for_prefetch(paginator : Paginator):
+    deadline = time.monotonic() + 5
+    while paginator.stats()["prefetching"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_pages_cover_every_row_once_within_the_block_limit():
+    with Paginator(Source(), row_to_blocks, batch_size=40, max_blocks=30) as paginator:
+        seen , cursor , indices = [] , None , []
+        while True:
+            page = paginator.page(cursor)
+            assert len(page.blocks) <= 30
+            seen += _rows(page)
+            indices.append(page.index)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+    assert seen == ROWS
+    assert indices == list(range(len(indices)))
+    assert page.blocks[-1]["elements"][0]["action_id"] == "page_previous"
+    assert len(page.blocks[-1]["elements"]) == 1
+
+
+def test_rows_are_never_split_across_pages():
+    with Paginator(Source(), row_to_blocks, max_blocks=4, prefetch=False) as paginator:
+        first = paginator.page()
+        assert _rows(first) == [0, 1]
+        assert len(first.blocks) == 4
+        assert _rows(paginator.page(first.next_cursor)) == [2, 3]
+
+
+def test_single_page():
+    with Paginator(Source(ROWS[:3]), row_to_blocks) as paginator:
+        page = paginator.page()
+    assert _rows(page) == [0, 1, 2]
+    assert page.next_cursor is None and page.previous_cursor is None
+    assert all(block["type"] != "actions" for block in page.blocks)
+
+
+def test_empty_source():
+    with Paginator(Source([]), row_to_blocks) as paginator:
+        assert paginator.page().blocks == []
+
+
+def test_oversized_row_raises():
+    with Paginator(Source(), lambda row : [Divider()] * 10, max_blocks=5, prefetch=False) as paginator:
+        with pytest.raises(RuntimeError, match="more than"):
+            paginator.page()
+
+
+def test_page_turns_are_served_from_the_prefetched_cache():
+    source = Source()
+    with Paginator(source, row_to_blocks, max_blocks=20) as paginator:
+        first = paginator.page()
+        _wait_for_prefetch(paginator)
+        fetches = len(source.calls)
+        second = paginator.page(first.next_cursor)
+        assert paginator.stats()["hits"] == 1
+        assert paginator.stats()["misses"] == 1
+        assert len(source.calls) == fetches
+        _wait_for_prefetch(paginator)
+        previous = paginator.page(second.previous_cursor)
+        assert previous.index == 0
+        assert _rows(previous) == _rows(first)
+        assert paginator.stats()["hits"] == 2
+
+
+def test_previous_after_prefetch_points_to_the_page_before():
+    with Paginator(Source(), row_to_blocks, max_blocks=10) as paginator:
+        cursor = None
+        pages = []
+        for _ in range(4):
+            page = paginator.page(cursor)
+            _wait_for_prefetch(paginator)
+            pages.append(page)
+            cursor = page.next_cursor
+        back = paginator.page(pages[3].previous_cursor)
+        assert back.index == 2
+        assert _rows(back) == _rows(pages[2])
+        assert _rows(paginator.page(back.previous_cursor)) == _rows(pages[1])
+
+
+def test_previous_falls_back_to_the_first_page_when_unknown():
+    with Paginator(Source(), row_to_blocks, max_blocks=10, prefetch=False) as first_worker:
+        third = first_worker.page(first_worker.page(first_worker.page().next_cursor).next_cursor)
+    with Paginator(Source(), row_to_blocks, max_blocks=10, prefetch=False) as other_worker:
+        page = other_worker.page(third.cursor)
+        assert _rows(page) == _rows(third)
+        assert decode_cursor(page.previous_cursor) == ([None, 0], 0)
+
+
+def test_view_and_actions():
+    with Paginator(Source(), row_to_blocks, reserved_blocks=1, prefetch=False) as paginator:
+        view = paginator.view(title={"type" : "plain_text", "text" : "Rows"}, blocks=[Divider()])
+        assert view["type"] == "modal"
+        assert view["blocks"][0] == {"type" : "divider"}
+        assert len(view["blocks"]) <= 100
+        next_button = view["blocks"][-1]["elements"][-1]
+        body = {"actions" : [{"action_id" : next_button["action_id"], "value" : next_button["value"]}]}
+        assert paginator.cursor_from_action(body) == next_button["value"]
+        assert paginator.cursor_from_action({"actions" : [{"action_id" : "other", "value" : "x"}]}) is None
+        with pytest.raises(RuntimeError, match="reserved"):
+            paginator.view(blocks=[Divider(), Divider()])
+
+
+@pytest.mark.parametrize("cursor", ["", "!!!", "bm90IGpzb24", encode_cursor([None, 0], -1)[:-2], "W1tudWxsLCAtMV0sIDBd", "WzEsIDJd", "eyJhIjogMX0"])
+def test_forged_cursors_raise_invalid_cursor(cursor):
+    with pytest.raises(InvalidCursor):
+        decode_cursor(cursor)
+    with Paginator(Source(), row_to_blocks, prefetch=False) as paginator:
+        with pytest.raises(InvalidCursor):
+            paginator.page(cursor or "=")
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor(["abc", 3], 7)) == (["abc", 3], 7)
+
+
+def test_close_shuts_the_dedicated_executor_down():
+    paginator = Paginator(Source(), row_to_blocks)
+    paginator.page()
+    paginator.close()
+    with pytest.raises(RuntimeError):
+        paginator.executor._pool.submit(print)
+    assert paginator.page().index == 0
+    shared = RenderExecutor(max_workers=1)
+    with Paginator(Source(), row_to_blocks, executor=shared) as paginator:
+        paginator.page()
+    assert shared.submit(lambda : []).result(5) == []
+    shared.shutdown()
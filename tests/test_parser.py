@@ -0,0 +1,113 @@
+import io
+import json
+import pytest
+from slack_components import (
+    Actions , Button , ContextBlock , DatePicker , Divider , HeaderBlock , ImageBlock , InputBlock , OptionObject ,
+    PlainTextInput , SectionBlock , SelectStatic , TextObject ,
+)
+from slack_components.parser import iter_messages , parse_block , parse_blocks , parse_message
+
+
+class _Pieces(io.RawIOBase):
+    """A binary file returning the given pieces, whatever the size asked."""
+
+    def __init__(self, pieces):
+        self.pieces = list(pieces)
+
+    def read(self, size = -1):
+        return self.pieces.pop(0) if self.pieces else b""
+
+
+def _splits(data : bytes):
+    for offset in range(len(data) + 1):
+        yield [piece for piece in (data[:offset], data[offset:]) if piece]
+
+
+def _text(value : str) -> TextObject:
+    return TextObject(type="plain_text", text=value)
+
+
+def _blocks():
+    options = [OptionObject(text=_text("One"), value="1").dict(), OptionObject(text=_text("Two"), value="2").dict()]
+    return [
+        HeaderBlock(text=_text("Report")),
+        SectionBlock(text=TextObject(type="mrkdwn", text="*bold* é"), block_id="s", accessory=Button(text=_text("Go"), action_id="go", value="1")),
+        Divider(),
+        ImageBlock(image_url="https://example.com/a.png", alt_text="a"),
+        ContextBlock(elements=[_text("ctx").dict()]),
+        Actions(elements=[SelectStatic(action_id="pick", options=options), DatePicker(action_id="day", initial_date="2024-01-01")]),
+        InputBlock(label=_text("Name"), element=PlainTextInput(action_id="name")),
+    ]
+
+
+DOCUMENTS = [
+    b'{"n": 1.25, "messages": [{"a":1}]}',
+    b'{"ok": true, "big": 2e10, "neg": -0.5e-3, "none": null, "messages": [{"a": 1.5}, {"b": [2e10, -7]}], "has_more": false}',
+    b'[{"a": 1.25}, {"b": 2e10}, {"c": true}]',
+    b'  [ ]  ',
+    '{"messages": [{"text": "caf\\u00e9 é"}]}'.encode(),
+]
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_chunk_boundaries_at_every_offset(document):
+    data = json.loads(document)
+    expected = data if isinstance(data, list) else data["messages"]
+    for pieces in _splits(document):
+        assert list(iter_messages(_Pieces(pieces), parse=False)) == expected, pieces
+    for chunk_size in range(1, len(document) + 1):
+        assert list(iter_messages(document, parse=False, chunk_size=chunk_size)) == expected, chunk_size
+        assert list(iter_messages(io.BytesIO(document), parse=False, chunk_size=chunk_size)) == expected, chunk_size
+
+
+def test_object_without_messages():
+    assert list(iter_messages(b'{"ok": 1.5, "other": [1, 2]}', chunk_size=3)) == []
+
+
+def test_top_level_scalars_and_custom_key():
+    document = b'{"n": 12345, "items": [{"x": 10}, {"x": 2.5e3}]}'
+    for chunk_size in range(1, len(document) + 1):
+        assert list(iter_messages(document, key="items", parse=False, chunk_size=chunk_size)) == [{"x" : 10}, {"x" : 2500.0}]
+
+
+def test_text_files(tmp_path):
+    path = tmp_path / "history.json"
+    path.write_text(json.dumps({"messages" : [{"blocks" : _blocks()}]}))
+    assert list(iter_messages(str(path), chunk_size=7)) == [{"blocks" : _blocks()}]
+    with open(path) as fp:
+        assert list(iter_messages(fp, chunk_size=5)) == [{"blocks" : _blocks()}]
+
+
+def test_truncated_documents_raise():
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_messages(b'{"messages": [{"a": 1}, {"b": ', chunk_size=4))
+
+
+def test_parse_round_trips():
+    blocks = _blocks()
+    assert parse_blocks(json.loads(json.dumps(blocks))) == blocks
+    assert parse_message({"text" : "t", "blocks" : blocks, "attachments" : [{"blocks" : blocks}]}) == {
+        "text" : "t", "blocks" : blocks, "attachments" : [{"blocks" : blocks}],
+    }
+    assert parse_blocks(parse_blocks(blocks)) == blocks
+
+
+def test_parse_keeps_unknown_fields_and_types():
+    block = {"type" : "section", "text" : {"type" : "plain_text", "text" : "x", "emoji" : True}, "extra" : 1}
+    assert parse_block(block) == block
+    assert parse_block({"type" : "rich_text", "elements" : []}) == {"type" : "rich_text", "elements" : []}
+    with pytest.raises(RuntimeError):
+        parse_block({"type" : "rich_text", "elements" : []}, strict=True)
+
+
+def test_objects_the_builders_can_not_express_are_kept():
+    image = {"type" : "image", "block_id" : "pic", "slack_file" : {"url" : "https://files.slack.com/x.png"}, "alt_text" : "x"}
+    button = {"type" : "button", "action_id" : "go", "text" : {"type" : "plain_text"}}
+    assert parse_block(image) == image
+    assert parse_block({"type" : "actions", "elements" : [button]})["elements"] == [button]
+    message = b'{"messages": [{"blocks": [' + json.dumps(image).encode() + b']}, {"text": "next"}]}'
+    assert [m.get("text") for m in iter_messages(io.BytesIO(message))] == [None, "next"]
+    with pytest.raises(RuntimeError, match="'image' object 'pic' with ImageBlock"):
+        parse_block(image, strict=True)
+    with pytest.raises(RuntimeError, match="'button' object 'go' with Button"):
+        parse_block({"type" : "actions", "elements" : [button]}, strict=True)
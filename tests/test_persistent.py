@@ -0,0 +1,86 @@
+import copy
+import json
+import pickle
+import pytest
+from slack_components import Actions , Button , SectionBlock , TextObject
+from slack_components.persistent import PersistentDict , PersistentList , freeze , get_in , set_in , thaw
+
+
+def _blocks():
+    return [
+        SectionBlock(text=TextObject(type="plain_text", text="first"), block_id="a"),
+        SectionBlock(text=TextObject(type="plain_text", text="second"), block_id="b"),
+        Actions(elements=[Button(text=TextObject(type="plain_text", text="Go"), action_id="go", value="1")]),
+    ]
+
+
+def test_frozen_tree_equals_its_source():
+    blocks = _blocks()
+    frozen = freeze(blocks)
+    assert frozen == blocks
+    assert blocks == frozen
+    assert not frozen != blocks
+    assert frozen != blocks[:2]
+    assert frozen == tuple(frozen)
+    assert thaw(frozen) == blocks
+    assert json.dumps(frozen) == json.dumps(blocks)
+
+
+def test_set_in_shares_untouched_subtrees():
+    frozen = freeze(_blocks())
+    updated = set_in(frozen, (1, "text", "text"), "changed")
+    assert get_in(updated, "1.text.text") == "changed"
+    assert get_in(frozen, "1.text.text") == "second"
+    assert updated[0] is frozen[0]
+    assert updated[2] is frozen[2]
+    assert updated[1]["text"] is not frozen[1]["text"]
+    assert updated[1]["block_id"] is frozen[1]["block_id"]
+    assert updated.set_in("2.elements.0.value", "2")[2].elements[0].value == "2"
+
+
+def test_updates_return_copies():
+    frozen = freeze(_blocks())
+    assert len(frozen.append({"type" : "divider"})) == 4
+    assert frozen.insert(0, {"type" : "divider"})[0] == {"type" : "divider"}
+    assert frozen.remove(0)[0] is frozen[1]
+    assert "block_id" not in frozen[0].remove("block_id")
+    assert len(frozen) == 3
+    assert freeze(frozen) is frozen
+
+
+def test_immutability():
+    frozen = freeze(_blocks())
+    with pytest.raises(TypeError):
+        frozen[0]["type"] = "divider"
+    with pytest.raises(TypeError):
+        frozen[0].update(type="divider")
+    with pytest.raises(TypeError):
+        del frozen[0]["block_id"]
+    with pytest.raises(TypeError):
+        frozen[0] = {}
+    assert copy.deepcopy(frozen) is frozen
+
+
+def test_pickling():
+    frozen = freeze(_blocks())
+    loaded = pickle.loads(pickle.dumps(frozen))
+    assert loaded == frozen
+    assert isinstance(loaded, PersistentList)
+    assert isinstance(loaded[0], PersistentDict)
+    assert isinstance(loaded[2].elements, PersistentList)
+
+
+def test_numeric_string_keys():
+    frozen = freeze({"values" : {"123" : {"a" : 1}}, "blocks" : [{"block_id" : "0"}]})
+    updated = set_in(frozen, "values.123.a", 2)
+    assert updated == {"values" : {"123" : {"a" : 2}}, "blocks" : [{"block_id" : "0"}]}
+    assert get_in(updated, "values.123.a") == 2
+    assert get_in(updated, "blocks.0.block_id") == "0"
+    assert set_in(frozen, "values.7.a", 1)["values"]["7"] == {"a" : 1}
+    assert get_in(frozen, "blocks.-1.block_id") == "0"
+
+
+def test_get_in_defaults():
+    frozen = freeze(_blocks())
+    assert get_in(frozen, (5, "text"), "none") == "none"
+    assert get_in(frozen, "0.missing") is None
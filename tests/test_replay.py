@@ -0,0 +1,136 @@
+import gzip
+import pytest
+from slack_components.replay import PayloadRecorder , format_report , iter_recorded , replay
+
+TYPED = ["secret query", "my typed text", "hush hush", "confidential note", "dm content", "rich secret", "meta secret"]
+
+
+def _payloads():
+    user = {"id" : "U0123ABCD", "username" : "ada.lovelace", "name" : "ada.lovelace", "team_id" : "T0123ABCD"}
+    return [
+        {"type" : "block_suggestion", "user" : user, "action_id" : "search", "block_id" : "b1", "value" : "secret query", "token" : "tok"},
+        {
+            "type" : "block_actions",
+            "user" : user,
+            "trigger_id" : "123.456",
+            "response_url" : "https://hooks.slack.com/x",
+            "actions" : [
+                {"type" : "plain_text_input", "action_id" : "note", "block_id" : "b2", "value" : "my typed text", "action_ts" : "1.2"},
+                {"type" : "button", "action_id" : "approve", "block_id" : "b3", "value" : "APPROVED", "action_ts" : "1.3"},
+                {"type" : "static_select", "action_id" : "pick", "block_id" : "b3", "selected_option" : {"text" : {"type" : "plain_text", "text" : "A"}, "value" : "ABC1234"}},
+                {"type" : "users_select", "action_id" : "who", "block_id" : "b3", "selected_user" : "W0123ABCD"},
+            ],
+            "message" : {
+                "type" : "message", "ts" : "1.1", "user" : "U0123ABCD", "text" : "dm content",
+                "blocks" : [{"type" : "section", "block_id" : "b3", "text" : {"type" : "mrkdwn", "text" : "confidential note"}}],
+            },
+        },
+        {
+            "type" : "view_submission",
+            "user" : user,
+            "view" : {
+                "id" : "V0123ABCD",
+                "callback_id" : "form",
+                "private_metadata" : "meta secret",
+                "state" : {"values" : {
+                    "b4" : {"day" : {"type" : "datepicker", "selected_date" : "2024-05-17"}},
+                    "b5" : {"time" : {"type" : "timepicker", "selected_time" : "09:30"}},
+                    "b8" : {"plan" : {"type" : "static_select", "selected_option" : {"text" : {"type" : "plain_text", "text" : "Pro"}, "value" : "pro"}}},
+                    "b9" : {"tags" : {"type" : "multi_static_select", "selected_options" : [{"text" : {"type" : "plain_text", "text" : "A"}, "value" : "tag_a"}]}},
+                    "b6" : {"text" : {"type" : "plain_text_input", "value" : "hush hush"}},
+                    "b7" : {"rich" : {"type" : "rich_text_input", "rich_text_value" : {"type" : "rich_text", "elements" : [
+                        {"type" : "rich_text_section", "elements" : [{"type" : "text", "text" : "rich secret"}]},
+                    ]}}},
+                }},
+            },
+        },
+    ]
+
+
+def _record(path , **kwargs) -> str:
+    with PayloadRecorder(str(path), salt="s3cret", **kwargs) as recorder:
+        for payload in _payloads():
+            assert recorder.record(payload)
+        assert not recorder.record({"type" : "event_callback"})
+    with gzip.open(path, "rt") as fp:
+        return fp.read()
+
+
+def test_no_typed_text_reaches_the_log(tmp_path):
+    log = _record(tmp_path / "log.jsonl.gz")
+    for text in TYPED + ["U0123ABCD", "T0123ABCD", "V0123ABCD", "W0123ABCD", "ada.lovelace", "tok", "123.456", "hooks.slack.com"]:
+        assert text not in log, text
+
+
+def test_structure_is_kept(tmp_path):
+    path = tmp_path / "log.jsonl.gz"
+    _record(path)
+    suggestion , action , submission = [payload for _ , payload in iter_recorded(str(path))]
+    assert suggestion["value"] == "x" * len("secret query")
+    assert suggestion["action_id"] == "search"
+    assert action["actions"][0]["value"] == "x" * len("my typed text")
+    assert action["actions"][1]["value"] == "APPROVED"
+    assert action["actions"][2]["selected_option"]["value"] == "ABC1234"
+    assert action["actions"][3]["selected_user"].startswith("W")
+    values = submission["view"]["state"]["values"]
+    assert values["b4"]["day"]["selected_date"] == "2024-05-17"
+    assert values["b5"]["time"]["selected_time"] == "09:30"
+    assert values["b6"]["text"]["value"] == "x" * len("hush hush")
+    assert values["b8"]["plan"]["selected_option"]["value"] == "pro"
+    assert values["b9"]["tags"]["selected_options"][0]["value"] == "tag_a"
+    assert action["actions"][1]["action_id"] == "approve"
+    assert action["message"]["ts"] == "1.1"
+    assert action["message"]["blocks"][0]["block_id"] == "b3"
+    assert action["message"]["blocks"][0]["text"]["type"] == "mrkdwn"
+    assert submission["view"]["callback_id"] == "form"
+    assert submission["view"]["state"]["values"]["b4"]["day"]["type"] == "datepicker"
+    assert action["user"]["id"].startswith("U") and action["user"]["id"] != "U0123ABCD"
+    assert action["user"]["id"] == submission["user"]["id"]
+
+
+def test_pseudonyms_depend_on_the_salt(tmp_path):
+    first = PayloadRecorder(str(tmp_path / "a.gz"), salt="one")
+    second = PayloadRecorder(str(tmp_path / "b.gz"), salt="two")
+    long = PayloadRecorder(str(tmp_path / "c.gz"), salt="x" * 100)
+    try:
+        assert first.sanitize({"user_id" : "U0123ABCD"}) == first.sanitize({"user_id" : "U0123ABCD"})
+        assert first.sanitize({"user_id" : "U0123ABCD"}) != second.sanitize({"user_id" : "U0123ABCD"})
+        assert long.sanitize({"user_id" : "U0123ABCD"})["user_id"].startswith("U")
+    finally:
+        first.close()
+        second.close()
+        long.close()
+
+
+def test_salt_is_required(tmp_path):
+    with pytest.raises(TypeError):
+        PayloadRecorder(str(tmp_path / "log.gz"))
+    with pytest.raises(RuntimeError):
+        PayloadRecorder(str(tmp_path / "log.gz"), salt="")
+
+
+def test_masking_can_be_disabled(tmp_path):
+    log = _record(tmp_path / "log.jsonl.gz", mask_values=False)
+    assert "secret query" in log
+    assert "meta secret" in log
+    assert "U0123ABCD" not in log
+
+
+def test_replay(tmp_path):
+    path = tmp_path / "log.jsonl.gz"
+    _record(path)
+    seen = []
+    handlers = {"search" : seen.append, "note" : seen.append, "form" : lambda payload : 1 / 0}
+    summary = replay(str(path), handlers, repeat=2, track_allocations=False)
+    assert summary["search"]["calls"] == 2
+    assert summary["note"]["calls"] == 2
+    assert summary["form"]["errors"] == 2
+    assert len(seen) == 4
+    assert "search" in format_report(summary)
+
+
+def test_replay_repeats_a_generator(tmp_path):
+    path = tmp_path / "log.jsonl.gz"
+    _record(path)
+    summary = replay(iter_recorded(str(path)), {"search" : lambda payload : None}, repeat=3, track_allocations=False)
+    assert summary["search"]["calls"] == 3
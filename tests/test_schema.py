@@ -0,0 +1,139 @@
+from inspect import Parameter , getsource , signature
+from pathlib import Path
+from itertools import combinations
+from typing import get_args , get_origin , List , Literal
+import re
+import pytest
+from slack_components import blocks , elements
+from slack_components.commons import (
+    ConfirmDialogObject , DispatchActionObject , FilterObject , OptionGroupObject , OptionObject , TextObject , TriggerObject , WorkFlowObject ,
+)
+from slack_components.schema import _MODULES , BLOCKS , ELEMENTS , Component , Field , generate , module_source
+from . import legacy_blocks , legacy_elements
+
+_text = TextObject(type="plain_text", text="text")
+_option = OptionObject(text=_text, value="1")
+MODELS = {
+    TextObject : _text,
+    OptionObject : _option,
+    OptionGroupObject : OptionGroupObject(label=_text, options=[_option]),
+    ConfirmDialogObject : ConfirmDialogObject(title=_text, text=_text, confirm=_text, deny=_text, style="danger"),
+    DispatchActionObject : DispatchActionObject(trigger_action_on=["on_enter_pressed"]),
+    FilterObject : FilterObject(include=["im"]),
+    WorkFlowObject : WorkFlowObject(trigger=TriggerObject(url="https://example.com", customizable_input_parameters=[])),
+}
+CHANGED_DEFAULTS = {("WorkflowButton", "accessibility_label") : None}
+"""Parameters made optional since the builders are generated."""
+
+
+def _sample(annotation , as_dict : bool):
+    if annotation in MODELS:
+        return MODELS[annotation].dict() if as_dict else MODELS[annotation]
+    if annotation is bool:
+        return True
+    if annotation is int:
+        return 3
+    if get_origin(annotation) is Literal:
+        return get_args(annotation)[-1]
+    if annotation is List or get_origin(annotation) is list:
+        return [_option.dict(), {"type" : "plain_text", "text" : "item"}]
+    if annotation is object:
+        return {"type" : "plain_text_input", "action_id" : "input"}
+    return "value"
+
+
+
+def _legacy():
+    modules = (legacy_blocks, legacy_elements)
+    return {name : getattr(module, name) for module in modules for name in dir(module) if name[:1].isupper() and hasattr(getattr(module, name), "__wrapped__")}
+
+
+LEGACY = _legacy()
+GENERATED = {component.name : getattr(blocks if component in BLOCKS else elements, component.name) for component in BLOCKS + ELEMENTS}
+
+
+def _call(builder , kwargs : dict):
+    try:
+        return builder(**kwargs)
+    except RuntimeError as exc:
+        return ("RuntimeError", str(exc))
+
+
+def test_every_builder_is_generated():
+    assert sorted(LEGACY) == sorted(GENERATED)
+
+
+@pytest.mark.parametrize("name", sorted(LEGACY))
+def test_signatures_match(name):
+    legacy = signature(LEGACY[name]).parameters
+    # keyword-only parameters are deprecated names, see test_renamed_arguments
+    generated = {key : p for key , p in signature(GENERATED[name]).parameters.items() if p.kind is not Parameter.KEYWORD_ONLY}
+    assert list(legacy) == list(generated)
+    for key , parameter in legacy.items():
+        expected = CHANGED_DEFAULTS.get((name, key), parameter.default)
+        assert generated[key].default == (Parameter.empty if expected is Parameter.empty else expected), key
+
+
+@pytest.mark.parametrize("name", sorted(LEGACY))
+def test_outputs_match_for_every_argument_combination(name):
+    legacy , generated = LEGACY[name] , GENERATED[name]
+    parameters = signature(legacy).parameters
+    required = [key for key , p in parameters.items() if p.default is Parameter.empty]
+    optional = [key for key , p in parameters.items() if p.default is not Parameter.empty]
+    thunk = lambda : "late"
+    for as_dict in (False, True):
+        base = {key : _sample(parameters[key].annotation, as_dict) for key in required}
+        for size in range(len(optional) + 1):
+            for chosen in combinations(optional, size):
+                kwargs = {**base, **{key : _sample(parameters[key].annotation, as_dict) for key in chosen}}
+                assert _call(generated, kwargs) == _call(legacy, kwargs), kwargs
+                nones = {**base, **{key : None for key in chosen}}
+                assert _call(generated, nones) == _call(legacy, nones), nones
+        for key in optional + required:
+            if parameters[key].annotation not in (bool, int):
+                kwargs = {**base, key : thunk}
+                assert _call(generated, kwargs) == _call(legacy, kwargs), key
+
+
+@pytest.mark.parametrize("component", BLOCKS + ELEMENTS, ids=lambda component : component.name)
+def test_documented_arguments_exist(component):
+    documented = re.findall(r"^\s{12}(\w+) \(", component.doc, re.M)
+    names = [field.name for field in component.fields]
+    assert all(name in names for name in documented), set(documented) - set(names)
+
+
+def test_renamed_arguments():
+    with pytest.warns(DeprecationWarning, match="acessibility_label"):
+        button = elements.Button(text=_text, action_id="a", acessibility_label=_text)
+    assert button["accessibility_label"] == _text.dict() and "acessibility_label" not in button
+    with pytest.warns(DeprecationWarning, match="initial_options"):
+        radio = elements.RadioButtonGroup("a", [_option], initial_options=_option)
+    assert radio["initial_option"] == _option.dict() and "initial_options" not in radio
+    with pytest.raises(TypeError):
+        elements.Button(_text, "a", None, None, None, None, None, _text)
+
+
+def test_generated_source_is_inspectable():
+    builder = generate((Component("Probe", "probe", (Field("a", str), Field("b", bool, False)), "Doc."),), "probe")["Probe"]
+    assert builder("x") == {"type" : "probe", "a" : "x", "b" : False}
+    assert builder.__doc__ == "Doc."
+    assert "def Probe(\n    a : str,\n    b : bool = False,\n):" in builder.__source__
+    assert signature(builder).parameters["a"].annotation is str
+
+
+@pytest.mark.parametrize("module", [blocks, elements], ids=lambda module : module.__name__)
+def test_checked_in_modules_are_up_to_date(module):
+    schema , doc = _MODULES[module.__name__.rpartition(".")[2]]
+    expected = module_source(BLOCKS if schema == "BLOCKS" else ELEMENTS, doc)
+    assert Path(module.__file__).read_text() == expected, "run slack_components.schema.write_modules()"
+
+
+def test_checked_in_builders_are_plain_functions():
+    assert "def SectionBlock(" in getsource(blocks.SectionBlock)
+    assert signature(elements.Button).parameters["text"].annotation is TextObject
+    assert sorted(blocks.__all__ + elements.__all__) == sorted(GENERATED)
+
+
+def test_defaults_must_be_literals():
+    with pytest.raises(RuntimeError, match="Probe.a"):
+        generate((Component("Probe", "probe", (Field("a", object, object()),), ""),), "probe")
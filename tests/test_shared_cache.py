@@ -0,0 +1,150 @@
+import os
+import struct
+import pytest
+from slack_components import SectionBlock , TextObject
+from slack_components.shared_cache import SharedRenderCache , _SLOT , _key_hash
+
+fork_only = pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "cache.bin")
+
+
+def _slot_offset(cache : SharedRenderCache, key : str) -> int:
+    for offset in cache._offsets(_key_hash(key)):
+        if _SLOT.unpack_from(cache._map, offset)[1] == _key_hash(key):
+            return offset
+    raise KeyError(key)
+
+
+def test_put_and_get(path):
+    with SharedRenderCache(path, capacity=16, slot_size=64, ways=4) as cache:
+        assert cache.get("a") is None
+        assert cache.put("a", b"payload")
+        assert cache.get("a") == b"payload"
+        assert cache.put("a", b"replaced")
+        assert cache.get("a") == b"replaced"
+        assert not cache.put("big", b"x" * 65)
+        assert cache.put_blocks("blocks", [{"type" : "divider"}])
+        assert cache.get_blocks("blocks") == [{"type" : "divider"}]
+        assert cache.stats()["entries"] == 2
+
+
+def test_get_or_render(path):
+    calls = []
+    with SharedRenderCache(path, capacity=8) as cache:
+        render = lambda : calls.append(1) or [{"type" : "divider"}]
+        assert cache.get_or_render("k", render) == [{"type" : "divider"}]
+        assert cache.get_or_render("k", render) == [{"type" : "divider"}]
+    assert len(calls) == 1
+
+
+def test_thunks_and_models_are_rendered_before_caching(path):
+    with SharedRenderCache(path, capacity=8) as cache:
+        tree = lambda : [SectionBlock(text=lambda : TextObject(type="plain_text", text="x"))]
+        expected = [{"type" : "section", "text" : {"type" : "plain_text", "text" : "x", "emoji" : False}}]
+        assert cache.get_or_render("k", tree) == expected
+        assert cache.get_or_render("k", tree) == expected
+        cache.put_blocks("model", {"title" : TextObject(type="plain_text", text="x")})
+        assert cache.get_blocks("model") == {"title" : {"type" : "plain_text", "text" : "x", "emoji" : False}}
+        with pytest.raises(RuntimeError, match="not JSON serializable"):
+            cache.put_blocks("bad", {"value" : object()})
+        assert cache.get("bad") is None
+
+
+def test_eviction_drops_the_oldest_entry_of_a_set(path):
+    with SharedRenderCache(path, capacity=2, slot_size=16, ways=2) as cache:
+        cache.put("a", b"1")
+        cache.put("b", b"2")
+        cache.get("a")
+        cache.put("c", b"3")
+        assert cache.get("a") is None
+        assert cache.get("b") == b"2"
+        assert cache.get("c") == b"3"
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["writes"] == 3
+
+
+def test_clear(path):
+    with SharedRenderCache(path, capacity=8, ways=2) as cache:
+        for key in "abcdef":
+            cache.put(key, key.encode())
+        cache.clear()
+        assert all(cache.get(key) is None for key in "abcdef")
+        assert cache.stats()["entries"] == 0
+        cache.put("a", b"again")
+        assert cache.get("a") == b"again"
+
+
+def test_readers_miss_slots_being_written(path):
+    with SharedRenderCache(path, capacity=4, ways=4) as cache:
+        cache.put("a", b"payload")
+        offset = _slot_offset(cache, "a")
+        sequence = struct.unpack_from("<Q", cache._map, offset)[0]
+        assert sequence % 2 == 0
+        struct.pack_into("<Q", cache._map, offset, sequence + 1)
+        assert cache.get("a") is None
+        struct.pack_into("<Q", cache._map, offset, sequence + 2)
+        assert cache.get("a") == b"payload"
+
+
+def test_readers_miss_torn_payloads(path):
+    with SharedRenderCache(path, capacity=4, ways=4) as cache:
+        cache.put("a", b"payload")
+        start = _slot_offset(cache, "a") + _SLOT.size
+        cache._map[start:start + 1] = b"X"
+        assert cache.get("a") is None
+        assert cache.stats()["misses"] == 1
+
+
+def test_geometry_is_validated(path):
+    for capacity , ways in ((0, 8), (-1, 1), (4, 0)):
+        with pytest.raises(RuntimeError):
+            SharedRenderCache(path, capacity=capacity, ways=ways)
+    assert not os.path.exists(path)
+    with SharedRenderCache(path, capacity=3, ways=8) as cache:
+        assert (cache.capacity , cache.ways) == (3, 3)
+    with SharedRenderCache(path) as reopened:
+        assert reopened.capacity == 3
+    with open(path, "r+b") as fp:
+        fp.write(b"JUNK")
+    with pytest.raises(RuntimeError):
+        SharedRenderCache(path)
+
+
+def test_entries_are_shared_across_instances(path):
+    with SharedRenderCache(path, capacity=8) as writer , SharedRenderCache(path) as reader:
+        writer.put("a", b"shared")
+        assert reader.get("a") == b"shared"
+
+
+@fork_only
+def test_cross_process_writes(path):
+    cache = SharedRenderCache(path, capacity=64, ways=4)
+    inherited = cache._fd
+    pid = os.fork()
+    if pid == 0:
+        code = 1
+        try:
+            for i in range(20):
+                cache.put(f"child-{i}", str(i).encode())
+            try:
+                os.fstat(inherited)
+            except OSError:
+                code = 0 if cache._fd != inherited else 2
+            else:
+                code = 0 if cache._fd == inherited else 3
+        finally:
+            os._exit(code)
+    for i in range(20):
+        cache.put(f"parent-{i}", str(i).encode())
+    _ , status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    found = sum(cache.get(f"child-{i}") == str(i).encode() for i in range(20))
+    found += sum(cache.get(f"parent-{i}") == str(i).encode() for i in range(20))
+    assert found + cache.stats()["evictions"] >= 40
+    assert cache.stats()["writes"] == 40
+    cache.close()
+    cache.close()